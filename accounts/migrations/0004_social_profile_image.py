@@ -0,0 +1,50 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_deleteduserdata"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="profile_image_small",
+            field=models.ImageField(blank=True, upload_to="profiles/"),
+        ),
+        migrations.CreateModel(
+            name="SocialProfileImage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source_url", models.URLField(max_length=500)),
+                ("etag", models.CharField(blank=True, max_length=255)),
+                ("last_modified", models.CharField(blank=True, max_length=64)),
+                (
+                    "content_hash",
+                    models.CharField(blank=True, help_text="SHA-256", max_length=64),
+                ),
+                ("synced_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="social_profile_image",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -11,6 +11,8 @@ class User(AbstractUser):
     """
 
     profile_image = models.ImageField(upload_to="profiles/", null=True, blank=True)
+    # 작은 크기로 표시하는 목록/내비게이션용 프로필 이미지 (소셜 프로필 이미지 동기화 시 생성)
+    profile_image_small = models.ImageField(upload_to="profiles/", blank=True)
     phone_number = models.CharField(max_length=15, blank=True)
     birth_date = models.DateField(null=True, blank=True)
     gender = models.CharField(max_length=10, blank=True)
@@ -21,6 +23,33 @@ class User(AbstractUser):
     def __str__(self):
         return self.username
 
+    @property
+    def profile_image_small_url(self):
+        """작은 프로필 이미지 URL (없으면 원래 프로필 이미지 URL)"""
+        if self.profile_image_small:
+            return self.profile_image_small.url
+        return self.profile_image.url if self.profile_image else ""
+
+
+class SocialProfileImage(models.Model):
+    """소셜 계정 프로필 이미지 동기화 상태
+
+    마지막으로 받은 이미지의 ETag, Last-Modified, 내용 해시를 저장해
+    다음 동기화 때 조건부 요청을 보내고, 바뀌지 않은 이미지는 다시 저장하지 않습니다.
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, related_name="social_profile_image"
+    )
+    source_url = models.URLField(max_length=500)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, help_text="SHA-256")
+    synced_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.user.username} ({self.source_url})"
+
 
 class InstructorProfile(models.Model):
     """강사 프로필 모델
@@ -0,0 +1,155 @@
+from io import BytesIO
+import hashlib
+import logging
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageOps
+import requests
+
+logger = logging.getLogger("django")
+
+# 소셜 프로필 이미지 동기화 작업 이름
+SYNC_SOCIAL_PROFILE_IMAGE_JOB = "accounts.sync_social_profile_image"
+
+# 저장할 프로필 이미지 크기 (필드 이름 -> 정사각형 한 변 픽셀)
+# 템플릿에서 가장 크게 표시하는 크기(128px, w-32)와 작은 목록용 크기(32~40px)의 2배
+PROFILE_IMAGE_SIZES = {
+    "profile_image": 256,
+    "profile_image_small": 80,
+}
+# 이미지 다운로드 제한 시간(초): (연결, 읽기)
+FETCH_TIMEOUT = (3, 5)
+# 받을 수 있는 최대 이미지 크기
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+
+def social_profile_image_url(social_account):
+    """소셜 계정 제공자별 프로필 이미지 URL (없으면 None)"""
+    extra_data = social_account.extra_data or {}
+    if social_account.provider == "google":
+        return extra_data.get("picture")
+    if social_account.provider == "kakao":
+        return (extra_data.get("properties") or {}).get("profile_image")
+    return None
+
+
+def request_profile_image_sync(social_account):
+    """소셜 프로필 이미지 동기화 작업 등록 (커밋 후 등록, 사용자별로 하나만 대기)"""
+    from jobs.models import Job
+
+    Job.enqueue_on_commit(
+        SYNC_SOCIAL_PROFILE_IMAGE_JOB,
+        {"social_account_id": social_account.id},
+        dedupe_key=f"{SYNC_SOCIAL_PROFILE_IMAGE_JOB}:{social_account.user_id}",
+    )
+
+
+def resize_profile_image(content):
+    """이미지를 PROFILE_IMAGE_SIZES의 정사각형 JPEG들로 변환
+
+    반환 형식: {필드 이름: JPEG bytes}
+    이미지가 아니면 PIL.UnidentifiedImageError(OSError)를 냅니다.
+    """
+    with Image.open(BytesIO(content)) as image:
+        largest = max(PROFILE_IMAGE_SIZES.values())
+        # JPEG는 디코딩 단계에서 미리 줄여 메모리와 시간을 절약
+        image.draft("RGB", (largest * 2, largest * 2))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P"):
+            # 투명 배경은 흰색으로 채움
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        else:
+            image = image.convert("RGB")
+
+        resized = {}
+        for field, size in PROFILE_IMAGE_SIZES.items():
+            thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            output = BytesIO()
+            thumbnail.save(output, "JPEG", quality=85, optimize=True)
+            resized[field] = output.getvalue()
+        return resized
+
+
+def _fetch_image(url, state):
+    """조건부 요청으로 이미지를 받음 (바뀌지 않았으면 None)"""
+    headers = {}
+    if state.source_url == url:
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+    with requests.get(
+        url, headers=headers, timeout=FETCH_TIMEOUT, stream=True
+    ) as response:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        content = BytesIO()
+        for chunk in response.iter_content(64 * 1024):
+            content.write(chunk)
+            if content.tell() > MAX_IMAGE_BYTES:
+                raise ValueError(f"프로필 이미지가 너무 큽니다: {url}")
+
+        state.etag = response.headers.get("ETag", "")[:255]
+        state.last_modified = response.headers.get("Last-Modified", "")[:64]
+        return content.getvalue()
+
+
+def sync_social_profile_image(social_account):
+    """소셜 계정의 프로필 이미지를 받아 크기별로 저장
+
+    이전에 받은 이미지와 같으면(304 응답 또는 같은 내용 해시) 파일을 다시 쓰지 않습니다.
+    반환: "updated", "not_modified", "unchanged", "no_image" 중 하나
+    """
+    from .models import SocialProfileImage
+
+    url = social_profile_image_url(social_account)
+    if not url:
+        return "no_image"
+
+    user = social_account.user
+    state, _ = SocialProfileImage.objects.get_or_create(
+        user=user, defaults={"source_url": url}
+    )
+    if not user.profile_image:
+        # 저장된 이미지가 없으면(삭제 등) 조건 없이 다시 받음
+        state.etag = state.last_modified = state.content_hash = ""
+
+    content = _fetch_image(url, state)
+    state.source_url = url
+    state.synced_at = timezone.now()
+    if content is None:
+        state.save()
+        return "not_modified"
+
+    content_hash = hashlib.sha256(content).hexdigest()
+    if content_hash == state.content_hash:
+        state.save()
+        return "unchanged"
+
+    images = resize_profile_image(content)
+    previous = [getattr(user, field).name for field in PROFILE_IMAGE_SIZES]
+    for field, data in images.items():
+        suffix = "" if field == "profile_image" else "_small"
+        getattr(user, field).save(
+            f"profile_{social_account.provider}_{user.id}{suffix}.jpg",
+            ContentFile(data),
+            save=False,
+        )
+    user.save(update_fields=list(PROFILE_IMAGE_SIZES))
+
+    # 새 파일을 저장한 뒤 이전 파일 삭제
+    for field, name in zip(PROFILE_IMAGE_SIZES, previous):
+        if name and name != getattr(user, field).name:
+            getattr(user, field).storage.delete(name)
+
+    state.content_hash = content_hash
+    state.save()
+    logger.info(f"프로필 이미지 업데이트 완료: {user.username}")
+    return "updated"
@@ -0,0 +1,19 @@
+from allauth.socialaccount.models import SocialAccount
+
+from jobs.registry import register
+from .profile_images import SYNC_SOCIAL_PROFILE_IMAGE_JOB, sync_social_profile_image
+
+
+@register(SYNC_SOCIAL_PROFILE_IMAGE_JOB)
+def sync_social_profile_image_job(payload):
+    """소셜 계정 프로필 이미지 동기화 작업"""
+    social_account = (
+        SocialAccount.objects.select_related("user")
+        .filter(id=payload["social_account_id"])
+        .first()
+    )
+    if social_account is None:
+        # 작업 등록 후 소셜 계정 연결이 해제된 경우
+        return
+
+    sync_social_profile_image(social_account)
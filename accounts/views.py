@@ -8,7 +8,7 @@ from django.shortcuts import render, redirect
 from django.utils import timezone
 import logging
 
-from payments.models import Payment
+from payments.models import Order, OrderItem
 from .forms import LoginForm, SignupForm, ProfileEditForm, CustomPasswordChangeForm
 from .models import User, DeletedUserData
 
@@ -96,20 +96,24 @@ class ProfileView(LoginRequiredMixin, TemplateView):
         # 사용자의 실제 결제 내역 가져오기
         purchases = []
 
-        # 완료된 결제 내역에서 과정 정보 가져오기
-        payments = (
-            Payment.objects.filter(user=self.request.user, payment_status="completed")
-            .select_related("course")
-            .order_by("-created_at")
+        # 결제 완료된(환불되지 않은) 주문 항목에서 과정 정보 가져오기
+        items = (
+            OrderItem.objects.filter(
+                order__user=self.request.user,
+                order__status__in=Order.PAID_STATUSES,
+                refunded_at__isnull=True,
+            )
+            .select_related("order", "course")
+            .order_by("-order__created_at")
         )
 
-        for payment in payments:
+        for item in items:
             purchases.append(
                 {
-                    "course": payment.course,
-                    "purchase_date": payment.created_at,
-                    "price": payment.amount,
-                    "status": payment.get_payment_status_display(),
+                    "course": item.course,
+                    "purchase_date": item.order.created_at,
+                    "price": item.amount,
+                    "status": item.status_display,
                 }
             )
 
@@ -134,6 +138,12 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
         return self.request.user
 
     def form_valid(self, form):
+        # 프로필 이미지를 직접 바꾸면 이전 이미지로 만든 작은 이미지는 사용하지 않음
+        user = form.instance
+        if "profile_image" in form.changed_data and user.profile_image_small:
+            default_storage.delete(user.profile_image_small.name)
+            user.profile_image_small = ""
+
         response = super().form_valid(form)
         logger.info(f"User {self.request.user.username} updated own profile")
         messages.success(self.request, "프로필이 성공적으로 업데이트되었습니다.")
@@ -179,6 +189,8 @@ class DeleteAccountView(LoginRequiredMixin, View):
         if user.profile_image:
             default_storage.delete(user.profile_image.name)
             logger.info(f"Profile image deleted for user: {username}")
+        if user.profile_image_small:
+            default_storage.delete(user.profile_image_small.name)
 
         # 소셜 계정 연결 확인 및 삭제
         social_accounts = request.user.socialaccount_set.all()
@@ -195,14 +207,12 @@ class DeleteAccountView(LoginRequiredMixin, View):
             email=f"deleted_{user_id}@example.com",
         )
 
-        # 사용자의 결제 내역 익명화
-        from payments.models import Payment
-
-        Payment.objects.filter(user=user).update(
+        # 사용자의 주문 내역 익명화
+        Order.objects.filter(user=user).update(
             is_anonymized=True, anonymized_user_id=user_id
         )
 
-        # 사용자 계정 삭제 - 관련 결제 내역은 foreign key 제약 해제 후 보존됨
+        # 사용자 계정 삭제 - 관련 주문 내역은 foreign key 제약 해제 후 보존됨
         logger.warning(f"User account deleted: {username}")
         user.delete()
 
@@ -0,0 +1,331 @@
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Count, Min
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from learning.models import Enrollment, LectureProgress
+
+# 출석부 화면에 한 번에 표시하는 기간 (2주)
+ATTENDANCE_WINDOW_DAYS = 14
+# 기간 선택 옵션 수 (2주 단위, 약 6개월)
+PERIOD_OPTION_COUNT = 13
+
+# PDF 표 분할 기준 (한 표에 들어가는 수강생 수, 날짜 열 최소 너비)
+PDF_ROWS_PER_TABLE = 30
+PDF_MIN_DATE_COLUMN_WIDTH = 30
+
+
+def get_period_options(today):
+    """출석부 기간 선택 옵션 (이번 주 월요일부터 2주 단위로 과거 방향)"""
+    period_options = []
+    for i in range(PERIOD_OPTION_COUNT):
+        start_date = today - timedelta(days=(today.weekday() + 14 * i))
+        end_date = start_date + timedelta(days=ATTENDANCE_WINDOW_DAYS - 1)
+        period_options.append(
+            {
+                "value": f"{start_date.isoformat()},{end_date.isoformat()}",
+                "label": f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
+            }
+        )
+    return period_options
+
+
+def parse_period_start(value, today):
+    """'시작일,종료일' 형식의 기간에서 시작일 추출 (올바르지 않으면 이번 주 월요일)"""
+    try:
+        start_date_str, _ = value.split(",")
+        return date.fromisoformat(start_date_str)
+    except (ValueError, AttributeError):
+        return today - timedelta(days=today.weekday())
+
+
+def get_course_start_date(course, today):
+    """출석부 전체 기간의 시작일 (가장 오래된 수강 신청 또는 학습 활동 날짜)"""
+    oldest_enrollment = Enrollment.objects.filter(course=course).aggregate(
+        oldest=Min("enrolled_at")
+    )["oldest"]
+    oldest_activity = LectureProgress.objects.filter(
+        lecture__subject__course=course
+    ).aggregate(oldest=Min("created_at"))["oldest"]
+
+    candidates = [
+        timezone.localdate(value)
+        for value in (oldest_enrollment, oldest_activity)
+        if value is not None
+    ]
+    if not candidates:
+        # 데이터가 없는 경우, 기본적으로 3개월 전으로 설정
+        return today - timedelta(days=90)
+    return min(candidates)
+
+
+def build_attendance(course, start_date, end_date):
+    """과정의 수강생×날짜 출석(완료 강의 수) 표 생성
+
+    기간 내 완료 기록을 (수강 정보, 날짜)별로 한 번에 집계한 뒤
+    수강생 순서 × 날짜 순서의 2차원 배열에 채웁니다.
+    반환 형식: {"dates": [날짜...], "rows": [{"user", "enrollment", "counts"}...]}
+    """
+    dates = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    enrollments = list(
+        Enrollment.objects.filter(course=course)
+        .select_related("user")
+        .order_by("user__username")
+    )
+    rows = [
+        {"user": enrollment.user, "enrollment": enrollment, "counts": [0] * len(dates)}
+        for enrollment in enrollments
+    ]
+    if not dates or not rows:
+        return {"dates": dates, "rows": rows}
+
+    # 현재 시간대 기준 하루 단위 [시작일 0시, 종료일 다음날 0시)
+    window_start = timezone.make_aware(datetime.combine(start_date, time.min))
+    window_end = timezone.make_aware(
+        datetime.combine(end_date + timedelta(days=1), time.min)
+    )
+    daily_counts = (
+        LectureProgress.objects.filter(
+            enrollment__course=course,
+            lecture__subject__course=course,
+            completed_at__gte=window_start,
+            completed_at__lt=window_end,
+        )
+        .annotate(day=TruncDate("completed_at"))
+        .values("enrollment_id", "day")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    row_index = {enrollment.id: index for index, enrollment in enumerate(enrollments)}
+    for entry in daily_counts:
+        index = row_index.get(entry["enrollment_id"])
+        day_offset = (entry["day"] - start_date).days
+        if index is not None and 0 <= day_offset < len(dates):
+            rows[index]["counts"][day_offset] = entry["count"]
+
+    return {"dates": dates, "rows": rows}
+
+
+def iter_attendance_csv_rows(attendance):
+    """CSV 내보내기용 행 (헤더 포함)"""
+    yield [
+        "사용자 ID",
+        "이름",
+        "이메일",
+        *[day.isoformat() for day in attendance["dates"]],
+        "전체 진행률(%)",
+    ]
+    for row in attendance["rows"]:
+        user = row["user"]
+        yield [
+            user.username,
+            user.get_full_name() or "-",
+            user.email,
+            *row["counts"],
+            row["enrollment"].progress_percentage,
+        ]
+
+
+def attendance_to_dict(course, attendance):
+    """JSON 내보내기용 데이터"""
+    return {
+        "course": {"id": course.id, "title": course.title},
+        "dates": [day.isoformat() for day in attendance["dates"]],
+        "students": [
+            {
+                "username": row["user"].username,
+                "full_name": row["user"].get_full_name(),
+                "email": row["user"].email,
+                "status": row["enrollment"].status,
+                "progress_percentage": row["enrollment"].progress_percentage,
+                "counts": row["counts"],
+            }
+            for row in attendance["rows"]
+        ],
+    }
+
+
+def _get_pdf_font_name():
+    """한글 폰트 등록 (폰트 파일이 없으면 기본 폰트 사용)"""
+    font_path = Path(settings.BASE_DIR) / "static" / "fonts" / "NanumGothic-Regular.ttf"
+    if font_path.exists():
+        pdfmetrics.registerFont(TTFont("NanumGothic", str(font_path)))
+        return "NanumGothic"
+    # 파일이 없으면 기본 폰트 사용 (한글이 깨질 수 있음)
+    return "Helvetica"
+
+
+def _chunks(items, size):
+    """목록을 size개씩 나눈 조각 목록 (빈 목록이면 빈 조각 하나)"""
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    return chunks or [[]]
+
+
+def build_attendance_pdf(buffer, course, attendance, display_start_date):
+    """출석부 PDF 생성
+
+    전체 기간을 하나의 거대한 표로 만들지 않고,
+    페이지 너비에 맞는 날짜 구간 × PDF_ROWS_PER_TABLE명 단위의 작은 표로 나누어 배치합니다.
+    현재 화면에 표시된 기간(display_start_date부터 2주)은 헤더를 강조 표시합니다.
+    """
+    dates = attendance["dates"]
+    rows = attendance["rows"]
+    font_name = _get_pdf_font_name()
+
+    # 날짜 수가 30일 이상일 경우 가로 길이를 1.5배로 확장한 페이지 사용
+    if len(dates) > 30:
+        pagesize = (landscape(A4)[0] * 1.5, landscape(A4)[1])
+    else:
+        pagesize = landscape(A4)
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=pagesize,
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=30,
+        bottomMargin=30,
+    )
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "Title",
+        parent=styles["Heading1"],
+        fontName=font_name,
+        alignment=TA_CENTER,
+        fontSize=16,
+        spaceAfter=12,
+    )
+    subtitle_style = ParagraphStyle(
+        "Subtitle",
+        parent=styles["Normal"],
+        fontName=font_name,
+        alignment=TA_CENTER,
+        fontSize=12,
+        spaceAfter=12,
+    )
+    section_style = ParagraphStyle(
+        "Section",
+        parent=styles["Normal"],
+        fontName=font_name,
+        fontSize=10,
+        spaceBefore=6,
+        spaceAfter=6,
+    )
+
+    # 컬럼 너비 (사용자 ID, 이름, 날짜..., 진행률)
+    username_width = 80
+    fullname_width = 80
+    progress_width = 60
+    available_width = doc.width - (username_width + fullname_width + progress_width)
+
+    # 한 표에 들어갈 날짜 수 (최소 너비 보장)
+    days_per_table = max(
+        1, min(len(dates), int(available_width // PDF_MIN_DATE_COLUMN_WIDTH))
+    )
+    display_end_date = display_start_date + timedelta(days=ATTENDANCE_WINDOW_DAYS - 1)
+
+    base_style = [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightblue),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, -1), font_name),  # 한글 폰트 적용
+        ("FONTSIZE", (0, 0), (-1, 0), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("ALIGN", (2, 1), (-2, -1), "CENTER"),  # 날짜 칼럼은 가운데 정렬
+        ("ALIGN", (-1, 1), (-1, -1), "RIGHT"),  # 진행률 칼럼은 오른쪽 정렬
+        ("FONTSIZE", (2, 0), (-2, 0), 7),  # 날짜 헤더 칼럼은 더 작은 글씨로
+        ("FONTSIZE", (2, 1), (-2, -1), 8),
+        ("WORDWRAP", (0, 0), (-1, -1), True),  # 텍스트 자동 줄바꿈 활성화
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ]
+
+    elements = [
+        Paragraph(f"{course.title} - 전체 수강생 출석부", title_style),
+        Paragraph(
+            (
+                f"기간: {dates[0].strftime('%Y-%m-%d')} ~ {dates[-1].strftime('%Y-%m-%d')} (총 {len(dates)}일)"
+                if dates
+                else "기간: -"
+            ),
+            subtitle_style,
+        ),
+        Spacer(1, 0.2 * inch),
+    ]
+
+    for block_index, day_block in enumerate(_chunks(dates, days_per_table)):
+        day_start = block_index * days_per_table
+        date_width = available_width / len(day_block)
+        col_widths = [username_width, fullname_width]
+        col_widths.extend([date_width] * len(day_block))
+        col_widths.append(progress_width)
+
+        header = [
+            "사용자 ID",
+            "이름",
+            *[day.strftime("%y/%m/%d") for day in day_block],
+            "전체 진행률(%)",
+        ]
+
+        # 현재 화면에 표시된 기간 하이라이트 (이 날짜 구간에 포함된 열만)
+        highlight_columns = [
+            index + 2
+            for index, day in enumerate(day_block)
+            if display_start_date <= day <= display_end_date
+        ]
+
+        if len(dates) > days_per_table:
+            elements.append(
+                Paragraph(
+                    f"{day_block[0].strftime('%Y-%m-%d')} ~ {day_block[-1].strftime('%Y-%m-%d')}",
+                    section_style,
+                )
+            )
+
+        for row_block in _chunks(rows, PDF_ROWS_PER_TABLE):
+            data = [header]
+            for row in row_block:
+                user = row["user"]
+                data.append(
+                    [
+                        user.username,
+                        user.get_full_name() or "-",
+                        *row["counts"][day_start : day_start + len(day_block)],
+                        row["enrollment"].progress_percentage,
+                    ]
+                )
+
+            table_style = TableStyle(base_style)
+            if highlight_columns:
+                table_style.add(
+                    "BACKGROUND",
+                    (highlight_columns[0], 0),
+                    (highlight_columns[-1], 0),
+                    colors.lightgreen,
+                )
+
+            table = Table(data, colWidths=col_widths, repeatRows=1)
+            table.setStyle(table_style)
+            elements.append(table)
+            elements.append(Spacer(1, 0.15 * inch))
+
+    doc.build(elements)
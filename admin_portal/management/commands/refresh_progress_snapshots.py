@@ -0,0 +1,16 @@
+from django.core.management import BaseCommand
+
+from admin_portal.models import CourseProgressSnapshot
+
+
+class Command(BaseCommand):
+    help = "과정 진행 상황 개요 페이지에서 사용할 과정별 진행 현황 스냅샷을 갱신합니다. (cron 등으로 주기 실행)"
+
+    def handle(self, *args, **options):
+        snapshots = CourseProgressSnapshot.refresh()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"과정 {len(snapshots)}개의 진행 현황 스냅샷을 갱신했습니다."
+            )
+        )
@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.utils import timezone
+
+from admin_portal.models import DailyStatistics
+
+
+class Command(BaseCommand):
+    help = "관리자 대시보드에서 사용할 일별 통계를 집계합니다. (cron 등으로 주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="오늘을 포함하여 최근 며칠 동안 누락되었거나 오래된 통계를 다시 집계할지 지정 (기본 7일)",
+        )
+        parser.add_argument(
+            "--backfill",
+            nargs=2,
+            metavar=("FROM", "TO"),
+            help="지정한 기간(YYYY-MM-DD YYYY-MM-DD)의 통계를 모두 다시 집계",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 저장할 날짜 수 (기본 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["backfill"]:
+            try:
+                start_date, end_date = (
+                    date.fromisoformat(value) for value in options["backfill"]
+                )
+            except ValueError:
+                raise CommandError("날짜는 YYYY-MM-DD 형식으로 입력해주세요.")
+            if start_date > end_date:
+                raise CommandError("시작일이 종료일보다 늦습니다.")
+
+            rows = DailyStatistics.rollup(start_date, end_date, batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{start_date} ~ {end_date} 기간의 일별 통계 {len(rows)}일치를 다시 집계했습니다."
+                )
+            )
+            return
+
+        if options["days"] <= 0:
+            raise CommandError("--days는 1 이상이어야 합니다.")
+
+        today = timezone.localdate()
+        stale_dates = DailyStatistics.get_stale_dates(
+            today - timedelta(days=options["days"] - 1), today
+        )
+        # 누락/오래된 날짜가 포함된 구간을 한 번에 집계 (사이의 최신 날짜도 함께 갱신됨)
+        rows = DailyStatistics.rollup(
+            stale_dates[0], stale_dates[-1], batch_size=batch_size
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"누락되었거나 오래된 {len(stale_dates)}일을 포함하여 일별 통계 {len(rows)}일치를 집계했습니다."
+            )
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_portal", "0001_initial"),
+        ("courses", "0007_course_rating_1_count_course_rating_2_count_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseProgressSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "student_count",
+                    models.PositiveIntegerField(default=0, help_text="수강생 수"),
+                ),
+                ("avg_progress", models.FloatField(default=0, help_text="평균 진행률")),
+                (
+                    "certificate_count",
+                    models.PositiveIntegerField(default=0, help_text="수료증 발급 수"),
+                ),
+                (
+                    "weekly_certificates",
+                    models.PositiveIntegerField(
+                        default=0, help_text="최근 7일간 수료증 발급 수"
+                    ),
+                ),
+                ("refreshed_at", models.DateTimeField(help_text="집계 시각")),
+                (
+                    "course",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress_snapshot",
+                        to="courses.course",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "과정 진행 현황 스냅샷",
+                "verbose_name_plural": "과정 진행 현황 스냅샷 목록",
+            },
+        ),
+    ]
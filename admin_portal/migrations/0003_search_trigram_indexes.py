@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# 관리자 목록 검색(admin_portal.search)에서 부분 문자열 검색하는 컬럼 (테이블, 컬럼)
+TRIGRAM_INDEXES = [
+    ("accounts_user", "username"),
+    ("accounts_user", "email"),
+    ("courses_course", "title"),
+    ("courses_lecture", "title"),
+    ("courses_qnaquestion", "content"),
+    ("payments_payment", "merchant_uid"),
+]
+
+
+def trigram_index_name(table, column):
+    return f"{table}_{column}_trgm"
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # trigram 인덱스는 PostgreSQL 전용 (SQLite 개발 환경에서는 일반 LIKE 검색 사용)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in TRIGRAM_INDEXES:
+        # icontains 조회식 UPPER(컬럼::text) LIKE UPPER(...)와 같은 식으로 인덱스 생성
+        # (대용량 테이블에서도 쓰기를 막지 않도록 CONCURRENTLY로 생성)
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {trigram_index_name(table, column)} "
+            f"ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {trigram_index_name(table, column)}"
+        )
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0003_deleteduserdata"),
+        ("admin_portal", "0002_courseprogresssnapshot"),
+        ("courses", "0007_course_rating_1_count_course_rating_2_count_and_more"),
+        ("payments", "0005_payment_anonymized_user_id_payment_is_anonymized_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
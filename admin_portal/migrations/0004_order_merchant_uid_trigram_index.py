@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# 결제 내역 검색이 주문 테이블의 주문번호를 부분 문자열 검색하도록 바뀜
+# (payments_payment의 인덱스는 테이블과 함께 삭제됨)
+TABLE, COLUMN = "payments_order", "merchant_uid"
+INDEX_NAME = f"{TABLE}_{COLUMN}_trgm"
+
+
+def create_trigram_index(apps, schema_editor):
+    # trigram 인덱스는 PostgreSQL 전용 (SQLite 개발 환경에서는 일반 LIKE 검색 사용)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+        f"ON {TABLE} USING gin ((UPPER({COLUMN}::text)) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+    atomic = False
+
+    dependencies = [
+        ("admin_portal", "0003_search_trigram_indexes"),
+        ("payments", "0006_order_orderitem"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
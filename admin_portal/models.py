@@ -1,16 +1,14 @@
-from django.db import models
-from django.db.models import Sum
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, Max
 from django.utils import timezone
-from accounts.models import User
-from learning.models import (
-    Enrollment,
-    LectureProgress,
-    Certificate,
-)
+from courses.models import Course
+from datetime import timedelta
 import decimal
 import logging
 
-from payments.models import Payment
+from .progress import build_course_progress_rows
+from .statistics import STATISTIC_FIELDS, compute_daily_statistics, day_start
 
 logger = logging.getLogger("django")
 
@@ -48,55 +46,158 @@ class DailyStatistics(models.Model):
         ordering = ["-date"]
 
     @classmethod
-    def update_daily_statistics(cls):
-        """오늘 날짜의 통계 업데이트"""
-        today = timezone.now().date()
-        stats, created = cls.objects.get_or_create(date=today)
+    def rollup(cls, start_date, end_date, batch_size=500):
+        """기간 내 일별 통계를 한 번에 다시 집계하여 저장
+
+        항목별 날짜 그룹 집계(항목 수만큼의 쿼리)로 전체 기간을 계산한 뒤
+        날짜 기준 upsert로 저장합니다. 1년치도 한 번에 처리할 수 있습니다.
+        활성 사용자 수는 마지막 로그인 시각으로만 계산할 수 있어 지난 날짜를 다시 계산하면
+        값이 줄어들 수 있으므로, 이미 저장된 지난 날짜의 값은 유지합니다.
+        """
+        today = timezone.localdate()
+        computed = compute_daily_statistics(start_date, end_date)
+        saved_active_users = dict(
+            cls.objects.filter(
+                date__gte=start_date, date__lte=end_date, date__lt=today
+            ).values_list("date", "active_users")
+        )
 
-        if created:
-            logger.info(f"Created new daily statistics record for {today}")
-        else:
-            logger.info(f"Updating existing daily statistics for {today}")
+        rows = []
+        for day, values in computed.items():
+            if day in saved_active_users:
+                values["active_users"] = saved_active_users[day]
+            rows.append(cls(date=day, **values))
+
+        cls.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["date"],
+            update_fields=[*STATISTIC_FIELDS, "updated_at"],
+        )
 
-        # 신규 가입자 수
-        today_start = timezone.make_aware(
-            timezone.datetime.combine(today, timezone.datetime.min.time())
+        logger.info(
+            f"Rolled up daily statistics for {len(rows)} days ({start_date} ~ {end_date})"
         )
-        today_end = timezone.make_aware(
-            timezone.datetime.combine(today, timezone.datetime.max.time())
+        return rows
+
+    @classmethod
+    def get_stale_dates(cls, start_date, end_date):
+        """기간 내 통계가 없거나 해당 날짜가 끝나기 전에 집계된 날짜 목록 (오늘 포함)"""
+        updated_at_by_date = dict(
+            cls.objects.filter(date__gte=start_date, date__lte=end_date).values_list(
+                "date", "updated_at"
+            )
         )
-        stats.new_users = User.objects.filter(
-            date_joined__range=(today_start, today_end)
-        ).count()
-
-        # 활성 사용자 수 (오늘 로그인)
-        stats.active_users = User.objects.filter(
-            last_login__range=(today_start, today_end)
-        ).count()
-
-        # 신규 수강 신청 수
-        stats.new_enrollments = Enrollment.objects.filter(
-            enrolled_at__range=(today_start, today_end)
-        ).count()
-
-        # 완료된 강의 수
-        stats.completed_lectures = LectureProgress.objects.filter(
-            completed_at__range=(today_start, today_end), is_completed=True
-        ).count()
-
-        # 발급된 수료증 수
-        stats.certificates_issued = Certificate.objects.filter(
-            issued_at__range=(today_start, today_end)
-        ).count()
-
-        # 일일 매출액 (익명화된 결제도 포함)
-        daily_sales = (
-            Payment.objects.filter(
-                created_at__range=(today_start, today_end), payment_status="completed"
-            ).aggregate(Sum("amount"))["amount__sum"]
-            or 0
+
+        stale_dates = []
+        day = start_date
+        while day <= end_date:
+            updated_at = updated_at_by_date.get(day)
+            if updated_at is None or updated_at < day_start(day + timedelta(days=1)):
+                stale_dates.append(day)
+            day += timedelta(days=1)
+        return stale_dates
+
+    @classmethod
+    def increment_today(cls, field, amount=1):
+        """오늘 통계의 항목 값을 증가 (오늘 통계가 없으면 전체 집계로 생성)"""
+        updated = cls.objects.filter(date=timezone.localdate()).update(
+            **{field: F(field) + amount}, updated_at=timezone.now()
+        )
+        if not updated:
+            cls.update_daily_statistics()
+
+    @classmethod
+    def refresh_today(cls, *fields):
+        """오늘 통계의 일부 항목만 다시 집계 (오늘 통계가 없으면 전체 집계로 생성)"""
+        today = timezone.localdate()
+        values = compute_daily_statistics(today, today, fields)[today]
+        updated = cls.objects.filter(date=today).update(
+            **values, updated_at=timezone.now()
         )
-        stats.revenue = daily_sales
+        if not updated:
+            cls.update_daily_statistics()
+
+    @classmethod
+    def update_daily_statistics(cls):
+        """오늘 날짜의 통계 업데이트"""
+        today = timezone.localdate()
+        cls.rollup(today, today)
+        return cls.objects.get(date=today)
+
+
+class CourseProgressSnapshot(models.Model):
+    """과정별 진행 현황 스냅샷
+
+    과정 진행 상황 개요 페이지에서 매번 집계하지 않도록
+    refresh_progress_snapshots 명령으로 주기적으로 미리 계산해 둔 값입니다.
+    """
+
+    course = models.OneToOneField(
+        Course, on_delete=models.CASCADE, related_name="progress_snapshot"
+    )
+    student_count = models.PositiveIntegerField(default=0, help_text="수강생 수")
+    avg_progress = models.FloatField(default=0, help_text="평균 진행률")
+    certificate_count = models.PositiveIntegerField(
+        default=0, help_text="수료증 발급 수"
+    )
+    weekly_certificates = models.PositiveIntegerField(
+        default=0, help_text="최근 7일간 수료증 발급 수"
+    )
+    refreshed_at = models.DateTimeField(help_text="집계 시각")
 
-        stats.save()
-        return stats
+    class Meta:
+        verbose_name = "과정 진행 현황 스냅샷"
+        verbose_name_plural = "과정 진행 현황 스냅샷 목록"
+
+    def __str__(self):
+        return f"{self.course.title} 진행 현황 ({self.refreshed_at})"
+
+    @classmethod
+    def refresh(cls):
+        """전체 과정의 진행 현황을 다시 집계하여 스냅샷 교체"""
+        refreshed_at = timezone.now()
+        snapshots = [
+            cls(
+                course=row["course"],
+                student_count=row["student_count"],
+                avg_progress=row["avg_progress"],
+                certificate_count=row["certificate_count"],
+                weekly_certificates=row["weekly_certificates"],
+                refreshed_at=refreshed_at,
+            )
+            for row in build_course_progress_rows()
+        ]
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(snapshots)
+
+        logger.info(f"Refreshed {len(snapshots)} course progress snapshots")
+        return snapshots
+
+    @classmethod
+    def get_fresh_rows(cls):
+        """유효 기간 내의 스냅샷이 있으면 개요 페이지용 행 목록 반환
+
+        스냅샷이 없거나 COURSE_PROGRESS_SNAPSHOT_MAX_AGE(초)보다 오래되었으면
+        None을 반환하며, 이 경우 화면에서 직접 집계합니다.
+        """
+        latest = cls.objects.aggregate(latest=Max("refreshed_at"))["latest"]
+        max_age = getattr(settings, "COURSE_PROGRESS_SNAPSHOT_MAX_AGE", 60 * 60)
+        if latest is None or timezone.now() - latest > timedelta(seconds=max_age):
+            return None
+
+        snapshots = cls.objects.select_related("course").order_by("course__title")
+        return [
+            {
+                "course": snapshot.course,
+                "avg_progress": snapshot.avg_progress,
+                "student_count": snapshot.student_count,
+                "certificate_count": snapshot.certificate_count,
+                "weekly_certificates": snapshot.weekly_certificates,
+                "refreshed_at": snapshot.refreshed_at,
+            }
+            for snapshot in snapshots
+        ]
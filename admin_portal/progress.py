@@ -0,0 +1,239 @@
+from datetime import timedelta
+
+from django.db.models import Avg, Count, Prefetch, Q
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+
+from accounts.models import User
+from courses.models import Course, Subject, Lecture
+from learning.models import Enrollment, Certificate, LectureProgress, ProjectSubmission
+
+COMPLETED_STATUSES = ["completed", "certified"]
+
+# 과정 상세 진행 현황의 수강생 정렬 기준 (키: (표시 이름, 정렬 필드))
+STUDENT_SORT_OPTIONS = {
+    "name": ("이름순", ("user__username", "id")),
+    "-progress": ("진행률 높은순", ("-progress_percentage", "user__username", "id")),
+    "progress": ("진행률 낮은순", ("progress_percentage", "user__username", "id")),
+    "-last_activity": ("최근 학습순", ("-last_activity_at", "id")),
+    "-enrolled": ("최근 등록순", ("-enrolled_at", "-id")),
+}
+DEFAULT_STUDENT_SORT = "name"
+
+
+def build_course_progress_rows():
+    """과정별 진행 현황 집계
+
+    수강 정보와 수료증을 각각 과정별로 한 번씩 집계한 뒤 과정 목록과 합칩니다.
+    수강생이 있는 과정만 과정명 순서로 반환합니다.
+    """
+    week_ago = timezone.now() - timedelta(days=7)
+
+    enrollment_stats = {
+        row["course_id"]: row
+        for row in Enrollment.objects.values("course_id")
+        .annotate(
+            student_count=Count("id"),
+            avg_progress=Avg("progress_percentage"),
+        )
+        .order_by()
+    }
+    certificate_stats = {
+        row["enrollment__course_id"]: row
+        for row in Certificate.objects.values("enrollment__course_id")
+        .annotate(
+            certificate_count=Count("id"),
+            weekly_certificates=Count("id", filter=Q(issued_at__gte=week_ago)),
+        )
+        .order_by()
+    }
+
+    courses_progress = []
+    for course in Course.objects.filter(id__in=enrollment_stats).order_by("title"):
+        enrollment_row = enrollment_stats[course.id]
+        certificate_row = certificate_stats.get(course.id, {})
+        courses_progress.append(
+            {
+                "course": course,
+                "avg_progress": round(enrollment_row["avg_progress"] or 0, 1),
+                "student_count": enrollment_row["student_count"],
+                "certificate_count": certificate_row.get("certificate_count", 0),
+                "weekly_certificates": certificate_row.get("weekly_certificates", 0),
+            }
+        )
+    return courses_progress
+
+
+def build_weekly_certificate_data(weeks=12):
+    """최근 주간 수료증 발급 횟수 (차트용)
+
+    발급 기록이 없는 주도 0으로 채워 {"weeks": [...], "counts": [...]} 형식으로 반환합니다.
+    """
+    since = timezone.now() - timedelta(weeks=weeks)
+    counts_by_week = {
+        row["week"].date(): row["count"]
+        for row in Certificate.objects.filter(issued_at__gte=since)
+        .annotate(week=TruncWeek("issued_at"))
+        .values("week")
+        .annotate(count=Count("id"))
+        .order_by()
+    }
+
+    # 조회 시작 주의 월요일부터 이번 주까지
+    week_start = timezone.localdate(since)
+    week_start -= timedelta(days=week_start.weekday())
+    today = timezone.localdate()
+
+    week_starts = []
+    while week_start <= today:
+        week_starts.append(week_start)
+        week_start += timedelta(weeks=1)
+
+    return {
+        "weeks": [week.strftime("%Y-%m-%d") for week in week_starts],
+        "counts": [counts_by_week.get(week, 0) for week in week_starts],
+    }
+
+
+def get_top_students(limit=10):
+    """평균 진행률 상위 수강생
+
+    사용자별 집계와 정렬/개수 제한을 DB에서 한 번에 처리하고,
+    상위 사용자 정보만 따로 가져옵니다.
+    """
+    rows = list(
+        Enrollment.objects.filter(user__is_admin=False)
+        .values("user_id")
+        .annotate(
+            avg_progress=Avg("progress_percentage"),
+            total_count=Count("id"),
+            completed_count=Count("id", filter=Q(status__in=COMPLETED_STATUSES)),
+        )
+        .order_by("-avg_progress", "user_id")[:limit]
+    )
+    users = User.objects.in_bulk([row["user_id"] for row in rows])
+
+    return [
+        {
+            "student": users[row["user_id"]],
+            "avg_progress": round(row["avg_progress"] or 0, 1),
+            "completed_count": row["completed_count"],
+            "total_count": row["total_count"],
+        }
+        for row in rows
+    ]
+
+
+def get_sorted_enrollments(course, sort):
+    """과정 수강생 목록을 정렬 기준에 맞게 반환 (알 수 없는 기준은 기본값 사용)"""
+    if sort not in STUDENT_SORT_OPTIONS:
+        sort = DEFAULT_STUDENT_SORT
+    _label, ordering = STUDENT_SORT_OPTIONS[sort]
+    enrollments = (
+        Enrollment.objects.filter(course=course)
+        .select_related("user")
+        .order_by(*ordering)
+    )
+    return enrollments, sort
+
+
+def build_subject_data(course):
+    """과정의 과목 구성 (과목별 강의 목록과 강의 수)"""
+    subjects = (
+        Subject.objects.filter(course=course)
+        .order_by("order_index")
+        .prefetch_related(
+            Prefetch(
+                "lectures",
+                queryset=Lecture.objects.order_by("order_index"),
+                to_attr="lecture_list",
+            )
+        )
+    )
+    return [
+        {
+            "subject": subject,
+            "lectures": subject.lecture_list,
+            "lecture_count": len(subject.lecture_list),
+        }
+        for subject in subjects
+    ]
+
+
+def build_progress_matrix(subject_data, enrollments):
+    """수강생×과목 진행 현황 행렬 생성
+
+    전달된 수강 정보(보통 한 페이지 분량)에 대해
+    과목별 완료 강의 수, 시험 과목별 최근 제출물, 수료증을 각각 한 번씩만 조회하여
+    수강생마다 과목 순서대로 진행 현황 셀을 채웁니다.
+    """
+    enrollments = list(enrollments)
+    enrollment_ids = [enrollment.id for enrollment in enrollments]
+    subject_ids = [info["subject"].id for info in subject_data]
+    exam_subject_ids = [
+        info["subject"].id
+        for info in subject_data
+        if info["subject"].subject_type in Subject.EXAM_TYPES
+    ]
+
+    # (수강 정보, 과목)별 완료 강의 수
+    completed_counts = {
+        (row["enrollment_id"], row["lecture__subject_id"]): row["count"]
+        for row in LectureProgress.objects.filter(
+            enrollment_id__in=enrollment_ids,
+            lecture__subject_id__in=subject_ids,
+            is_completed=True,
+        )
+        .values("enrollment_id", "lecture__subject_id")
+        .annotate(count=Count("id"))
+        .order_by()
+    }
+
+    # (수강 정보, 시험 과목)별 최근 제출물 (최신순 정렬 후 처음 나온 것만 사용)
+    latest_submissions = {}
+    if exam_subject_ids:
+        submissions = ProjectSubmission.objects.filter(
+            enrollment_id__in=enrollment_ids, subject_id__in=exam_subject_ids
+        ).order_by("-submitted_at", "-id")
+        for submission in submissions:
+            latest_submissions.setdefault(
+                (submission.enrollment_id, submission.subject_id), submission
+            )
+
+    # 수료증 (수료증 발급 상태인 수강 정보만)
+    certified_ids = [
+        enrollment.id for enrollment in enrollments if enrollment.status == "certified"
+    ]
+    certificates = {
+        certificate.enrollment_id: certificate
+        for certificate in Certificate.objects.filter(enrollment_id__in=certified_ids)
+    }
+
+    student_progress = []
+    for enrollment in enrollments:
+        subject_progress = []
+        for info in subject_data:
+            subject = info["subject"]
+            total = info["lecture_count"]
+            completed = completed_counts.get((enrollment.id, subject.id), 0)
+            subject_progress.append(
+                {
+                    "subject": subject,
+                    "completed": completed,
+                    "total": total,
+                    "percentage": round(completed / total * 100 if total else 0, 1),
+                    "project_submission": latest_submissions.get(
+                        (enrollment.id, subject.id)
+                    ),
+                }
+            )
+
+        student_progress.append(
+            {
+                "user": enrollment.user,
+                "enrollment": enrollment,
+                "subject_progress": subject_progress,
+                "certificate": certificates.get(enrollment.id),
+            }
+        )
+    return student_progress
@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from payments.models import Order
+from .statistics import day_start
+
+# 매출 통계는 짧게만 캐시 (결제 직후에도 곧 반영되도록)
+SALES_REPORT_CACHE_TIMEOUT = 60
+
+# 매출 추이 기간 선택 옵션 (일)
+SALES_PERIOD_OPTIONS = [7, 30, 90, 365]
+DEFAULT_SALES_PERIOD = 7
+
+# 결제 방법 선택지에 없는(또는 비어 있는) 결제는 "기타"로 묶음
+PAYMENT_METHOD_CODES = [code for code, _label in Order.PAYMENT_METHOD_CHOICES]
+
+
+def parse_sales_period(value):
+    """매출 추이 기간 파싱 (선택지에 없으면 기본값)"""
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_SALES_PERIOD
+    return days if days in SALES_PERIOD_OPTIONS else DEFAULT_SALES_PERIOD
+
+
+def sales_report_cache_key(start_date, end_date):
+    return f"admin_portal:sales_report:{start_date.isoformat()}:{end_date.isoformat()}"
+
+
+def _method_filter(code):
+    if code is None:
+        return Q(payment_method__isnull=True) | ~Q(
+            payment_method__in=PAYMENT_METHOD_CODES
+        )
+    return Q(payment_method=code)
+
+
+def build_sales_report(days=DEFAULT_SALES_PERIOD):
+    """매출 통계 생성 (결제 완료/부분 환불 주문 기준, 환불 금액 제외)
+
+    전체 건수/매출, 오늘 매출, 결제 방법별 건수/매출은 조건부 집계 쿼리 한 번으로,
+    최근 days일의 일별 매출은 날짜별 그룹 집계 쿼리 한 번으로 계산합니다.
+    날짜 조건은 [0시, 다음날 0시) 범위로 걸어 created_at 인덱스를 사용하며,
+    기간이 길어져도 쿼리 수는 늘어나지 않습니다.
+    """
+    today = timezone.localdate()
+    start_date = today - timedelta(days=days - 1)
+    today_start = day_start(today)
+    tomorrow_start = day_start(today + timedelta(days=1))
+
+    orders = Order.objects.filter(status__in=Order.PAID_STATUSES)
+
+    # 합계 및 결제 방법별 집계 (조건부 집계 한 번)
+    method_codes = [*PAYMENT_METHOD_CODES, None]
+    aggregates = {
+        "total_count": Count("id"),
+        "total_sales": Order.revenue(),
+        "today_sales": Order.revenue(
+            filter=Q(created_at__gte=today_start, created_at__lt=tomorrow_start),
+        ),
+    }
+    for index, code in enumerate(method_codes):
+        aggregates[f"method_{index}_count"] = Count("id", filter=_method_filter(code))
+        aggregates[f"method_{index}_sum"] = Order.revenue(filter=_method_filter(code))
+    totals = orders.aggregate(**aggregates)
+
+    payment_methods = [
+        {
+            "payment_method": code,
+            "count": totals[f"method_{index}_count"],
+            "sum": totals[f"method_{index}_sum"] or 0,
+        }
+        for index, code in enumerate(method_codes)
+        if totals[f"method_{index}_count"]
+    ]
+    payment_methods.sort(key=lambda method: method["sum"], reverse=True)
+
+    # 일별 매출 (날짜별 그룹 집계 한 번, 결제가 없는 날은 0)
+    sales_by_day = {
+        row["day"]: row["sum"]
+        for row in orders.filter(
+            created_at__gte=day_start(start_date), created_at__lt=tomorrow_start
+        )
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(sum=Order.revenue())
+        .order_by()
+    }
+    period_dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    date_format = "%m/%d" if days <= 31 else "%y/%m/%d"
+
+    return {
+        "total_count": totals["total_count"],
+        "total_sales": totals["total_sales"] or 0,
+        "today_sales": totals["today_sales"] or 0,
+        "daily_dates": [day.strftime(date_format) for day in period_dates],
+        "daily_sales": [sales_by_day.get(day) or 0 for day in period_dates],
+        "payment_methods": payment_methods,
+    }
+
+
+def get_sales_report(days=DEFAULT_SALES_PERIOD):
+    """캐시된 매출 통계 반환 (기간별로 SALES_REPORT_CACHE_TIMEOUT초 동안 캐시)"""
+    today = timezone.localdate()
+    key = sales_report_cache_key(today - timedelta(days=days - 1), today)
+    report = cache.get(key)
+    if report is None:
+        report = build_sales_report(days)
+        cache.set(key, report, SALES_REPORT_CACHE_TIMEOUT)
+    return report
@@ -0,0 +1,93 @@
+import re
+
+from django.db.models import Q
+
+from accounts.models import User
+from courses.models import Course, Lecture
+from payments.models import OrderItem
+
+# 주문번호/포트원 거래번호 형식 (앞부분만 입력해도 해당 컬럼의 접두사 검색만 수행)
+MERCHANT_UID_PATTERN = re.compile(r"^ORD-", re.IGNORECASE)
+IMP_UID_PATTERN = re.compile(r"^imp_", re.IGNORECASE)
+
+# 먼저 찾은 id를 목록으로 넘길 최대 개수 (넘으면 서브쿼리로 전달)
+MATCHING_IDS_LIMIT = 1000
+
+
+def normalize_search_query(value):
+    """검색어 앞뒤 공백 제거 (없으면 빈 문자열)"""
+    return (value or "").strip()
+
+
+def text_match(fields, term):
+    """여러 컬럼 중 하나라도 검색어를 포함하는 조건
+
+    PostgreSQL에서는 0003_search_trigram_indexes 마이그레이션의 trigram 인덱스
+    (UPPER(컬럼) gin_trgm_ops)를 사용하고, SQLite 등에서는 일반 LIKE 검색으로 동작합니다.
+    """
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__icontains": term})
+    return condition
+
+
+def matching_ids(model, fields, term):
+    """검색어와 일치하는 (연결 대상) 모델의 id 목록
+
+    사용자/과정/강의처럼 작은 테이블을 먼저 검색해 id 목록으로 만들어 두면,
+    큰 테이블에서는 조인 없이 외래 키 인덱스로 조회할 수 있습니다.
+    일치하는 행이 너무 많으면 목록 대신 서브쿼리를 반환합니다.
+    """
+    queryset = (
+        model.objects.filter(text_match(fields, term))
+        .order_by()
+        .values_list("id", flat=True)
+    )
+    ids = list(queryset[: MATCHING_IDS_LIMIT + 1])
+    return queryset if len(ids) > MATCHING_IDS_LIMIT else ids
+
+
+def search_orders(queryset, term):
+    """주문 검색 (사용자명, 이메일, 과정명, 주문번호, 포트원 거래번호)
+
+    주문번호(ORD-...)나 거래번호(imp_...) 형식이면 해당 컬럼의 접두사 검색만 수행합니다.
+    """
+    term = normalize_search_query(term)
+    if not term:
+        return queryset
+
+    if MERCHANT_UID_PATTERN.match(term):
+        return queryset.filter(merchant_uid__startswith=term.upper())
+    if IMP_UID_PATTERN.match(term):
+        return queryset.filter(imp_uid__startswith=term.lower())
+
+    user_ids = matching_ids(User, ["username", "email"], term)
+    course_ids = matching_ids(Course, ["title"], term)
+    # 과정명은 주문 항목 서브쿼리로 찾아 주문이 중복되지 않도록 함
+    order_ids = OrderItem.objects.filter(course_id__in=course_ids).values("order_id")
+    return queryset.filter(
+        Q(user_id__in=user_ids) | Q(id__in=order_ids) | Q(merchant_uid__icontains=term)
+    )
+
+
+def search_questions(queryset, term):
+    """Q&A 질문 검색 (질문 내용, 작성자명, 강의명)"""
+    term = normalize_search_query(term)
+    if not term:
+        return queryset
+
+    user_ids = matching_ids(User, ["username"], term)
+    lecture_ids = matching_ids(Lecture, ["title"], term)
+    return queryset.filter(
+        text_match(["content"], term)
+        | Q(user_id__in=user_ids)
+        | Q(lecture_id__in=lecture_ids)
+    )
+
+
+def search_courses(queryset, term):
+    """과정 검색 (과정명)"""
+    term = normalize_search_query(term)
+    if not term:
+        return queryset
+    return queryset.filter(text_match(["title"], term))
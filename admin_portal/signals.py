@@ -0,0 +1,92 @@
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+import logging
+
+from accounts.models import User
+from learning.models import Enrollment, LectureProgress, Certificate
+from learning.signals import certificates_issued, lecture_completed
+from payments.models import Order
+from payments.signals import checkout_completed
+from .models import DailyStatistics
+
+logger = logging.getLogger("django")
+
+
+def is_today(value):
+    """현재 시간대 기준 오늘 시각인지 여부"""
+    return value is not None and timezone.localdate(value) == timezone.localdate()
+
+
+def increment_today_on_commit(field, amount=1):
+    """커밋 후 오늘 통계 항목 증가"""
+    transaction.on_commit(lambda: DailyStatistics.increment_today(field, amount))
+
+
+@receiver(post_save, sender=User)
+def count_new_user(sender, instance, created, **kwargs):
+    """신규 가입 시 오늘 신규 가입자 수 증가"""
+    if created and is_today(instance.date_joined):
+        increment_today_on_commit("new_users")
+
+
+@receiver(user_logged_in)
+def refresh_active_users(sender, user, **kwargs):
+    """로그인 시 오늘 활성 사용자 수 재집계
+
+    같은 사용자가 여러 번 로그인할 수 있으므로 증가 대신 다시 집계합니다.
+    """
+    transaction.on_commit(lambda: DailyStatistics.refresh_today("active_users"))
+
+
+@receiver(post_save, sender=Enrollment)
+def count_new_enrollment(sender, instance, created, **kwargs):
+    """수강 신청 시 오늘 신규 수강 신청 수 증가"""
+    if created and is_today(instance.enrolled_at):
+        increment_today_on_commit("new_enrollments")
+
+
+@receiver(lecture_completed, sender=LectureProgress)
+def count_completed_lecture(sender, instance, **kwargs):
+    """강의 완료 시 오늘 완료된 강의 수 증가"""
+    if is_today(instance.completed_at):
+        increment_today_on_commit("completed_lectures")
+
+
+@receiver(post_save, sender=Certificate)
+def count_certificate(sender, instance, created, **kwargs):
+    """수료증 발급 시 오늘 발급된 수료증 수 증가"""
+    if created and is_today(instance.issued_at):
+        increment_today_on_commit("certificates_issued")
+
+
+@receiver(certificates_issued, sender=Certificate)
+def count_bulk_certificates(sender, certificates, **kwargs):
+    """수료증 일괄 발급 시 오늘 발급된 수료증 수 증가"""
+    count = sum(1 for certificate in certificates if is_today(certificate.issued_at))
+    if count:
+        increment_today_on_commit("certificates_issued", count)
+
+
+@receiver(post_save, sender=Order)
+def refresh_revenue(sender, instance, **kwargs):
+    """오늘 생성된 주문의 상태 변경 시 오늘 매출액 재집계
+
+    결제 완료 후 환불/취소될 수 있으므로 증가 대신 다시 집계합니다.
+    결제 대기 주문(결제 버튼을 눌러 결제를 시작할 때 생성)은 매출과 관계없으므로 건너뜁니다.
+    """
+    if instance.status != "pending" and is_today(instance.created_at):
+        transaction.on_commit(lambda: DailyStatistics.refresh_today("revenue"))
+
+
+@receiver(checkout_completed, sender=Order)
+def count_checkout_enrollments(sender, order, enrollments, **kwargs):
+    """장바구니 결제로 수강 등록 시 오늘 신규 수강 신청 수 증가
+
+    매출액은 주문 저장 시(refresh_revenue) 다시 집계됩니다.
+    """
+    count = sum(1 for enrollment in enrollments if is_today(enrollment.enrolled_at))
+    if count:
+        increment_today_on_commit("new_enrollments", count)
@@ -0,0 +1,73 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from accounts.models import User
+from learning.models import Enrollment, LectureProgress, Certificate
+from payments.models import Order
+
+# 일별 통계 항목별 집계 기준 (항목: (모델, 기준 시각 필드, 추가 조건, 집계식))
+STATISTIC_SOURCES = {
+    "new_users": (User, "date_joined", {}, Count("id")),
+    # 마지막 로그인 시각만 저장되므로 당일에 계산한 값만 정확함
+    "active_users": (User, "last_login", {}, Count("id")),
+    "new_enrollments": (Enrollment, "enrolled_at", {}, Count("id")),
+    "completed_lectures": (
+        LectureProgress,
+        "completed_at",
+        {"is_completed": True},
+        Count("id"),
+    ),
+    "certificates_issued": (Certificate, "issued_at", {}, Count("id")),
+    # 익명화된 주문도 포함, 부분 환불된 주문은 환불 금액 제외
+    "revenue": (
+        Order,
+        "created_at",
+        {"status__in": Order.PAID_STATUSES},
+        Order.revenue(),
+    ),
+}
+STATISTIC_FIELDS = list(STATISTIC_SOURCES)
+
+
+def day_start(day):
+    """현재 시간대 기준 해당 날짜의 0시"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def compute_daily_statistics(start_date, end_date, fields=None):
+    """기간 내 날짜별 통계 집계
+
+    항목마다 [시작일 0시, 종료일 다음날 0시) 범위를 날짜별로 묶어 한 번씩만 조회하므로,
+    기간 길이와 관계없이 쿼리 수는 항목 수와 같습니다.
+    반환 형식: {날짜: {항목: 값}} (기록이 없는 날짜/항목은 0)
+    """
+    fields = fields or STATISTIC_FIELDS
+    window_start = day_start(start_date)
+    window_end = day_start(end_date + timedelta(days=1))
+
+    days = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    results = {day: {field: 0 for field in fields} for day in days}
+
+    for field in fields:
+        model, time_field, extra_filter, aggregate = STATISTIC_SOURCES[field]
+        rows = (
+            model.objects.filter(
+                **{f"{time_field}__gte": window_start, f"{time_field}__lt": window_end},
+                **extra_filter,
+            )
+            .annotate(day=TruncDate(time_field))
+            .values("day")
+            .annotate(value=aggregate)
+            .order_by()
+        )
+        for row in rows:
+            if row["day"] in results:
+                results[row["day"]][field] = row["value"] or 0
+
+    return results
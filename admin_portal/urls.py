@@ -35,6 +35,11 @@ urlpatterns = [
         views.CourseProgressDetailView.as_view(),
         name="course_progress_detail",
     ),
+    path(
+        "courses/<int:course_id>/certificates/issue/",
+        views.IssueCourseCertificatesView.as_view(),
+        name="issue_course_certificates",
+    ),
     path(
         "courses/<int:course_id>/attendance/",
         views.CourseAttendanceView.as_view(),
@@ -45,6 +50,11 @@ urlpatterns = [
         views.CourseAttendancePDFView.as_view(),
         name="course_attendance_pdf",
     ),
+    path(
+        "courses/<int:course_id>/attendance/export/",
+        views.CourseAttendanceExportView.as_view(),
+        name="course_attendance_export",
+    ),
     # 과정 관리 관련
     path("courses/", views.CourseManagementView.as_view(), name="course_management"),
     path("courses/create/", views.CourseCreateView.as_view(), name="course_create"),
@@ -99,7 +109,7 @@ urlpatterns = [
     # 결제 관련
     path("payments/", views.PaymentManagementView.as_view(), name="payments"),
     path(
-        "payments/<int:payment_id>/",
+        "payments/<int:order_id>/",
         views.PaymentDetailAdminView.as_view(),
         name="payment_detail",
     ),
@@ -1,13 +1,10 @@
 from django.shortcuts import get_object_or_404, redirect
-from django.conf import settings
 from django.contrib import messages
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
-from django.db import transaction
-from django.db.models import Count, Avg, Q, Min, Sum
-from django.db.models.functions import TruncWeek
+from django.db.models import Count, Avg, Prefetch, Q
 from django.views import View
 from django.views.generic import (
     TemplateView,
@@ -18,25 +15,49 @@ from django.views.generic import (
     DeleteView,
 )
 from datetime import timedelta, date, datetime
+import csv
+import itertools
 import json
 import io
 import logging
-from pathlib import Path
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 
 from accounts.models import DeletedUserData, User, InstructorProfile
+from courses.missions import save_mission_questions
 from courses.models import Course, Subject, Lecture, MissionQuestion
-from learning.models import Enrollment, Certificate, LectureProgress, ProjectSubmission
-from payments.models import Payment
+from learning.certificates import request_certificate_pdfs
+from learning.models import (
+    Enrollment,
+    Certificate,
+    CertificateTemplate,
+    LectureProgress,
+    ProjectSubmission,
+)
+from payments.models import Order, OrderItem
 from payments.payment_client import payment_client
-from .models import DailyStatistics
+from uploads.mixins import ResumableUploadMixin
+from .models import CourseProgressSnapshot, DailyStatistics
+from .attendance import (
+    ATTENDANCE_WINDOW_DAYS,
+    attendance_to_dict,
+    build_attendance,
+    build_attendance_pdf,
+    get_course_start_date,
+    get_period_options,
+    iter_attendance_csv_rows,
+    parse_period_start,
+)
+from .sales import SALES_PERIOD_OPTIONS, get_sales_report, parse_sales_period
+from .search import search_courses, search_orders
+from .statistics import day_start
+from .progress import (
+    STUDENT_SORT_OPTIONS,
+    build_course_progress_rows,
+    build_progress_matrix,
+    build_subject_data,
+    build_weekly_certificate_data,
+    get_sorted_enrollments,
+    get_top_students,
+)
 from .mixins import AdminRequiredMixin
 
 logger = logging.getLogger("django")
@@ -56,13 +77,10 @@ class AdminDashboardView(AdminRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         # 오늘 날짜
-        today = timezone.now().date()
+        today = timezone.localdate()
 
-        # 통계 업데이트
-        stats = DailyStatistics.update_daily_statistics()
-        logger.info(
-            f"Daily statistics updated for {today}: new_users={stats.new_users}, active_users={stats.active_users}"
-        )
+        # 일별 통계는 rollup_daily_statistics 명령과 시그널로 미리 집계된 값만 사용
+        today_stats = DailyStatistics.objects.filter(date=today).first()
 
         # 전체 통계 데이터
         context["total_students"] = User.objects.filter(is_admin=False).count()
@@ -73,17 +91,12 @@ class AdminDashboardView(AdminRequiredMixin, TemplateView):
             is_completed=True
         ).count()
         context["total_sales"] = (
-            Payment.objects.filter(payment_status="completed").aggregate(Sum("amount"))[
-                "amount__sum"
-            ]
-            or 0
-        )
-        context["today_sales"] = (
-            Payment.objects.filter(
-                payment_status="completed", created_at__date=today
-            ).aggregate(Sum("amount"))["amount__sum"]
+            Order.objects.filter(status__in=Order.PAID_STATUSES).aggregate(
+                total=Order.revenue()
+            )["total"]
             or 0
         )
+        context["today_sales"] = today_stats.revenue if today_stats else 0
 
         # 최근 30일간 통계
         last_30_days = today - timedelta(days=30)
@@ -124,7 +137,7 @@ class AdminDashboardView(AdminRequiredMixin, TemplateView):
         }
 
         context["chart_data"] = json.dumps(chart_data)
-        context["today_stats"] = DailyStatistics.objects.filter(date=today).first()
+        context["today_stats"] = today_stats
 
         return context
 
@@ -147,7 +160,7 @@ class AdminStatisticsAPIView(AdminRequiredMixin, View):
             return JsonResponse({"error": "유효하지 않은 기간입니다."}, status=400)
 
         # 기간에 따른 통계 데이터 조회
-        today = timezone.now().date()
+        today = timezone.localdate()
         start_date = today - timedelta(days=days)
         stats = DailyStatistics.objects.filter(date__gte=start_date).order_by("date")
 
@@ -308,116 +321,24 @@ class CourseProgressOverviewView(AdminRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # 모든 과정 목록
-        courses = Course.objects.all().order_by("title")
-
-        # 각 과정별 평균 진행률 계산
-        courses_progress = []
-        for course in courses:
-            enrollments = Enrollment.objects.filter(course=course)
-            enrollment_count = enrollments.count()
-
-            if enrollment_count > 0:
-                avg_progress = enrollments.aggregate(Avg("progress_percentage"))[
-                    "progress_percentage__avg"
-                ]
-
-                # 수료증 발급 수
-                certificate_count = Certificate.objects.filter(
-                    enrollment__course=course
-                ).count()
-
-                # 최근 일주일간 수료증 발급 수
-                week_ago = timezone.now() - timedelta(days=7)
-                weekly_certificates = Certificate.objects.filter(
-                    enrollment__course=course, issued_at__gte=week_ago
-                ).count()
-
-                # 수강생 수
-                student_count = enrollment_count
-
-                courses_progress.append(
-                    {
-                        "course": course,
-                        "avg_progress": round(avg_progress if avg_progress else 0, 1),
-                        "student_count": student_count,
-                        "certificate_count": certificate_count,
-                        "weekly_certificates": weekly_certificates,
-                    }
-                )
+        # 과정별 진행 현황 (최신 스냅샷이 있으면 사용, 없으면 직접 집계)
+        courses_progress = CourseProgressSnapshot.get_fresh_rows()
+        progress_refreshed_at = None
+        if courses_progress is None:
+            courses_progress = build_course_progress_rows()
+        elif courses_progress:
+            progress_refreshed_at = courses_progress[0]["refreshed_at"]
 
         # 주간 수료증 발급 횟수 데이터 (최근 12주)
-        twelve_weeks_ago = timezone.now() - timedelta(weeks=12)
-        weekly_certificates = (
-            Certificate.objects.filter(issued_at__gte=twelve_weeks_ago)
-            .annotate(week=TruncWeek("issued_at"))
-            .values("week")
-            .annotate(count=Count("id"))
-            .order_by("week")
-        )
-
-        # 데이터가 없을 경우를 대비해 빈 주간 데이터 생성
-        all_weeks = []
-        current = twelve_weeks_ago
-        today = timezone.now()
-
-        while current <= today:
-            week_start = current - timedelta(days=current.weekday())
-            all_weeks.append(week_start.date())
-            current += timedelta(weeks=1)
-
-        # 실제 데이터가 있는 주만 추출
-        existing_weeks = {cert["week"].date() for cert in weekly_certificates}
-
-        # 모든 주에 대한 데이터 구성
-        weeks_data = []
-        counts_data = []
-
-        for week in all_weeks:
-            weeks_data.append(week)
-            if week in existing_weeks:
-                for cert in weekly_certificates:
-                    if cert["week"].date() == week:
-                        counts_data.append(cert["count"])
-                        break
-            else:
-                counts_data.append(0)
-
-        weekly_data = {
-            "weeks": [week.strftime("%Y-%m-%d") for week in weeks_data],
-            "counts": counts_data,
-        }
+        weekly_data = build_weekly_certificate_data(weeks=12)
 
         # 전체 수강생별 평균 진행률 (상위 10명)
-        student_progress = []
-        students = User.objects.filter(is_admin=False)
-        for student in students:
-            enrollments = Enrollment.objects.filter(user=student)
-            if enrollments.exists():
-                avg_progress = enrollments.aggregate(Avg("progress_percentage"))[
-                    "progress_percentage__avg"
-                ]
-                completed_count = enrollments.filter(
-                    status__in=["completed", "certified"]
-                ).count()
-                total_count = enrollments.count()
-
-                student_progress.append(
-                    {
-                        "student": student,
-                        "avg_progress": round(avg_progress if avg_progress else 0, 1),
-                        "completed_count": completed_count,
-                        "total_count": total_count,
-                    }
-                )
-
-        # 평균 진행률 기준으로 내림차순 정렬 후 상위 10명만 선택
-        student_progress.sort(key=lambda x: x["avg_progress"], reverse=True)
-        top_students = student_progress[:10]
+        top_students = get_top_students(limit=10)
 
         context.update(
             {
                 "courses_progress": courses_progress,
+                "progress_refreshed_at": progress_refreshed_at,
                 "weekly_certificate_data": json.dumps(weekly_data),
                 "top_students": top_students,
             }
@@ -438,102 +359,91 @@ class CourseProgressDetailView(AdminRequiredMixin, DetailView):
     template_name = "admin_portal/course_progress/detail.html"
     context_object_name = "course"
     pk_url_kwarg = "course_id"
+    students_per_page = 50
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        course = self.get_object()
-
-        # 과정에 등록된 모든 수강생
-        enrollments = Enrollment.objects.filter(course=course).select_related("user")
+        course = self.object
 
         # 과목 및 강의 정보
-        subjects = Subject.objects.filter(course=course).order_by("order_index")
-        subject_data = []
-
-        for subject in subjects:
-            lectures = Lecture.objects.filter(subject=subject).order_by("order_index")
-            subject_data.append(
-                {
-                    "subject": subject,
-                    "lectures": lectures,
-                    "lecture_count": lectures.count(),
-                }
-            )
-
-        # 수강생별 진행 상황
-        student_progress = []
-        for enrollment in enrollments:
-            user = enrollment.user
-
-            # 각 과목별 완료된 강의 수 계산
-            subject_progress = []
-            for subject_info in subject_data:
-                subject = subject_info["subject"]
-                lectures = subject_info["lectures"]
+        subject_data = build_subject_data(course)
 
-                # 완료된 강의 수
-                completed_lectures = LectureProgress.objects.filter(
-                    user=user,
-                    lecture__subject=subject,
-                    enrollment=enrollment,
-                    is_completed=True,
-                ).count()
-
-                # 프로젝트 제출물 (중간/기말고사인 경우)
-                project_submission = None
-                if subject.subject_type in ["midterm", "final"]:
-                    project_submission = (
-                        ProjectSubmission.objects.filter(
-                            user=user, subject=subject, enrollment=enrollment
-                        )
-                        .order_by("-submitted_at")
-                        .first()
-                    )
-
-                subject_progress.append(
-                    {
-                        "subject": subject,
-                        "completed": completed_lectures,
-                        "total": lectures.count(),
-                        "percentage": round(
-                            (
-                                completed_lectures / lectures.count() * 100
-                                if lectures.count() > 0
-                                else 0
-                            ),
-                            1,
-                        ),
-                        "project_submission": project_submission,
-                    }
-                )
+        # 과정에 등록된 수강생 (정렬 후 페이지 단위로 조회)
+        enrollments, sort = get_sorted_enrollments(course, self.request.GET.get("sort"))
+        paginator = Paginator(enrollments, self.students_per_page)
+        students_page = paginator.get_page(self.request.GET.get("page"))
 
-            # 수료증 정보
-            certificate = None
-            if enrollment.status == "certified":
-                try:
-                    certificate = Certificate.objects.get(enrollment=enrollment)
-                except Certificate.DoesNotExist:
-                    pass
-
-            student_progress.append(
-                {
-                    "user": user,
-                    "enrollment": enrollment,
-                    "subject_progress": subject_progress,
-                    "certificate": certificate,
-                }
-            )
+        # 현재 페이지 수강생의 과목별 진행 상황
+        student_progress = build_progress_matrix(
+            subject_data, students_page.object_list
+        )
 
         context.update(
             {
                 "subject_data": subject_data,
                 "student_progress": student_progress,
+                "certificate_candidate_count": Enrollment.certificate_candidates(
+                    [course]
+                ).count(),
+                "certificate_templates": CertificateTemplate.available_for_course(
+                    course
+                ),
+                "students_page": students_page,
+                "sort": sort,
+                "sort_options": [
+                    (key, label) for key, (label, _) in STUDENT_SORT_OPTIONS.items()
+                ],
             }
         )
 
         return context
 
 
+class IssueCourseCertificatesView(AdminRequiredMixin, View):
+    """특정 과정의 수료증 일괄 발급
+
+    수료 조건을 충족했지만 아직 수료증이 없는 수강생 모두에게 수료증을 한 번에 발급합니다.
+    PDF는 요청 처리 중에 만들지 않고 백그라운드 워커(run_jobs)에 맡깁니다.
+    """
+
+    def post(self, request, course_id, *args, **kwargs):
+        course = get_object_or_404(Course, id=course_id)
+
+        # 템플릿을 선택하지 않으면 과정 기본 템플릿 사용
+        template = None
+        template_id = request.POST.get("template")
+        if template_id:
+            template = (
+                CertificateTemplate.available_for_course(course)
+                .filter(id=template_id)
+                .first()
+                if template_id.isdigit()
+                else None
+            )
+            if template is None:
+                messages.error(request, "선택한 수료증 템플릿을 찾을 수 없습니다.")
+                return redirect(
+                    "admin_portal:course_progress_detail", course_id=course.id
+                )
+
+        candidates = list(Enrollment.certificate_candidates([course]).only("id"))
+        certificates = Certificate.issue_for_enrollments(candidates, template=template)
+        request_certificate_pdfs(certificates)
+
+        logger.info(
+            f"Admin {request.user.username} issued {len(certificates)} certificates for course {course.title}"
+        )
+        if certificates:
+            messages.success(
+                request,
+                f"수료증 {len(certificates)}건을 발급했습니다. PDF는 순차적으로 생성됩니다.",
+            )
+        else:
+            messages.info(request, "새로 수료증을 발급할 수강생이 없습니다.")
+
+        return redirect("admin_portal:course_progress_detail", course_id=course.id)
+
+
 class CourseAttendanceView(AdminRequiredMixin, DetailView):
     """특정 과정의 출석부 페이지
 
@@ -551,82 +461,32 @@ class CourseAttendanceView(AdminRequiredMixin, DetailView):
         context = super().get_context_data(**kwargs)
         course = self.object
 
-        # 과정에 등록된 모든 수강생
-        enrollments = (
-            Enrollment.objects.filter(course=course)
-            .select_related("user")
-            .order_by("user__username")
-        )
-
         # 현재 날짜
-        today = timezone.now().date()
+        today = timezone.localdate()
 
-        # 기간 선택 옵션 생성 (6개월 = 약 26주)
-        period_options = []
-        # 2주 단위로 생성, 총 26주 = 13개 옵션
-        for i in range(13):
-            # 현재 주 시작일(월요일)에서 i*2주 이전
-            start_date = today - timedelta(days=(today.weekday() + 14 * i))
-            end_date = start_date + timedelta(days=13)
-            period_value = f"{start_date.isoformat()},{end_date.isoformat()}"
-            label = (
-                f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
-            )
-            period_options.append({"value": period_value, "label": label})
+        # 기간 선택 옵션 생성 (2주 단위, 약 6개월)
+        period_options = get_period_options(today)
 
-        # 요청된 기간 처리
+        # 요청된 기간 처리 (항상 시작일부터 14일)
         selected_period = self.request.GET.get("period", period_options[0]["value"])
+        start_date = parse_period_start(selected_period, today)
+        end_date = start_date + timedelta(days=ATTENDANCE_WINDOW_DAYS - 1)
 
-        try:
-            start_date_str, end_date_str = selected_period.split(",")
-            start_date = date.fromisoformat(start_date_str)
-            end_date = date.fromisoformat(end_date_str)
-        except (ValueError, AttributeError):
-            # 기본값: 이번주 월요일부터 2주일 (14일)
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=13)
-
-        # 날짜 범위 생성 (항상 14일)
-        date_range = []
-        current_date = start_date
-        for _ in range(14):  # 항상 14일로 고정
-            date_range.append(current_date)
-            current_date += timedelta(days=1)
-
-        # 수강생별 활동 내역
-        attendance_data = []
-        for enrollment in enrollments:
-            user = enrollment.user
-
-            # 날짜별 활동 여부
-            daily_activities = {}
-            for day in date_range:
-                day_start = timezone.datetime.combine(day, timezone.datetime.min.time())
-                day_start = timezone.make_aware(day_start)
-                day_end = timezone.datetime.combine(day, timezone.datetime.max.time())
-                day_end = timezone.make_aware(day_end)
-
-                # 해당 날짜에 완료한 강의 수
-                completed_lectures = LectureProgress.objects.filter(
-                    user=user,
-                    lecture__subject__course=course,
-                    enrollment=enrollment,
-                    completed_at__range=(day_start, day_end),
-                ).count()
-
-                daily_activities[day.isoformat()] = completed_lectures
-
-            attendance_data.append(
-                {
-                    "user": user,
-                    "enrollment": enrollment,
-                    "daily_activities": daily_activities,
-                }
-            )
+        # 수강생별 날짜별 완료 강의 수
+        attendance = build_attendance(course, start_date, end_date)
+        date_keys = [day.isoformat() for day in attendance["dates"]]
+        attendance_data = [
+            {
+                "user": row["user"],
+                "enrollment": row["enrollment"],
+                "daily_activities": dict(zip(date_keys, row["counts"])),
+            }
+            for row in attendance["rows"]
+        ]
 
         context.update(
             {
-                "date_range": date_range,
+                "date_range": attendance["dates"],
                 "attendance_data": attendance_data,
                 "period_options": period_options,
                 "selected_period": selected_period,
@@ -647,246 +507,84 @@ class CourseAttendancePDFView(AdminRequiredMixin, View):
     def get(self, request, course_id, *args, **kwargs):
         course = get_object_or_404(Course, id=course_id)
 
-        # 과정에 등록된 모든 수강생
-        enrollments = (
-            Enrollment.objects.filter(course=course)
-            .select_related("user")
-            .order_by("user__username")
-        )
-
-        # 현재 날짜
-        today = timezone.now().date()
-
-        # 과정의 첫 번째 활동 시작일 확인 (가장 오래된 수강 신청 또는 활동 날짜)
-        oldest_enrollment_date = Enrollment.objects.filter(course=course).aggregate(
-            Min("enrolled_at")
-        )["enrolled_at__min"]
-
-        oldest_activity_date = LectureProgress.objects.filter(
-            lecture__subject__course=course
-        ).aggregate(Min("created_at"))["created_at__min"]
-
-        # 둘 중 더 오래된 날짜를 시작일로 설정
-        if oldest_enrollment_date and oldest_activity_date:
-            start_date = min(oldest_enrollment_date.date(), oldest_activity_date.date())
-        elif oldest_enrollment_date:
-            start_date = oldest_enrollment_date.date()
-        elif oldest_activity_date:
-            start_date = oldest_activity_date.date()
-        else:
-            # 데이터가 없는 경우, 기본적으로 3개월 전으로 설정
-            start_date = today - timedelta(days=90)
+        # 과정 시작일부터 오늘까지의 전체 출석 데이터
+        today = timezone.localdate()
+        start_date = get_course_start_date(course, today)
+        attendance = build_attendance(course, start_date, today)
 
         # 요청에서 넘어온 기간은 현재 화면에 표시할 기간으로만 사용
-        selected_period = request.GET.get("period", "")
-        display_start_date = None
-
-        try:
-            start_date_str, _ = selected_period.split(",")
-            display_start_date = date.fromisoformat(start_date_str)
-        except (ValueError, AttributeError):
-            # 기본값: 이번주 월요일
-            display_start_date = today - timedelta(days=today.weekday())
-
-        # 날짜 범위 생성 (시작일부터 오늘까지)
-        date_range = []
-        current_date = start_date
-        while current_date <= today:
-            date_range.append(current_date)
-            current_date += timedelta(days=1)
-
-        # 출석부 데이터 생성
-        attendance_data = []
-        for enrollment in enrollments:
-            user = enrollment.user
-
-            # 날짜별 활동 여부
-            daily_activities = []
-            for day in date_range:
-                day_start = timezone.datetime.combine(day, timezone.datetime.min.time())
-                day_start = timezone.make_aware(day_start)
-                day_end = timezone.datetime.combine(day, timezone.datetime.max.time())
-                day_end = timezone.make_aware(day_end)
-
-                # 해당 날짜에 완료한 강의 수
-                completed_lectures = LectureProgress.objects.filter(
-                    user=user,
-                    lecture__subject__course=course,
-                    enrollment=enrollment,
-                    completed_at__range=(day_start, day_end),
-                ).count()
-
-                daily_activities.append(completed_lectures)
+        display_start_date = parse_period_start(request.GET.get("period", ""), today)
 
-            attendance_data.append(
-                [
-                    user.username,
-                    user.get_full_name() or "-",
-                    *daily_activities,
-                    enrollment.progress_percentage,
-                ]
-            )
-
-        # 한글 폰트 등록
-        font_path = (
-            Path(settings.BASE_DIR) / "static" / "fonts" / "NanumGothic-Regular.ttf"
-        )
-        # ReportLab에서 한글 지원 폰트 설정
-        if font_path.exists():
-            pdfmetrics.registerFont(TTFont("NanumGothic", str(font_path)))
-            font_name = "NanumGothic"
-        else:
-            # 파일이 없으면 기본 폰트 사용 (한글이 깨질 수 있음)
-            font_name = "Helvetica"
-
-        # PDF 생성 (가로 방향으로)
+        # PDF 생성
         buffer = io.BytesIO()
+        build_attendance_pdf(buffer, course, attendance, display_start_date)
 
-        # A4 가로 크기보다 더 넓은 페이지 사이즈 설정 - 날짜가 많을 경우 적용
-        # 날짜 수가 30일 이상일 경우 더 넓은 페이지 사용
-        if len(date_range) > 30:
-            pagesize = (
-                landscape(A4)[0] * 1.5,
-                landscape(A4)[1],
-            )  # 가로 길이를 1.5배로 확장
-        else:
-            pagesize = landscape(A4)
-
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=pagesize,
-            rightMargin=20,
-            leftMargin=20,
-            topMargin=30,
-            bottomMargin=30,
-        )
+        # PDF 파일 응답
+        buffer.seek(0)
+        response = HttpResponse(buffer, content_type="application/pdf")
+        filename = f'attendance_{course.title}_full_{today.strftime("%Y%m%d")}.pdf'
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            "Title",
-            parent=styles["Heading1"],
-            fontName=font_name,
-            alignment=TA_CENTER,
-            fontSize=16,
-            spaceAfter=12,
-        )
+        return response
 
-        subtitle_style = ParagraphStyle(
-            "Subtitle",
-            parent=styles["Normal"],
-            fontName=font_name,
-            alignment=TA_CENTER,
-            fontSize=12,
-            spaceAfter=12,
-        )
 
-        # 현재 화면에 표시된 기간 하이라이트를 위한 열 인덱스 계산
-        highlight_start_idx = None
-        highlight_end_idx = None
-
-        if display_start_date:
-            # 시작일 + 13일(2주)까지의 인덱스 계산
-            display_end_date = display_start_date + timedelta(days=13)
-
-            # 날짜 범위 내 인덱스 찾기
-            for i, day in enumerate(date_range):
-                if day == display_start_date:
-                    highlight_start_idx = i + 2  # username과 fullname 열 이후
-                if day == display_end_date:
-                    highlight_end_idx = i + 2
-
-        # 표 데이터 생성
-        data = [
-            # 헤더
-            [
-                "사용자 ID",
-                "이름",
-                *[day.strftime("%y/%m/%d") for day in date_range],
-                "전체 진행률(%)",
-            ],
-            # 데이터 행
-            *attendance_data,
-        ]
+class CourseAttendanceExportView(AdminRequiredMixin, View):
+    """특정 과정의 출석부 CSV/JSON 내보내기
 
-        # 표 스타일
-        table_style = TableStyle(
-            [
-                # 기본 스타일
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightblue),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), font_name),  # 한글 폰트 적용
-                ("FONTSIZE", (0, 0), (-1, 0), 8),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                ("ALIGN", (2, 1), (-2, -1), "CENTER"),  # 날짜 칼럼은 가운데 정렬
-                ("ALIGN", (-1, 1), (-1, -1), "RIGHT"),  # 진행률 칼럼은 오른쪽 정렬
-                ("FONTSIZE", (2, 0), (-2, 0), 7),  # 날짜 헤더 칼럼은 더 작은 글씨로
-                ("FONTSIZE", (2, 1), (-2, -1), 8),  # 날짜 데이터는 읽기 좋게 약간 키움
-                ("FONTNAME", (0, 1), (-1, -1), font_name),  # 데이터 행도 한글 폰트 적용
-                ("WORDWRAP", (0, 0), (-1, -1), True),  # 텍스트 자동 줄바꿈 활성화
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),  # 모든 셀 내용 세로 가운데 정렬
-                ("TOPPADDING", (0, 0), (-1, -1), 4),  # 위쪽 패딩 추가
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),  # 아래쪽 패딩 추가
-            ]
-        )
+    format=csv(기본) 또는 format=json으로 형식을 선택합니다.
+    start, end(YYYY-MM-DD)로 기간을 지정할 수 있으며,
+    지정하지 않으면 과정 시작일부터 오늘까지의 전체 기간을 내보냅니다.
+    """
+
+    def get(self, request, course_id, *args, **kwargs):
+        course = get_object_or_404(Course, id=course_id)
+        today = timezone.localdate()
 
-        # 현재 화면에 표시된 기간 하이라이트
-        if highlight_start_idx is not None and highlight_end_idx is not None:
-            table_style.add(
-                "BACKGROUND",
-                (highlight_start_idx, 0),
-                (highlight_end_idx, 0),
-                colors.lightgreen,
+        try:
+            start_date = (
+                date.fromisoformat(request.GET["start"])
+                if request.GET.get("start")
+                else get_course_start_date(course, today)
+            )
+            end_date = (
+                date.fromisoformat(request.GET["end"])
+                if request.GET.get("end")
+                else today
+            )
+        except ValueError:
+            return JsonResponse(
+                {"success": False, "message": "날짜 형식이 올바르지 않습니다."},
+                status=400,
+            )
+        if start_date > end_date:
+            return JsonResponse(
+                {"success": False, "message": "시작일이 종료일보다 늦습니다."},
+                status=400,
             )
 
-        # 컬럼 너비 계산 개선
-        username_width = 80  # 사용자 ID 확장
-        fullname_width = 80  # 이름 확장
-        progress_width = 60  # 진행률 확장
+        attendance = build_attendance(course, start_date, end_date)
+        filename = f"attendance_{course.id}_{start_date:%Y%m%d}_{end_date:%Y%m%d}"
 
-        # 나머지 가용 너비 계산
-        available_width = doc.width - (username_width + fullname_width + progress_width)
+        if request.GET.get("format") == "json":
+            response = JsonResponse(attendance_to_dict(course, attendance))
+            response["Content-Disposition"] = f'attachment; filename="{filename}.json"'
+            return response
 
-        # 날짜가 많을 경우 최소 너비 보장하면서 균등 분배
-        if date_range:
-            date_width = (
-                max(30, available_width / len(date_range))
-                if len(date_range) > 14
-                else available_width / len(date_range)
-            )
-        else:
-            date_width = 30
-
-        col_widths = [username_width, fullname_width]  # 사용자 ID, 이름
-        col_widths.extend([date_width] * len(date_range))  # 날짜 열
-        col_widths.append(progress_width)  # 진행률 칼럼
-
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(table_style)
-
-        # 문서 요소
-        elements = [
-            Paragraph(f"{course.title} - 전체 수강생 출석부", title_style),
-            Paragraph(
-                f"기간: {start_date.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')} (총 {len(date_range)}일)",
-                subtitle_style,
-            ),
-            Spacer(1, 0.2 * inch),
-            table,
-        ]
+        # CSV는 행 단위로 스트리밍 (엑셀 한글 표시를 위해 BOM 추가)
+        writer = csv.writer(Echo())
+        rows = (writer.writerow(row) for row in iter_attendance_csv_rows(attendance))
+        response = StreamingHttpResponse(
+            itertools.chain(["\ufeff"], rows), content_type="text/csv; charset=utf-8"
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+        return response
 
-        # PDF 생성
-        doc.build(elements)
 
-        # PDF 파일 응답
-        buffer.seek(0)
-        response = HttpResponse(buffer, content_type="application/pdf")
-        filename = f'attendance_{course.title}_full_{today.strftime("%Y%m%d")}.pdf'
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+class Echo:
+    """csv.writer가 쓴 내용을 그대로 반환하는 파일 객체 (스트리밍 응답용)"""
 
-        return response
+    def write(self, value):
+        return value
 
 
 class CourseManagementView(AdminRequiredMixin, ListView):
@@ -903,11 +601,7 @@ class CourseManagementView(AdminRequiredMixin, ListView):
 
     def get_queryset(self):
         search_query = self.request.GET.get("search", "")
-        if search_query:
-            return Course.objects.filter(title__icontains=search_query).order_by(
-                "title"
-            )
-        return Course.objects.all().order_by("title")
+        return search_courses(Course.objects.all(), search_query).order_by("title")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1178,7 +872,7 @@ class LectureManagementView(AdminRequiredMixin, ListView):
         return context
 
 
-class LectureCreateView(AdminRequiredMixin, CreateView):
+class LectureCreateView(AdminRequiredMixin, ResumableUploadMixin, CreateView):
     """강의 생성 페이지
 
     특정 과목에 새로운 강의를 생성하는 페이지입니다.
@@ -1189,6 +883,7 @@ class LectureCreateView(AdminRequiredMixin, CreateView):
     model = Lecture
     template_name = "admin_portal/course_management/lecture_create.html"
     fields = ["title", "description", "lecture_type", "order_index", "video_file"]
+    resumable_upload_fields = {"video_file": "lecture_video"}
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1217,21 +912,11 @@ class LectureCreateView(AdminRequiredMixin, CreateView):
         # 미션(퀴즈) 강의인 경우 문제 처리
         if lecture.lecture_type == "mission" and "questions" in self.request.POST:
             questions_data = json.loads(self.request.POST.get("questions"))
+            save_mission_questions(lecture, questions_data)
 
-            for i, q_data in enumerate(questions_data):
-                question_text = q_data.get("question_text", q_data.get("text", ""))
-                question = MissionQuestion(
-                    lecture=lecture,
-                    question_text=question_text,
-                    option1=q_data["options"][0],
-                    option2=q_data["options"][1],
-                    option3=q_data["options"][2],
-                    option4=q_data["options"][3],
-                    option5=q_data["options"][4],
-                    correct_answer=q_data["correct_answer"],
-                    order_index=q_data.get("order_index", i + 1),
-                )
-                question.save()
+        # 동영상 길이/해상도 추출과 포스터 생성은 백그라운드 작업으로 처리
+        if lecture.video_file:
+            lecture.request_media_processing()
 
         messages.success(
             self.request, f'강의 "{lecture.title}"이(가) 성공적으로 생성되었습니다.'
@@ -1248,7 +933,7 @@ class LectureCreateView(AdminRequiredMixin, CreateView):
         )
 
 
-class LectureDetailView(AdminRequiredMixin, UpdateView):
+class LectureDetailView(AdminRequiredMixin, ResumableUploadMixin, UpdateView):
     """강의 상세 및 수정 페이지
 
     기존 강의의 상세 정보를 보고 수정할 수 있는 페이지입니다.
@@ -1261,6 +946,7 @@ class LectureDetailView(AdminRequiredMixin, UpdateView):
     context_object_name = "lecture"
     pk_url_kwarg = "lecture_id"
     fields = ["title", "description", "order_index", "video_file"]
+    resumable_upload_fields = {"video_file": "lecture_video"}
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1279,32 +965,26 @@ class LectureDetailView(AdminRequiredMixin, UpdateView):
         return context
 
     def form_valid(self, form):
+        # 동영상 파일이 바뀌면 이전 HLS 변환 결과는 사용하지 않음
+        video_changed = "video_file" in form.changed_data
+        if video_changed:
+            form.instance.hls_manifest = ""
+            form.instance.hls_packaged_at = None
+            form.instance.media_processed_at = None
+
         # 강의 업데이트
         response = super().form_valid(form)
         lecture = self.object
 
+        # 새 동영상의 길이/해상도 추출과 포스터 생성은 백그라운드 작업으로 처리
+        if video_changed and lecture.video_file:
+            lecture.request_media_processing()
+
         # 미션(퀴즈) 강의인 경우 문제 업데이트
         if lecture.lecture_type == "mission" and "questions" in self.request.POST:
-            # 기존 문제 삭제
-            MissionQuestion.objects.filter(lecture=lecture).delete()
-
-            # 새 문제 추가
+            # 기존 문제를 모두 새 문제로 교체
             questions_data = json.loads(self.request.POST.get("questions"))
-
-            for i, q_data in enumerate(questions_data):
-                question_text = q_data.get("question_text", q_data.get("text", ""))
-                question = MissionQuestion(
-                    lecture=lecture,
-                    question_text=question_text,
-                    option1=q_data["options"][0],
-                    option2=q_data["options"][1],
-                    option3=q_data["options"][2],
-                    option4=q_data["options"][3],
-                    option5=q_data["options"][4],
-                    correct_answer=q_data["correct_answer"],
-                    order_index=q_data.get("order_index", i + 1),
-                )
-                question.save()
+            save_mission_questions(lecture, questions_data, replace=True)
 
         messages.success(
             self.request, f'강의 "{lecture.title}"이(가) 성공적으로 업데이트되었습니다.'
@@ -1464,14 +1144,14 @@ class UserLearningRecordsView(AdminRequiredMixin, TemplateView):
 class PaymentManagementView(AdminRequiredMixin, ListView):
     """결제 내역 관리 페이지
 
-    결제 내역을 조회하고 관리할 수 있는 페이지입니다.
+    주문 단위로 결제 내역을 조회하고 관리할 수 있는 페이지입니다.
     결제 상태, 기간, 사용자 등으로 필터링할 수 있으며,
     매출 통계 및 결제 방법별 비율 차트를 제공합니다.
     """
 
-    model = Payment
+    model = Order
     template_name = "admin_portal/payments/payment_list.html"
-    context_object_name = "payments"
+    context_object_name = "orders"
     paginate_by = 20
 
     def get_queryset(self):
@@ -1481,34 +1161,33 @@ class PaymentManagementView(AdminRequiredMixin, ListView):
         date_from = self.request.GET.get("date_from", "")
         date_to = self.request.GET.get("date_to", "")
 
-        # 기본 쿼리셋 생성
-        queryset = Payment.objects.all().select_related("user", "course")
+        # 기본 쿼리셋 생성 (구매 과정은 페이지의 주문들에 대해 한 번에 조회)
+        queryset = Order.objects.select_related("user").prefetch_related(
+            Prefetch("items", queryset=OrderItem.objects.select_related("course"))
+        )
 
         # 상태 필터 적용
         if status_filter != "all":
-            queryset = queryset.filter(payment_status=status_filter)
+            queryset = queryset.filter(status=status_filter)
 
         # 검색 필터 적용
-        if search_query:
-            queryset = queryset.filter(
-                Q(user__username__icontains=search_query)
-                | Q(user__email__icontains=search_query)
-                | Q(course__title__icontains=search_query)
-                | Q(merchant_uid__icontains=search_query)
-            )
+        queryset = search_orders(queryset, search_query)
 
         # 날짜 필터링
+        # (created_at 인덱스를 사용하도록 [시작일 0시, 종료일 다음날 0시) 범위로 비교)
         if date_from:
             try:
                 date_from = datetime.strptime(date_from, "%Y-%m-%d").date()
-                queryset = queryset.filter(created_at__date__gte=date_from)
+                queryset = queryset.filter(created_at__gte=day_start(date_from))
             except ValueError:
                 pass
 
         if date_to:
             try:
                 date_to = datetime.strptime(date_to, "%Y-%m-%d").date()
-                queryset = queryset.filter(created_at__date__lte=date_to)
+                queryset = queryset.filter(
+                    created_at__lt=day_start(date_to + timedelta(days=1))
+                )
             except ValueError:
                 pass
 
@@ -1543,49 +1222,20 @@ class PaymentManagementView(AdminRequiredMixin, ListView):
         else:
             context["date_to"] = ""
 
-        # 통계 데이터
-        payments = Payment.objects.all()
-        context["completed_count"] = payments.filter(payment_status="completed").count()
-        context["total_sales"] = (
-            payments.filter(payment_status="completed").aggregate(Sum("amount"))[
-                "amount__sum"
-            ]
-            or 0
-        )
-        context["today_sales"] = (
-            payments.filter(
-                payment_status="completed", created_at__date=timezone.now().date()
-            ).aggregate(Sum("amount"))["amount__sum"]
-            or 0
-        )
-
-        # 최근 7일 매출 추이
-        today = timezone.now().date()
-        daily_sales = []
-        daily_dates = []
-
-        for i in range(6, -1, -1):
-            date = today - timedelta(days=i)
-            daily_dates.append(date.strftime("%m/%d"))
-
-            day_sales = (
-                payments.filter(
-                    payment_status="completed", created_at__date=date
-                ).aggregate(Sum("amount"))["amount__sum"]
-                or 0
-            )
-
-            daily_sales.append(day_sales)
-
-        context["daily_dates"] = json.dumps(daily_dates)
-        context["daily_sales"] = json.dumps(daily_sales)
-
-        # 결제 방법별 비율
-        context["payment_methods"] = (
-            payments.filter(payment_status="completed")
-            .values("payment_method")
-            .annotate(count=Count("id"), sum=Sum("amount"))
-            .order_by("-sum")
+        # 매출 통계 (결제 완료 기준, 선택한 기간의 일별 매출 추이 포함)
+        sales_period = parse_sales_period(self.request.GET.get("sales_period"))
+        report = get_sales_report(sales_period)
+        context.update(
+            {
+                "completed_count": report["total_count"],
+                "total_sales": report["total_sales"],
+                "today_sales": report["today_sales"],
+                "daily_dates": json.dumps(report["daily_dates"]),
+                "daily_sales": json.dumps(report["daily_sales"]),
+                "payment_methods": report["payment_methods"],
+                "sales_period": sales_period,
+                "sales_period_options": SALES_PERIOD_OPTIONS,
+            }
         )
 
         return context
@@ -1594,25 +1244,30 @@ class PaymentManagementView(AdminRequiredMixin, ListView):
 class PaymentDetailAdminView(AdminRequiredMixin, DetailView):
     """결제 상세 관리 페이지
 
-    특정 결제 내역의 상세 정보를 보여주는 페이지입니다.
-    결제 정보, 구매 상품 정보, 구매자 정보 등을 확인할 수 있으며,
-    완료된 결제의 경우 환불 처리를 할 수 있습니다.
+    특정 주문의 상세 정보를 보여주는 페이지입니다.
+    결제 정보, 구매 과정 목록, 구매자 정보 등을 확인할 수 있으며,
+    결제 완료된 과정은 과정별로 환불 처리를 할 수 있습니다.
     """
 
-    model = Payment
+    model = Order
     template_name = "admin_portal/payments/payment_detail.html"
-    context_object_name = "payment"
-    pk_url_kwarg = "payment_id"
+    context_object_name = "order"
+    pk_url_kwarg = "order_id"
+
+    def get_queryset(self):
+        return Order.objects.select_related("user")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        payment = self.get_object()
+        order = self.object
+
+        context["items"] = order.items.select_related("course")
 
         # 익명화된 사용자 정보 처리
-        if payment.is_anonymized:
+        if order.is_anonymized:
             try:
                 deleted_user = DeletedUserData.objects.get(
-                    original_user_id=payment.anonymized_user_id
+                    original_user_id=order.anonymized_user_id
                 )
                 context["anonymized_user"] = deleted_user
             except DeletedUserData.DoesNotExist:
@@ -1621,47 +1276,47 @@ class PaymentDetailAdminView(AdminRequiredMixin, DetailView):
         return context
 
     def post(self, request, *args, **kwargs):
-        payment = self.get_object()
+        order = self.get_object()
 
-        # 환불 처리
+        # 과정별 환불 처리
         if "refund" in request.POST:
+            item_id = request.POST.get("item_id", "")
+            item = get_object_or_404(
+                OrderItem.objects.select_related("order"),
+                id=int(item_id) if item_id.isdigit() else None,
+                order=order,
+            )
             refund_reason = request.POST.get(
                 "refund_reason", "관리자 환불 처리"
             ).strip()
 
-            try:
-                with transaction.atomic():
-                    # 포트원 API 호출하여 환불 처리
-                    is_successful, result = payment_client.refund_payment(
-                        reason=refund_reason,
-                        imp_uid=payment.imp_uid,
-                        merchant_uid=payment.merchant_uid,
-                        amount=payment.amount,
-                    )
-
-                    if is_successful:
-                        # 환불 성공 시 결제 정보 업데이트
-                        payment.refund_reason = refund_reason
-                        payment.payment_status = "refunded"
-                        payment.updated_at = timezone.now()
-                        payment.save()
+            if not item.is_refundable:
+                messages.error(request, "환불할 수 없는 결제입니다.")
+                return redirect("admin_portal:payment_detail", order_id=order.id)
 
-                        # 수강 등록 정보도 삭제
-                        Enrollment.objects.filter(
-                            user=payment.user, course=payment.course
-                        ).delete()
+            try:
+                # 포트원 API 호출하여 해당 과정 금액만 부분 환불
+                is_successful, result = payment_client.refund_payment(
+                    reason=refund_reason,
+                    imp_uid=order.imp_uid,
+                    merchant_uid=order.merchant_uid,
+                    amount=item.amount,
+                )
 
-                        messages.success(request, "환불이 성공적으로 처리되었습니다.")
-                    else:
-                        messages.error(
-                            request, f"환불 처리 중 오류가 발생했습니다: {result}"
-                        )
+                if is_successful:
+                    # 환불 성공 시 주문 정보 갱신 및 수강 정보 삭제
+                    item.mark_refunded(refund_reason)
+                    messages.success(request, "환불이 성공적으로 처리되었습니다.")
+                else:
+                    messages.error(
+                        request, f"환불 처리 중 오류가 발생했습니다: {result}"
+                    )
 
             except Exception as e:
                 logger.exception("환불 처리 중 오류 발생")
                 messages.error(request, f"환불 처리 중 오류가 발생했습니다: {str(e)}")
 
-        return redirect("admin_portal:payment_detail", payment_id=payment.id)
+        return redirect("admin_portal:payment_detail", order_id=order.id)
 
 
 class ManageStudentEnrollmentView(AdminRequiredMixin, TemplateView):
@@ -1,11 +1,11 @@
 from django.contrib import messages
-from django.db.models import Q
 from django.shortcuts import redirect, get_object_or_404
 from django.views.generic import ListView, DetailView
 from django.views import View
 import logging
 
 from admin_portal.mixins import AdminRequiredMixin
+from admin_portal.search import search_questions
 from courses.models import Course, QnAQuestion, QnAAnswer
 
 logger = logging.getLogger("django")
@@ -30,12 +30,7 @@ class QnAManagementView(AdminRequiredMixin, ListView):
         ).order_by("-created_at")
 
         # 검색 필터 적용
-        if search_query:
-            queryset = queryset.filter(
-                Q(content__icontains=search_query)
-                | Q(user__username__icontains=search_query)
-                | Q(lecture__title__icontains=search_query)
-            )
+        queryset = search_questions(queryset, search_query)
 
         # 과정 필터 적용
         if course_id:
@@ -30,8 +30,10 @@ INSTALLED_APPS = [
     "accounts",
     "admin_portal",
     "courses",
+    "jobs",
     "learning",
     "payments",
+    "uploads",
     # 서드파티 앱
     "allauth",
     "allauth.account",
@@ -114,6 +116,40 @@ STATICFILES_DIRS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 권한 확인 후에만 제공하는 미디어 경로 (수료증, 프로젝트 제출 파일, 강의 동영상, 업로드 중인 파일)
+# MEDIA_URL로 직접 접근할 수 없고 learning 앱의 다운로드 뷰를 거쳐야 합니다.
+PROTECTED_MEDIA_PREFIXES = ["certificates/", "projects/", "videos/", "uploads/"]
+# True이면 파일 전송을 nginx에 맡김 (X-Accel-Redirect, nginx/nginx.conf의 internal 경로)
+PROTECTED_MEDIA_USE_X_ACCEL = False
+PROTECTED_MEDIA_INTERNAL_URL = "/protected-media/"
+
+# 분할 업로드(uploads 앱) 설정
+# 받은 조각을 이어 쓰는 폴더 (완료 후 파일을 복사 없이 옮길 수 있도록 MEDIA_ROOT 안에 둠)
+RESUMABLE_UPLOAD_DIR = MEDIA_ROOT / "uploads"
+# 조각 하나의 최대 크기 (nginx의 /uploads/ client_max_body_size보다 작아야 함)
+RESUMABLE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# 이 시간 이상 갱신되지 않은 업로드는 clear_stale_uploads 명령으로 삭제
+RESUMABLE_UPLOAD_EXPIRE_HOURS = 24
+
+# 강의 동영상 HLS 변환에 사용할 실행 파일 (없으면 PATH에서 찾음)
+FFMPEG_BINARY = os.environ.get("FFMPEG_BINARY", "ffmpeg")
+FFPROBE_BINARY = os.environ.get("FFPROBE_BINARY", "ffprobe")
+
+# 수료증 PDF가 아직 없을 때 다운로드 요청에서 기다리는 최대 시간(초)
+# (PDF는 run_jobs 워커가 생성하며, 시간 내에 준비되지 않으면 준비 중 안내)
+CERTIFICATE_PDF_WAIT_SECONDS = 1
+
+# 캐시 설정 (기본: 프로세스 메모리, 운영 환경에서 공유 캐시로 오버라이드)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "skillbridge",
+    }
+}
+
+# 과정 진행 현황 스냅샷 유효 시간(초), 이보다 오래되면 개요 페이지에서 직접 집계
+COURSE_PROGRESS_SNAPSHOT_MAX_AGE = 60 * 60
+
 # 기본 자동 필드 설정
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -164,3 +200,5 @@ PORTONE_PG = os.environ.get("PORTONE_PG_PROVIDER", "")
 PORTONE_SHOP_ID = os.environ.get("PORTONE_SHOP_ID", "")
 PORTONE_API_KEY = os.environ.get("PORTONE_API_KEY", "")
 PORTONE_API_SECRET = os.environ.get("PORTONE_API_SECRET", "")
+# 포트원 REST API 주소 (로컬에서는 run_fake_portone 명령의 가짜 서버 주소로 지정 가능)
+PORTONE_API_URL = os.environ.get("PORTONE_API_URL", "https://api.iamport.kr/")
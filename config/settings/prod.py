@@ -18,6 +18,9 @@ X_FRAME_OPTIONS = "DENY"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 보호된 미디어 파일은 권한 확인 후 nginx가 전송
+PROTECTED_MEDIA_USE_X_ACCEL = True
+
 # 데이터베이스 설정
 # PostgreSQL 사용
 DATABASES = {
@@ -31,6 +34,27 @@ DATABASES = {
     }
 }
 
+# 캐시 설정
+# 여러 gunicorn 워커와 작업 워커(run_jobs)가 캐시(카탈로그 버전 등)를 공유해야 하므로 공유 캐시 사용
+# REDIS_URL이 있으면 Redis(redis 패키지 필요), 없으면 파일 캐시 사용
+# 파일 캐시는 web/worker 컨테이너가 같은 디렉터리를 마운트해야 함 (docker-compose.yml의 cache_volume)
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ.get(
+                "DJANGO_CACHE_DIR", "/var/tmp/skillbridge_cache"
+            ),
+        }
+    }
+
 # 운영 환경에서의 로깅 설정
 LOGGING = {
     "version": 1,
@@ -1,8 +1,10 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 from django.shortcuts import redirect
+from django.views.static import serve
+
+from learning.protected_media import protected_media_pattern
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -12,5 +14,16 @@ urlpatterns = [
     path("courses/", include("courses.urls")),
     path("learning/", include("learning.urls")),
     path("payments/", include("payments.urls")),
+    path("uploads/", include("uploads.urls")),
     path("", lambda request: redirect("courses/")),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
+
+if settings.DEBUG:
+    # 개발 서버의 미디어 파일 제공 (보호된 미디어는 권한 확인 뷰에서만 제공)
+    urlpatterns += [
+        re_path(
+            protected_media_pattern(),
+            serve,
+            {"document_root": settings.MEDIA_ROOT},
+        ),
+    ]
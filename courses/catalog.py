@@ -0,0 +1,94 @@
+import time
+
+from django.core.cache import cache
+
+from .models import Course
+
+# 카탈로그 캐시는 버전이 바뀌면 자연히 무효화되므로 길게 유지
+CATALOG_CACHE_TIMEOUT = 60 * 60 * 24
+CATALOG_VERSION_KEY = "courses:catalog:version"
+
+POPULAR_COURSE_COUNT = 6
+BANNER_COURSE_COUNT = 3
+
+
+def _initial_catalog_version():
+    # 캐시가 비워진 뒤에도 이전 버전 번호와 겹치지 않도록 현재 시각(ms)으로 시작
+    return int(time.time() * 1000)
+
+
+def get_catalog_version():
+    """현재 카탈로그 버전 반환 (없으면 새로 생성)"""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = _initial_catalog_version()
+        if not cache.add(CATALOG_VERSION_KEY, version, None):
+            # 다른 요청이 먼저 생성한 경우 그 버전을 사용
+            version = cache.get(CATALOG_VERSION_KEY, version)
+    return version
+
+
+def bump_catalog_version():
+    """카탈로그 버전 증가 (이전 버전으로 캐시된 목록/페이지는 모두 무효화됨)"""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        # 버전 키가 없으면 새 버전으로 시작
+        cache.set(CATALOG_VERSION_KEY, _initial_catalog_version(), None)
+
+
+def catalog_cache_key(name, *parts):
+    """현재 카탈로그 버전이 포함된 캐시 키 생성"""
+    key = f"courses:catalog:{get_catalog_version()}:{name}"
+    if parts:
+        key += ":" + ":".join(str(part) for part in parts)
+    return key
+
+
+def get_popular_courses():
+    """인기 과정 목록 (평균 평점순, 최신순)
+
+    카탈로그 버전별로 캐시되므로 과정/리뷰가 바뀌기 전까지는 쿼리하지 않습니다.
+    """
+    key = catalog_cache_key("popular")
+    courses = cache.get(key)
+    if courses is None:
+        courses = list(
+            Course.objects.order_by("-rating_avg", "-created_at")[:POPULAR_COURSE_COUNT]
+        )
+        cache.set(key, courses, CATALOG_CACHE_TIMEOUT)
+    return courses
+
+
+def build_banner_slides(courses):
+    """배너 슬라이드 데이터 생성"""
+    banner_slides = []
+    for course in courses:
+        # 제목을 두 줄로 분리 (가정: 첫 번째 공백을 기준으로 나눔)
+        title_parts = course.title.split(" ", 1)
+        title_line1 = title_parts[0] if len(title_parts) > 0 else course.title
+        title_line2 = (
+            title_parts[1] if len(title_parts) > 1 else "나노 디그리로 완성하세요"
+        )
+
+        banner_slides.append(
+            {
+                "titleLine1": title_line1,
+                "titleLine2": title_line2,
+                "description": course.short_description
+                or "실무에 필요한 기술을 습득하세요.",
+                "courseDetailUrl": f"/courses/detail/{course.id}/",
+                "course": course,
+            }
+        )
+    return banner_slides
+
+
+def get_banner_slides():
+    """배너에 표시할 인기 과정 상위 슬라이드 (카탈로그 버전별 캐시)"""
+    key = catalog_cache_key("banner")
+    banner_slides = cache.get(key)
+    if banner_slides is None:
+        banner_slides = build_banner_slides(get_popular_courses()[:BANNER_COURSE_COUNT])
+        cache.set(key, banner_slides, CATALOG_CACHE_TIMEOUT)
+    return banner_slides
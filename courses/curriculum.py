@@ -0,0 +1,108 @@
+from django.core.cache import cache
+
+from .models import Course, Subject, Lecture
+
+# 커리큘럼 구성은 자주 바뀌지 않으므로 길게 캐시하고, 변경 시 시그널로 무효화
+OUTLINE_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def outline_cache_key(course_id):
+    return f"courses:outline:{course_id}"
+
+
+def build_course_outline(course_id):
+    """과정의 커리큘럼을 학습 순서대로 평탄화한 목차 생성
+
+    과목/강의 순서대로 (학습 항목 유형, 객체 id, 과목 id) 튜플 목록을 만듭니다.
+    중간/기말고사 과목은 과목 자체가 하나의 'project' 항목이 되고,
+    일반 과목의 강의는 유형에 따라 'video_lecture' 또는 'mission' 항목이 됩니다.
+    """
+    subjects = (
+        Subject.objects.filter(course_id=course_id)
+        .order_by("order_index", "id")
+        .values_list("id", "subject_type")
+    )
+    lectures = (
+        Lecture.objects.filter(subject__course_id=course_id)
+        .order_by("order_index", "id")
+        .values_list("id", "subject_id", "lecture_type")
+    )
+
+    # 과목별 강의 목록 (쿼리 결과가 이미 강의 순서대로 정렬되어 있음)
+    lectures_by_subject = {}
+    for lecture_id, subject_id, lecture_type in lectures:
+        item_type = "video_lecture" if lecture_type == "video" else "mission"
+        lectures_by_subject.setdefault(subject_id, []).append(
+            (item_type, lecture_id, subject_id)
+        )
+
+    items = []
+    for subject_id, subject_type in subjects:
+        if subject_type in Subject.EXAM_TYPES:
+            items.append(("project", subject_id, subject_id))
+        items.extend(lectures_by_subject.get(subject_id, []))
+
+    # 강의 id -> 목차 내 위치 (다음 항목 탐색용)
+    lecture_positions = {
+        object_id: position
+        for position, (item_type, object_id, _subject_id) in enumerate(items)
+        if item_type != "project"
+    }
+
+    return {"items": items, "lecture_positions": lecture_positions}
+
+
+def get_course_outline(course_id):
+    """캐시된 과정 목차 반환 (없으면 생성 후 캐시)"""
+    key = outline_cache_key(course_id)
+    outline = cache.get(key)
+    if outline is None:
+        outline = build_course_outline(course_id)
+        cache.set(key, outline, OUTLINE_CACHE_TIMEOUT)
+    return outline
+
+
+def invalidate_course_outline(course_id):
+    """과정 목차 캐시 무효화"""
+    cache.delete(outline_cache_key(course_id))
+
+
+def find_next_pending_item(outline, completed_lecture_ids, passed_subject_ids):
+    """목차에서 아직 완료하지 않은 첫 번째 학습 항목 찾기
+
+    완료한 강의 id 집합과 통과한 프로젝트 과목 id 집합을 목차와 비교하여
+    (학습 항목 유형, 객체 id)를 반환합니다. 모두 완료했다면 None을 반환합니다.
+    """
+    for item_type, object_id, _subject_id in outline["items"]:
+        if item_type == "project":
+            if object_id not in passed_subject_ids:
+                return item_type, object_id
+        elif object_id not in completed_lecture_ids:
+            return item_type, object_id
+    return None
+
+
+def find_item_after_lecture(outline, lecture_id):
+    """목차에서 특정 강의 바로 다음 학습 항목 찾기
+
+    반환 형식: (학습 항목 유형, 객체 id) 또는 다음 항목이 없으면 None
+    """
+    position = outline["lecture_positions"].get(lecture_id)
+    if position is None or position + 1 >= len(outline["items"]):
+        return None
+    item_type, object_id, _subject_id = outline["items"][position + 1]
+    return item_type, object_id
+
+
+def load_learning_item(course_id, next_item):
+    """(학습 항목 유형, 객체 id)를 (유형, 객체) 형식으로 변환
+
+    다음 항목이 없으면 ('completed', 과정)을 반환합니다.
+    """
+    if next_item is None:
+        return ("completed", Course.objects.get(id=course_id))
+
+    item_type, object_id = next_item
+    if item_type == "project":
+        return (item_type, Subject.objects.get(id=object_id))
+    return (item_type, Lecture.objects.get(id=object_id))
@@ -0,0 +1,82 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+
+from courses.models import Lecture
+from courses.video import (
+    HLS_RENDITIONS,
+    HLS_SEGMENT_SECONDS,
+    VideoProcessingError,
+    find_binary,
+    package_hls,
+)
+
+
+class Command(BaseCommand):
+    help = "강의 동영상을 여러 화질의 HLS(적응형 스트리밍)로 변환합니다. (ffmpeg 필요)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lecture",
+            type=int,
+            action="append",
+            dest="lecture_ids",
+            help="변환할 강의 ID (여러 번 지정 가능, 생략 시 HLS가 없는 모든 동영상 강의)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 변환된 강의도 다시 변환",
+        )
+        parser.add_argument(
+            "--rendition",
+            action="append",
+            dest="renditions",
+            choices=[rendition[0] for rendition in HLS_RENDITIONS],
+            help="만들 화질 (여러 번 지정 가능, 기본: 원본 이하의 모든 화질)",
+        )
+        parser.add_argument(
+            "--segment-seconds",
+            type=int,
+            default=HLS_SEGMENT_SECONDS,
+            help=f"세그먼트 길이(초) (기본 {HLS_SEGMENT_SECONDS}초)",
+        )
+
+    def handle(self, *args, **options):
+        if not find_binary("ffmpeg"):
+            raise CommandError(
+                "ffmpeg를 찾을 수 없습니다. ffmpeg를 설치하거나 FFMPEG_BINARY를 지정해주세요."
+            )
+
+        lectures = Lecture.objects.filter(lecture_type="video").exclude(video_file="")
+        if options["lecture_ids"]:
+            lectures = lectures.filter(id__in=options["lecture_ids"])
+        if not options["force"]:
+            lectures = lectures.filter(hls_manifest="")
+
+        renditions = None
+        if options["renditions"]:
+            renditions = [r for r in HLS_RENDITIONS if r[0] in options["renditions"]]
+
+        packaged = failed = 0
+        for lecture in lectures.order_by("id"):
+            started = time.monotonic()
+            try:
+                names = package_hls(
+                    lecture,
+                    renditions=renditions,
+                    segment_seconds=options["segment_seconds"],
+                )
+            except VideoProcessingError as e:
+                failed += 1
+                self.stderr.write(f"강의 {lecture.id} ({lecture.title}) 변환 실패: {e}")
+                continue
+
+            packaged += 1
+            self.stdout.write(
+                f"강의 {lecture.id} ({lecture.title}): {', '.join(names)} ({time.monotonic() - started:.1f}초)"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"HLS 변환 완료: 성공 {packaged}건, 실패 {failed}건")
+        )
@@ -0,0 +1,65 @@
+from django.core.management import BaseCommand
+
+from courses.models import Lecture
+from courses.video import VideoProcessingError, process_lecture_media
+
+
+class Command(BaseCommand):
+    help = "강의 동영상의 길이/해상도/비트레이트를 추출하고 포스터 이미지를 생성합니다. (ffmpeg/ffprobe 필요)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lecture",
+            type=int,
+            action="append",
+            dest="lecture_ids",
+            help="처리할 강의 ID (여러 번 지정 가능, 생략 시 아직 처리되지 않은 모든 동영상 강의)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 처리된 강의도 다시 처리",
+        )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="바로 처리하지 않고 run_jobs 워커에 작업으로 등록",
+        )
+
+    def handle(self, *args, **options):
+        lectures = Lecture.objects.filter(lecture_type="video").exclude(video_file="")
+        if options["lecture_ids"]:
+            lectures = lectures.filter(id__in=options["lecture_ids"])
+        if not options["force"]:
+            lectures = lectures.filter(media_processed_at__isnull=True)
+
+        if options["queue"]:
+            count = 0
+            for lecture in lectures.order_by("id"):
+                lecture.request_media_processing()
+                count += 1
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"동영상 처리 작업 {count}건을 등록했습니다. (run_jobs 워커에서 처리)"
+                )
+            )
+            return
+
+        processed = failed = 0
+        for lecture in lectures.order_by("id"):
+            try:
+                process_lecture_media(lecture)
+            except VideoProcessingError as e:
+                failed += 1
+                self.stderr.write(f"강의 {lecture.id} ({lecture.title}) 처리 실패: {e}")
+                continue
+
+            processed += 1
+            self.stdout.write(
+                f"강의 {lecture.id} ({lecture.title}): {lecture.duration}분, "
+                f"{lecture.video_width}x{lecture.video_height}, {lecture.video_bitrate}kbps"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"동영상 처리 완료: 성공 {processed}건, 실패 {failed}건")
+        )
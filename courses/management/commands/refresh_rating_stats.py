@@ -0,0 +1,36 @@
+from django.core.management import BaseCommand
+
+from courses.catalog import bump_catalog_version
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = "기존 리뷰로부터 과정별 리뷰 수, 평점 합계, 평점 분포를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            type=int,
+            action="append",
+            dest="course_ids",
+            help="재계산할 과정 ID (여러 번 지정 가능, 생략 시 전체 과정)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 저장할 과정 수",
+        )
+
+    def handle(self, *args, **options):
+        courses = Course.objects.all()
+        if options["course_ids"]:
+            courses = courses.filter(id__in=options["course_ids"])
+
+        updated = Course.refresh_rating_stats(courses, batch_size=options["batch_size"])
+        # bulk_update는 시그널을 보내지 않으므로 카탈로그 캐시를 직접 무효화
+        bump_catalog_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"과정 {updated}개의 평점 집계를 재계산했습니다.")
+        )
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:59
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_curriculum_counts(apps, schema_editor):
+    """기존 과정의 강의/미션/시험 과목 수 집계 채우기"""
+    Course = apps.get_model("courses", "Course")
+
+    for course in Course.objects.annotate(
+        lectures=Count("subjects__lectures", distinct=True),
+        missions=Count(
+            "subjects__lectures",
+            filter=Q(subjects__lectures__lecture_type="mission"),
+            distinct=True,
+        ),
+        exams=Count(
+            "subjects",
+            filter=Q(subjects__subject_type__in=["midterm", "final"]),
+            distinct=True,
+        ),
+    ):
+        Course.objects.filter(id=course.id).update(
+            lecture_count=course.lectures,
+            mission_count=course.missions,
+            exam_count=course.exams,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0004_alter_course_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="exam_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="중간/기말고사 과목 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="lecture_count",
+            field=models.PositiveIntegerField(default=0, help_text="전체 강의 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="mission_count",
+            field=models.PositiveIntegerField(default=0, help_text="미션 강의 수"),
+        ),
+        migrations.RunPython(backfill_curriculum_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_course_exam_count_course_lecture_count_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="content_updated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:03
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_rating_stats(apps, schema_editor):
+    """기존 리뷰로 과정의 평점 집계 채우기"""
+    Course = apps.get_model("courses", "Course")
+    CourseReview = apps.get_model("courses", "CourseReview")
+
+    stats = (
+        CourseReview.objects.values("course_id")
+        .annotate(
+            review_count=Count("id"),
+            rating_sum=Sum("rating"),
+            **{
+                f"rating_{rating}_count": Count("id", filter=Q(rating=rating))
+                for rating in range(1, 6)
+            },
+        )
+        .order_by()
+    )
+    for row in stats:
+        course_id = row.pop("course_id")
+        Course.objects.filter(id=course_id).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_deleteduserdata"),
+        ("courses", "0006_course_content_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="rating_1_count",
+            field=models.PositiveIntegerField(default=0, help_text="1점 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_2_count",
+            field=models.PositiveIntegerField(default=0, help_text="2점 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_3_count",
+            field=models.PositiveIntegerField(default=0, help_text="3점 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_4_count",
+            field=models.PositiveIntegerField(default=0, help_text="4점 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_5_count",
+            field=models.PositiveIntegerField(default=0, help_text="5점 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, help_text="리뷰 평점 합계"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="review_count",
+            field=models.PositiveIntegerField(default=0, help_text="리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="rating_avg",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        review_count__gt=0,
+                        then=django.db.models.expressions.CombinedExpression(
+                            django.db.models.functions.comparison.Cast(
+                                "rating_sum", models.FloatField()
+                            ),
+                            "/",
+                            models.F("review_count"),
+                        ),
+                    ),
+                    default=models.Value(0.0),
+                ),
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                models.OrderBy(models.F("rating_avg"), descending=True),
+                models.OrderBy(models.F("created_at"), descending=True),
+                name="course_popular_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
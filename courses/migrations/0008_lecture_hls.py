@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0007_course_rating_1_count_course_rating_2_count_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lecture",
+            name="hls_manifest",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="hls_packaged_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
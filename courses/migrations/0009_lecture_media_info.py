@@ -0,0 +1,45 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0008_lecture_hls"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lecture",
+            name="duration_seconds",
+            field=models.FloatField(blank=True, help_text="동영상 길이(초)", null=True),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="media_processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="poster_image",
+            field=models.ImageField(blank=True, upload_to="lectures/posters/"),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="video_bitrate",
+            field=models.PositiveIntegerField(
+                blank=True, help_text="비트레이트(kbps)", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="video_height",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="video_width",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
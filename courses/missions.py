@@ -0,0 +1,86 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import MissionQuestion
+
+# 정답 키는 관리자가 문제를 수정할 때만 바뀌므로 길게 캐시하고, 수정 시 무효화
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def answer_key_cache_key(lecture_id):
+    return f"courses:answer_key:{lecture_id}"
+
+
+def build_answer_key(lecture_id):
+    """미션 강의의 정답 키 생성 (문제 id -> 정답 번호)"""
+    return dict(
+        MissionQuestion.objects.filter(lecture_id=lecture_id).values_list(
+            "id", "correct_answer"
+        )
+    )
+
+
+def get_answer_key(lecture_id):
+    """캐시된 미션 강의 정답 키 반환 (없으면 생성 후 캐시)"""
+    key = answer_key_cache_key(lecture_id)
+    answer_key = cache.get(key)
+    if answer_key is None:
+        answer_key = build_answer_key(lecture_id)
+        cache.set(key, answer_key, ANSWER_KEY_CACHE_TIMEOUT)
+    return answer_key
+
+
+def invalidate_answer_key(lecture_id):
+    """미션 강의 정답 키 캐시 무효화"""
+    cache.delete(answer_key_cache_key(lecture_id))
+
+
+def save_mission_questions(lecture, questions_data, replace=False):
+    """관리자 화면에서 전달된 문제 목록을 미션 강의에 저장
+
+    questions_data는 문제 내용, 보기 5개, 정답 번호, 순서를 담은 dict 목록입니다.
+    replace가 True이면 기존 문제를 모두 지우고 새로 저장합니다.
+    한 번의 bulk_create로 저장하고, 커밋 후 정답 키 캐시를 무효화합니다.
+    """
+    questions = [
+        MissionQuestion(
+            lecture=lecture,
+            question_text=q_data.get("question_text", q_data.get("text", "")),
+            option1=q_data["options"][0],
+            option2=q_data["options"][1],
+            option3=q_data["options"][2],
+            option4=q_data["options"][3],
+            option5=q_data["options"][4],
+            correct_answer=q_data["correct_answer"],
+            order_index=q_data.get("order_index", i + 1),
+        )
+        for i, q_data in enumerate(questions_data)
+    ]
+
+    with transaction.atomic():
+        if replace:
+            MissionQuestion.objects.filter(lecture=lecture).delete()
+        MissionQuestion.objects.bulk_create(questions)
+        transaction.on_commit(lambda: invalidate_answer_key(lecture.id))
+
+    return questions
+
+
+def grade_answers(answer_key, user_answers):
+    """사용자 답안을 정답 키와 비교하여 채점
+
+    user_answers는 {문제 id(문자열): 선택 번호} 형식의 제출 답안입니다.
+    정답 키에 있는 문제(해당 강의의 문제)만 채점하며,
+    반환 형식은 {문제 id: 정답 여부}입니다.
+    """
+    answers = {}
+    for question_id, answer in user_answers.items():
+        try:
+            answers[int(question_id)] = int(answer)
+        except (TypeError, ValueError):
+            continue
+
+    return {
+        question_id: answers.get(question_id) == correct_answer
+        for question_id, correct_answer in answer_key.items()
+    }
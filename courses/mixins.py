@@ -0,0 +1,35 @@
+from django.contrib import messages
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+class AnonymousPageCacheMixin:
+    """
+    비로그인 방문자용 페이지 캐시 Mixin.
+
+    비로그인 방문자에게 보여주는 페이지는 모두 동일하므로 렌더링된 HTML을 캐시합니다.
+    캐시 키는 get_anonymous_cache_key()에서 데이터 변경 시 바뀌도록 만들어야 합니다.
+    로그인 사용자이거나 표시할 메시지가 남아 있는 요청은 캐시하지 않습니다.
+    """
+
+    anonymous_cache_timeout = 60 * 60
+
+    def get_anonymous_cache_key(self):
+        raise NotImplementedError(
+            "AnonymousPageCacheMixin을 사용하는 뷰는 get_anonymous_cache_key()를 구현해야 합니다."
+        )
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated or messages.get_messages(request):
+            return super().get(request, *args, **kwargs)
+
+        cache_key = self.get_anonymous_cache_key()
+        content = cache.get(cache_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.render()
+            cache.set(cache_key, response.content, self.anonymous_cache_timeout)
+        return response
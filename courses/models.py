@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Cast
+from django.utils import timezone
 from accounts.models import User, InstructorProfile
 
 
@@ -32,16 +35,160 @@ class Course(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 커리큘럼 구성 집계 (과목/강의 변경 시그널로 갱신)
+    lecture_count = models.PositiveIntegerField(default=0, help_text="전체 강의 수")
+    mission_count = models.PositiveIntegerField(default=0, help_text="미션 강의 수")
+    exam_count = models.PositiveIntegerField(
+        default=0, help_text="중간/기말고사 과목 수"
+    )
+    # 커리큘럼/리뷰가 마지막으로 변경된 시각 (상세 페이지 캐시 키에 사용)
+    content_updated_at = models.DateTimeField(null=True, blank=True)
+    # 리뷰 평점 집계 (리뷰 작성/수정/삭제 시 원자적으로 갱신)
+    review_count = models.PositiveIntegerField(default=0, help_text="리뷰 수")
+    rating_sum = models.PositiveIntegerField(default=0, help_text="리뷰 평점 합계")
+    rating_1_count = models.PositiveIntegerField(default=0, help_text="1점 리뷰 수")
+    rating_2_count = models.PositiveIntegerField(default=0, help_text="2점 리뷰 수")
+    rating_3_count = models.PositiveIntegerField(default=0, help_text="3점 리뷰 수")
+    rating_4_count = models.PositiveIntegerField(default=0, help_text="4점 리뷰 수")
+    rating_5_count = models.PositiveIntegerField(default=0, help_text="5점 리뷰 수")
+    # 평균 평점 (DB에서 계산되어 저장되므로 인기 과정 정렬에 인덱스 사용 가능)
+    rating_avg = models.GeneratedField(
+        expression=Case(
+            When(
+                review_count__gt=0,
+                then=Cast("rating_sum", models.FloatField()) / F("review_count"),
+            ),
+            default=Value(0.0),
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+    )
+
+    RATING_VALUES = (1, 2, 3, 4, 5)
+
+    class Meta:
+        indexes = [
+            # 인기 과정 목록 (평균 평점순, 최신순)
+            models.Index(
+                F("rating_avg").desc(),
+                F("created_at").desc(),
+                name="course_popular_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def refresh_curriculum_counts(cls, course_id):
+        """과정의 강의/미션/시험 과목 수 집계를 다시 계산하여 저장"""
+        lecture_counts = Lecture.objects.filter(subject__course_id=course_id).aggregate(
+            lectures=Count("id"),
+            missions=Count("id", filter=Q(lecture_type="mission")),
+        )
+        exam_count = Subject.objects.filter(
+            course_id=course_id, subject_type__in=Subject.EXAM_TYPES
+        ).count()
+
+        cls.objects.filter(id=course_id).update(
+            lecture_count=lecture_counts["lectures"],
+            mission_count=lecture_counts["missions"],
+            exam_count=exam_count,
+        )
+
+    @classmethod
+    def touch_content(cls, course_id):
+        """과정의 커리큘럼/리뷰 변경 시각 갱신"""
+        cls.objects.filter(id=course_id).update(content_updated_at=timezone.now())
+
+    @classmethod
+    def apply_rating_change(cls, course_id, added=None, removed=None):
+        """리뷰 평점 변경을 과정의 평점 집계에 반영
+
+        added는 새로 반영할 평점, removed는 빼야 할 평점입니다.
+        리뷰 수정은 이전 평점을 removed로, 새 평점을 added로 전달합니다.
+        F() 표현식으로 갱신하므로 동시에 여러 리뷰가 작성되어도 집계가 어긋나지 않습니다.
+        """
+        count_delta = 0
+        sum_delta = 0
+        histogram_delta = {}
+        if added is not None:
+            count_delta += 1
+            sum_delta += added
+            histogram_delta[added] = histogram_delta.get(added, 0) + 1
+        if removed is not None:
+            count_delta -= 1
+            sum_delta -= removed
+            histogram_delta[removed] = histogram_delta.get(removed, 0) - 1
+
+        updates = {}
+        if count_delta:
+            updates["review_count"] = F("review_count") + count_delta
+        if sum_delta:
+            updates["rating_sum"] = F("rating_sum") + sum_delta
+        for rating, delta in histogram_delta.items():
+            if delta:
+                field = f"rating_{rating}_count"
+                updates[field] = F(field) + delta
+
+        if updates:
+            cls.objects.filter(id=course_id).update(**updates)
+
+    @classmethod
+    def refresh_rating_stats(cls, queryset=None, batch_size=500):
+        """리뷰 테이블로부터 과정의 평점 집계를 다시 계산하여 저장
+
+        과정별로 한 번에 집계한 뒤 bulk_update로 저장합니다.
+        저장한 과정 수를 반환합니다.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        histogram_fields = [f"rating_{rating}_count" for rating in cls.RATING_VALUES]
+        stats = {
+            row["course_id"]: row
+            for row in CourseReview.objects.filter(course__in=queryset)
+            .values("course_id")
+            .annotate(
+                review_count=Count("id"),
+                rating_sum=Sum("rating"),
+                **{
+                    f"rating_{rating}_count": Count("id", filter=Q(rating=rating))
+                    for rating in cls.RATING_VALUES
+                },
+            )
+            .order_by()
+        }
+
+        fields = ["review_count", "rating_sum", *histogram_fields]
+        courses = []
+        updated = 0
+        for course in queryset.only("id", *fields).iterator(chunk_size=batch_size):
+            row = stats.get(course.id, {})
+            for field in fields:
+                setattr(course, field, row.get(field) or 0)
+            courses.append(course)
+            if len(courses) >= batch_size:
+                cls.objects.bulk_update(courses, fields)
+                updated += len(courses)
+                courses = []
+        if courses:
+            cls.objects.bulk_update(courses, fields)
+            updated += len(courses)
+        return updated
+
     def average_rating(self):
-        """과정의 평균 평점 계산"""
-        reviews = self.reviews.all()
-        if not reviews:
+        """과정의 평균 평점 (저장된 평점 집계로 계산)"""
+        if not self.review_count:
             return 0
-        return sum(review.rating for review in reviews) / len(reviews)
+        return self.rating_sum / self.review_count
+
+    def rating_histogram(self):
+        """평점별 리뷰 수 (5점부터 1점 순서)"""
+        return [
+            (rating, getattr(self, f"rating_{rating}_count"))
+            for rating in reversed(self.RATING_VALUES)
+        ]
 
     # TODO:
     # estimated_time을 @property로 변환
@@ -60,6 +207,9 @@ class Subject(models.Model):
         ("final", "기말고사"),
     ]
 
+    # 프로젝트 제출로 통과 여부를 판단하는 시험 과목 유형
+    EXAM_TYPES = ("midterm", "final")
+
     course = models.ForeignKey(
         Course, on_delete=models.CASCADE, related_name="subjects"
     )
@@ -97,7 +247,21 @@ class Lecture(models.Model):
         max_length=20, choices=LECTURE_TYPE_CHOICES, db_index=True
     )
     video_file = models.FileField(upload_to="videos/", null=True, blank=True)
+    # HLS 마스터 재생목록 경로 (미디어 폴더 기준, package_hls 명령으로 생성)
+    hls_manifest = models.CharField(max_length=255, blank=True)
+    hls_packaged_at = models.DateTimeField(null=True, blank=True)
     duration = models.IntegerField(help_text="동영상 길이(분)", null=True, blank=True)
+    # 업로드 후 백그라운드 작업(process_lecture_media)으로 채우는 동영상 정보
+    duration_seconds = models.FloatField(
+        help_text="동영상 길이(초)", null=True, blank=True
+    )
+    video_width = models.PositiveIntegerField(null=True, blank=True)
+    video_height = models.PositiveIntegerField(null=True, blank=True)
+    video_bitrate = models.PositiveIntegerField(
+        help_text="비트레이트(kbps)", null=True, blank=True
+    )
+    poster_image = models.ImageField(upload_to="lectures/posters/", blank=True)
+    media_processed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -114,50 +278,36 @@ class Lecture(models.Model):
         반환 형식: (유형, 객체)
         유형은 'video_lecture', 'mission', 'project', 'completed' 중 하나입니다.
         """
-        subject = self.subject
-        course = subject.course
-
-        # 같은 과목 내 다음 강의 찾기
-        next_lecture = (
-            Lecture.objects.filter(subject=subject, order_index__gt=self.order_index)
-            .order_by("order_index")
-            .first()
+        from .curriculum import (
+            get_course_outline,
+            find_item_after_lecture,
+            load_learning_item,
         )
 
-        if next_lecture:
-            # 같은 과목 내 다음 강의가 있으면 해당 강의 반환
-            if next_lecture.lecture_type == "video":
-                return ("video_lecture", next_lecture)
-            else:  # mission
-                return ("mission", next_lecture)
-
-        # 다음 과목 찾기
-        next_subject = (
-            Subject.objects.filter(course=course, order_index__gt=subject.order_index)
-            .order_by("order_index")
-            .first()
-        )
-
-        if next_subject:
-            # 중간고사/기말고사 과목인 경우
-            if next_subject.subject_type in ["midterm", "final"]:
-                return ("project", next_subject)
+        # 캐시된 과정 목차에서 현재 강의 다음 항목 찾기
+        course_id = self.subject.course_id
+        outline = get_course_outline(course_id)
+        next_item = find_item_after_lecture(outline, self.id)
 
-            # 일반 과목인 경우 첫 번째 강의 찾기
-            first_lecture = (
-                Lecture.objects.filter(subject=next_subject)
-                .order_by("order_index")
-                .first()
-            )
+        # 다음 학습 항목이 없으면 완료 상태로 과정 반환
+        return load_learning_item(course_id, next_item)
 
-            if first_lecture:
-                if first_lecture.lecture_type == "video":
-                    return ("video_lecture", first_lecture)
-                else:  # mission
-                    return ("mission", first_lecture)
+    def request_media_processing(self):
+        """동영상 정보 추출/포스터 생성 작업 등록 (커밋 후 등록)
 
-        # 다음 학습 항목이 없으면 완료 상태로 과정 반환
-        return ("completed", course)
+        같은 파일에 대한 작업이 이미 대기 중이면 중복 등록하지 않으며,
+        파일이 바뀌면 새 파일에 대한 작업이 따로 등록됩니다.
+        """
+        from jobs.models import Job
+        from .video import PROCESS_LECTURE_MEDIA_JOB
+
+        if not self.video_file:
+            return
+        Job.enqueue_on_commit(
+            PROCESS_LECTURE_MEDIA_JOB,
+            {"lecture_id": self.id, "video_file": self.video_file.name},
+            dedupe_key=f"{PROCESS_LECTURE_MEDIA_JOB}:{self.id}:{self.video_file.name}",
+        )
 
 
 class MissionQuestion(models.Model):
@@ -243,5 +393,15 @@ class CourseReview(models.Model):
             "course",
         ]  # 한 사용자는 하나의 과정에 하나의 리뷰만 작성 가능
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 읽은 과정/평점을 기억하여 수정 시 평점 집계에서 이전 값을 뺄 수 있게 함"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (
+            instance.__dict__.get("course_id"),
+            instance.__dict__.get("rating"),
+        )
+        return instance
+
     def __str__(self):
         return f"{self.user.username}의 {self.course.title} 리뷰"
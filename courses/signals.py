@@ -0,0 +1,125 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+import logging
+
+from .catalog import bump_catalog_version
+from .curriculum import invalidate_course_outline
+from .missions import invalidate_answer_key
+from .models import Course, Subject, Lecture, CourseReview, MissionQuestion
+from learning.models import Enrollment
+
+logger = logging.getLogger("django")
+
+
+def handle_curriculum_change(course_id):
+    """커리큘럼 변경 시 목차 캐시 무효화 및 강의 수 집계 갱신"""
+    invalidate_course_outline(course_id)
+    Course.refresh_curriculum_counts(course_id)
+    Course.touch_content(course_id)
+
+
+def is_deleted_directly(origin, model):
+    """삭제가 model 자체에서 시작되었는지 (상위 객체 삭제로 함께 삭제되는 경우 False)"""
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is model
+
+
+def recompute_enrollment_progress(course_id):
+    """강의/과목 삭제로 함께 삭제된 진행 기록을 수강 정보의 진행 상황 집계에 반영
+
+    집계는 증가만 하므로, 완료한 강의가 삭제된 뒤 새 강의가 추가되면
+    새 강의를 듣지 않아도 수료 조건을 충족한 것으로 보이는 문제를 막습니다.
+    """
+    Enrollment.recompute_progress_counters(
+        Enrollment.objects.filter(course_id=course_id)
+    )
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def update_curriculum_on_subject_change(sender, instance, origin=None, **kwargs):
+    """과목 추가/수정/삭제 시 커리큘럼 정보 갱신"""
+    handle_curriculum_change(instance.course_id)
+    if origin is not None and is_deleted_directly(origin, Subject):
+        recompute_enrollment_progress(instance.course_id)
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_delete, sender=Lecture)
+def update_curriculum_on_lecture_change(sender, instance, origin=None, **kwargs):
+    """강의 추가/수정/삭제 시 커리큘럼 정보 갱신"""
+    try:
+        course_id = Subject.objects.values_list("course_id", flat=True).get(
+            id=instance.subject_id
+        )
+    except Subject.DoesNotExist:
+        # 과목과 함께 삭제되는 경우 과목 시그널에서 이미 갱신됨
+        return
+    handle_curriculum_change(course_id)
+    # 과목/과정과 함께 삭제되는 경우는 과목 시그널에서 한 번만 재계산
+    if origin is not None and is_deleted_directly(origin, Lecture):
+        recompute_enrollment_progress(course_id)
+
+
+@receiver(post_save, sender=CourseReview)
+def apply_rating_on_review_save(sender, instance, created, **kwargs):
+    """리뷰 작성/수정 시 과정의 평점 집계 갱신
+
+    수정은 DB에서 읽은 이전 평점을 빼고 새 평점을 더합니다.
+    이전 평점을 알 수 없는 경우(DB에서 읽지 않은 객체를 저장)에는 다시 집계합니다.
+    """
+    loaded = getattr(instance, "_loaded_rating", None)
+    if created:
+        Course.apply_rating_change(instance.course_id, added=instance.rating)
+    elif loaded is None or None in loaded:
+        Course.refresh_rating_stats(Course.objects.filter(id=instance.course_id))
+    else:
+        previous_course_id, previous_rating = loaded
+        if previous_course_id == instance.course_id:
+            Course.apply_rating_change(
+                instance.course_id, added=instance.rating, removed=previous_rating
+            )
+        else:
+            Course.apply_rating_change(previous_course_id, removed=previous_rating)
+            Course.apply_rating_change(instance.course_id, added=instance.rating)
+    # 같은 객체를 다시 저장해도 중복 반영되지 않도록 저장한 값을 기억
+    instance._loaded_rating = (instance.course_id, instance.rating)
+
+
+@receiver(post_delete, sender=CourseReview)
+def apply_rating_on_review_delete(sender, instance, **kwargs):
+    """리뷰 삭제 시 과정의 평점 집계에서 제외
+
+    회원 탈퇴나 관리자 화면 등에서 함께 삭제되는 리뷰도 반영됩니다.
+    """
+    Course.apply_rating_change(instance.course_id, removed=instance.rating)
+
+
+@receiver(post_save, sender=CourseReview)
+@receiver(post_delete, sender=CourseReview)
+def touch_course_on_review_change(sender, instance, **kwargs):
+    """리뷰 작성/수정/삭제 시 과정 상세 페이지 캐시 갱신"""
+    Course.touch_content(instance.course_id)
+    # 평점 집계는 리뷰와 같은 트랜잭션에서 갱신되므로 커밋 후 버전 증가
+    transaction.on_commit(bump_catalog_version)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def bump_catalog_on_course_change(sender, instance, **kwargs):
+    """과정 추가/수정/삭제 시 카탈로그 캐시 버전 증가"""
+    transaction.on_commit(bump_catalog_version)
+
+
+@receiver(post_save, sender=MissionQuestion)
+@receiver(post_delete, sender=MissionQuestion)
+def invalidate_answer_key_on_question_change(sender, instance, **kwargs):
+    """미션 문제 추가/수정/삭제 시 정답 키 캐시 무효화
+
+    관리자 화면의 일괄 저장(bulk_create)은 시그널을 보내지 않으므로
+    save_mission_questions()에서 직접 무효화합니다.
+    """
+    lecture_id = instance.lecture_id
+    transaction.on_commit(lambda: invalidate_answer_key(lecture_id))
@@ -0,0 +1,22 @@
+import logging
+
+from jobs.registry import register
+from .models import Lecture
+from .video import PROCESS_LECTURE_MEDIA_JOB, process_lecture_media
+
+logger = logging.getLogger("django")
+
+
+@register(PROCESS_LECTURE_MEDIA_JOB)
+def process_lecture_media_job(payload):
+    """업로드된 강의 동영상의 정보 추출 및 포스터 생성 작업"""
+    lecture = Lecture.objects.filter(id=payload["lecture_id"]).first()
+    if lecture is None or lecture.video_file.name != payload.get("video_file"):
+        # 작업 등록 후 강의가 삭제되었거나 동영상이 바뀐 경우
+        return
+
+    if process_lecture_media(lecture):
+        logger.info(
+            f"Processed media for lecture {lecture.id} "
+            f"({lecture.duration_seconds:.0f}s, {lecture.video_width}x{lecture.video_height})"
+        )
@@ -0,0 +1,339 @@
+from datetime import datetime
+import json
+import logging
+import math
+import os
+import posixpath
+import shutil
+import subprocess
+import tempfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+logger = logging.getLogger("django")
+
+# HLS 화질 설정: (이름, 세로 해상도, 영상 비트레이트(kbps), 음성 비트레이트(kbps))
+HLS_RENDITIONS = [
+    ("360p", 360, 800, 96),
+    ("540p", 540, 1600, 128),
+    ("720p", 720, 2800, 128),
+    ("1080p", 1080, 5000, 192),
+]
+HLS_SEGMENT_SECONDS = 6
+# HLS 파일 저장 위치 (미디어 폴더 기준, videos/ 아래이므로 보호된 미디어로 제공)
+HLS_ROOT = "videos/hls"
+HLS_MASTER_PLAYLIST = "master.m3u8"
+HLS_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".ts": "video/mp2t",
+}
+
+# 업로드 후처리(동영상 정보 추출, 포스터 생성) 작업 이름
+PROCESS_LECTURE_MEDIA_JOB = "courses.process_lecture_media"
+# 포스터 이미지를 추출할 위치(초)와 최대 세로 해상도
+POSTER_OFFSET_SECONDS = 5
+POSTER_MAX_HEIGHT = 720
+
+
+class VideoProcessingError(Exception):
+    """동영상 처리(ffmpeg/ffprobe) 실패"""
+
+
+def find_binary(name):
+    """ffmpeg/ffprobe 실행 파일 경로 (없으면 None)
+
+    settings.FFMPEG_BINARY / FFPROBE_BINARY에 지정한 경로를 먼저 사용합니다.
+    """
+    return shutil.which(getattr(settings, f"{name.upper()}_BINARY", None) or name)
+
+
+def _run(command, timeout=None):
+    try:
+        return subprocess.run(
+            command, capture_output=True, text=True, check=True, timeout=timeout
+        )
+    except subprocess.CalledProcessError as e:
+        raise VideoProcessingError(
+            f"{os.path.basename(command[0])} 실행 실패: {e.stderr.strip()[-500:]}"
+        )
+    except subprocess.TimeoutExpired:
+        raise VideoProcessingError(
+            f"{os.path.basename(command[0])} 실행 시간 초과 ({timeout}초)"
+        )
+
+
+def probe_video(path):
+    """동영상 정보 조회 (ffprobe)
+
+    반환 형식: {"width": 가로, "height": 세로, "duration": 길이(초),
+               "bitrate": 전체 비트레이트(kbps), "has_audio": 음성 여부}
+    """
+    ffprobe = find_binary("ffprobe")
+    if not ffprobe:
+        raise VideoProcessingError("ffprobe를 찾을 수 없습니다.")
+
+    result = _run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-show_entries",
+            "stream=codec_type,width,height:format=duration,bit_rate",
+            "-of",
+            "json",
+            path,
+        ],
+        timeout=60,
+    )
+    info = json.loads(result.stdout or "{}")
+    streams = info.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        raise VideoProcessingError("영상 스트림이 없는 파일입니다.")
+
+    container = info.get("format", {})
+    bitrate = container.get("bit_rate")
+    return {
+        "width": video.get("width"),
+        "height": video.get("height"),
+        "duration": float(container.get("duration") or 0),
+        "bitrate": int(bitrate) // 1000 if bitrate and bitrate.isdigit() else None,
+        "has_audio": any(s.get("codec_type") == "audio" for s in streams),
+    }
+
+
+def extract_poster(path, duration=None):
+    """동영상에서 포스터(JPEG) 이미지 한 장을 추출해 bytes로 반환
+
+    POSTER_OFFSET_SECONDS 위치의 프레임을 사용하며, 영상이 더 짧으면 중간 프레임을 사용합니다.
+    """
+    ffmpeg = find_binary("ffmpeg")
+    if not ffmpeg:
+        raise VideoProcessingError("ffmpeg를 찾을 수 없습니다.")
+
+    offset = POSTER_OFFSET_SECONDS
+    if duration:
+        offset = min(offset, duration / 2)
+
+    with tempfile.TemporaryDirectory(prefix="poster-") as work_dir:
+        output = os.path.join(work_dir, "poster.jpg")
+        _run(
+            [
+                ffmpeg,
+                "-y",
+                "-v",
+                "error",
+                # 입력 앞에 -ss를 두어 키프레임 단위로 빠르게 탐색
+                "-ss",
+                f"{offset:.3f}",
+                "-i",
+                path,
+                "-frames:v",
+                "1",
+                "-vf",
+                f"scale=-2:'min({POSTER_MAX_HEIGHT},ih)'",
+                "-q:v",
+                "3",
+                output,
+            ],
+            timeout=120,
+        )
+        if not os.path.exists(output):
+            raise VideoProcessingError("포스터 이미지를 추출하지 못했습니다.")
+        with open(output, "rb") as f:
+            return f.read()
+
+
+def process_lecture_media(lecture):
+    """강의 동영상의 길이/해상도/비트레이트를 추출하고 포스터 이미지를 생성해 저장
+
+    처리 중에 동영상이 다른 파일로 바뀌었으면 결과를 저장하지 않고 False를 반환합니다.
+    (바뀐 파일에 대한 작업이 따로 등록되어 있음)
+    """
+    if not lecture.video_file:
+        raise VideoProcessingError("동영상 파일이 없습니다.")
+
+    source = lecture.video_file.path
+    video_name = lecture.video_file.name
+    info = probe_video(source)
+    poster = extract_poster(source, info["duration"])
+
+    poster_field = lecture.poster_image
+    poster_name = default_storage.save(
+        poster_field.field.generate_filename(lecture, f"lecture_{lecture.id}.jpg"),
+        ContentFile(poster),
+    )
+    previous_poster = poster_field.name
+
+    duration = info["duration"] or None
+    fields = {
+        "duration_seconds": duration,
+        "video_width": info["width"],
+        "video_height": info["height"],
+        "video_bitrate": info["bitrate"],
+        "poster_image": poster_name,
+        "media_processed_at": timezone.now(),
+    }
+    if duration:
+        # 강의 목록 등에 표시하는 분 단위 길이 (올림)
+        fields["duration"] = max(1, math.ceil(duration / 60))
+
+    # 커리큘럼 변경 시그널이 발생하지 않도록 update 사용
+    updated = (
+        type(lecture)
+        .objects.filter(id=lecture.id, video_file=video_name)
+        .update(**fields)
+    )
+    if not updated:
+        default_storage.delete(poster_name)
+        return False
+
+    for name, value in fields.items():
+        setattr(lecture, name, value)
+    if previous_poster and previous_poster != poster_name:
+        default_storage.delete(previous_poster)
+    return True
+
+
+def select_renditions(source_height, renditions=None):
+    """원본보다 높은 화질은 제외한 HLS 화질 목록 (원본이 더 작으면 가장 낮은 화질 하나)"""
+    renditions = renditions or HLS_RENDITIONS
+    if not source_height:
+        return renditions
+    selected = [r for r in renditions if r[1] <= source_height]
+    return selected or renditions[:1]
+
+
+def _rendition_command(ffmpeg, source, output_dir, rendition, segment_seconds):
+    name, height, video_kbps, audio_kbps = rendition
+    return [
+        ffmpeg,
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        source,
+        "-map",
+        "0:v:0",
+        # 음성이 없는 파일도 처리할 수 있도록 선택적으로 매핑
+        "-map",
+        "0:a:0?",
+        "-vf",
+        f"scale=-2:{height}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-b:v",
+        f"{video_kbps}k",
+        "-maxrate",
+        f"{video_kbps * 107 // 100}k",
+        "-bufsize",
+        f"{video_kbps * 2}k",
+        # 세그먼트 경계마다 키프레임을 두어 화질 전환/탐색이 정확하도록 함
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{segment_seconds})",
+        "-sc_threshold",
+        "0",
+        "-c:a",
+        "aac",
+        "-b:a",
+        f"{audio_kbps}k",
+        "-ac",
+        "2",
+        "-f",
+        "hls",
+        "-hls_time",
+        str(segment_seconds),
+        "-hls_playlist_type",
+        "vod",
+        "-hls_segment_filename",
+        os.path.join(output_dir, name, "segment_%04d.ts"),
+        os.path.join(output_dir, name, "index.m3u8"),
+    ]
+
+
+def build_master_playlist(renditions, source_width=None, source_height=None):
+    """화질별 재생목록을 묶은 HLS 마스터 재생목록 내용"""
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+    for name, height, video_kbps, audio_kbps in renditions:
+        attributes = f"BANDWIDTH={(video_kbps * 107 // 100 + audio_kbps) * 1000}"
+        if source_width and source_height:
+            width = round(source_width * height / source_height / 2) * 2
+            attributes += f",RESOLUTION={width}x{height}"
+        lines.append(f"#EXT-X-STREAM-INF:{attributes}")
+        lines.append(f"{name}/index.m3u8")
+    return "\n".join(lines) + "\n"
+
+
+def package_hls(lecture, renditions=None, segment_seconds=HLS_SEGMENT_SECONDS):
+    """강의 동영상을 여러 화질의 HLS로 변환하고 마스터 재생목록 경로를 강의에 저장
+
+    임시 폴더에서 변환을 모두 마친 뒤 미디어 폴더로 옮기므로,
+    변환 중이거나 실패해도 기존 재생(이전 HLS 또는 원본 파일)에는 영향이 없습니다.
+    ffprobe가 있으면 원본보다 높은 화질은 만들지 않습니다.
+    반환: 만든 화질 이름 목록
+    """
+    ffmpeg = find_binary("ffmpeg")
+    if not ffmpeg:
+        raise VideoProcessingError("ffmpeg를 찾을 수 없습니다.")
+    if not lecture.video_file:
+        raise VideoProcessingError("동영상 파일이 없습니다.")
+
+    source = lecture.video_file.path
+    info = probe_video(source) if find_binary("ffprobe") else {}
+    renditions = select_renditions(info.get("height"), renditions)
+
+    # 다시 변환해도 이전 세그먼트가 캐시되지 않도록 변환 시각별 폴더 사용
+    lecture_dir = f"{HLS_ROOT}/{lecture.id}"
+    output_name = f"{lecture_dir}/{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+    with tempfile.TemporaryDirectory(prefix="hls-") as work_dir:
+        build_dir = os.path.join(work_dir, "hls")
+        for rendition in renditions:
+            os.makedirs(os.path.join(build_dir, rendition[0]))
+            logger.info(f"Packaging HLS {rendition[0]} for lecture {lecture.id}")
+            _run(
+                _rendition_command(
+                    ffmpeg, source, build_dir, rendition, segment_seconds
+                )
+            )
+
+        with open(os.path.join(build_dir, HLS_MASTER_PLAYLIST), "w") as f:
+            f.write(
+                build_master_playlist(renditions, info.get("width"), info.get("height"))
+            )
+
+        output_dir = default_storage.path(output_name)
+        os.makedirs(os.path.dirname(output_dir), exist_ok=True)
+        shutil.move(build_dir, output_dir)
+
+    previous = lecture.hls_manifest
+    lecture.hls_manifest = f"{output_name}/{HLS_MASTER_PLAYLIST}"
+    lecture.hls_packaged_at = timezone.now()
+    # 커리큘럼 변경 시그널이 발생하지 않도록 update 사용
+    type(lecture).objects.filter(id=lecture.id).update(
+        hls_manifest=lecture.hls_manifest, hls_packaged_at=lecture.hls_packaged_at
+    )
+
+    # 이전 변환 결과 삭제
+    if previous:
+        shutil.rmtree(
+            default_storage.path(posixpath.dirname(previous)), ignore_errors=True
+        )
+
+    return [rendition[0] for rendition in renditions]
+
+
+def hls_file_name(lecture, path):
+    """HLS 요청 경로를 미디어 파일 이름으로 변환 (강의의 HLS 폴더 밖이면 None)"""
+    if not lecture.hls_manifest:
+        return None
+    base = posixpath.dirname(lecture.hls_manifest)
+    name = posixpath.normpath(posixpath.join(base, path))
+    if not name.startswith(base + "/"):
+        return None
+    return name
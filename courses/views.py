@@ -1,6 +1,7 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Avg
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, Subquery
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.views import View
@@ -10,22 +11,52 @@ import logging
 
 from admin_portal.mixins import AdminRequiredMixin
 from learning.models import Enrollment, LectureProgress, ProjectSubmission
-from payments.models import Cart, CartItem
+from payments.models import CartItem
+from .catalog import (
+    CATALOG_CACHE_TIMEOUT,
+    catalog_cache_key,
+    get_banner_slides,
+    get_popular_courses,
+)
+from .mixins import AnonymousPageCacheMixin
 from .models import Course, Subject, Lecture, QnAQuestion, QnAAnswer, CourseReview
 
 logger = logging.getLogger("django")
 
 
-class CourseListView(ListView):
+def parse_rating(value):
+    """요청으로 받은 평점을 1~5 정수로 변환 (올바르지 않으면 None)"""
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        return None
+    return rating if rating in Course.RATING_VALUES else None
+
+
+class CourseListView(AnonymousPageCacheMixin, ListView):
     """과정 목록 페이지
 
     모든 강의 과정과 인기 과정을 표시합니다.
+    인기 과정과 배너는 카탈로그 버전별로 캐시하고,
+    비로그인 방문자에게는 페이지 전체를 캐시하여 쿼리 없이 응답합니다.
     """
 
     model = Course
     template_name = "courses/course_list.html"
     context_object_name = "all_courses"
     paginate_by = 12
+    anonymous_cache_timeout = CATALOG_CACHE_TIMEOUT
+
+    def get_anonymous_cache_key(self):
+        # 과정/리뷰가 바뀌면 카탈로그 버전이 올라가 키가 바뀜
+        # 임의의 page 값마다 캐시 항목이 생기지 않도록 양의 정수로 정규화 (그 외는 1)
+        page = self.request.GET.get(self.page_kwarg)
+        if page != "last":
+            try:
+                page = max(int(page), 1)
+            except (TypeError, ValueError):
+                page = 1
+        return catalog_cache_key("page", page)
 
     def get_queryset(self):
         # 전체 과정 (최신순)
@@ -34,46 +65,81 @@ class CourseListView(ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # 인기 과정 (각 과정의 평균 평점으로 정렬)
-        # 평점이 동일하거나 NULL인 경우, 최신 과정이 먼저 표시
-        popular_courses = Course.objects.annotate(
-            avg_rating=Avg("reviews__rating")
-        ).order_by("-avg_rating", "-created_at")[:6]
-
-        context["popular_courses"] = popular_courses
+        # 인기 과정 (저장된 평균 평점순, 평점이 같거나 리뷰가 없으면 최신순)
+        context["popular_courses"] = get_popular_courses()
 
         # 배너에 표시할 인기 과정 상위 3개
-        banner_courses = popular_courses[:3]
-
-        # 배너 슬라이드 데이터 생성
-        banner_slides = []
-        for course in banner_courses:
-            # 제목을 두 줄로 분리 (가정: 첫 번째 공백을 기준으로 나눔)
-            title_parts = course.title.split(" ", 1)
-            title_line1 = title_parts[0] if len(title_parts) > 0 else course.title
-            title_line2 = (
-                title_parts[1] if len(title_parts) > 1 else "나노 디그리로 완성하세요"
-            )
+        context["banner_slides"] = get_banner_slides()
 
-            slide = {
-                "titleLine1": title_line1,
-                "titleLine2": title_line2,
-                "description": course.short_description
-                or "실무에 필요한 기술을 습득하세요.",
-                "courseDetailUrl": f"/courses/detail/{course.id}/",
-                "course": course,
-            }
-            banner_slides.append(slide)
+        return context
 
-        context["banner_slides"] = banner_slides
 
-        return context
+def get_learner_state(user, course):
+    """과정 상세 페이지에 필요한 사용자별 학습 상태를 한 번에 조회
 
+    수강 여부와 장바구니 포함 여부는 서브쿼리로 한 번에 확인하고,
+    수강 중이라면 완료한 강의와 프로젝트 제출 현황을 각각 한 번씩만 조회합니다.
+    """
+    state = {
+        "enrollment_id": None,
+        "is_enrolled": False,
+        "is_in_cart": False,
+        "completed_lectures": set(),
+        "passed_projects": set(),
+        "submitted_projects": set(),
+    }
+    if not user.is_authenticated:
+        return state
+
+    flags = (
+        Course.objects.filter(id=course.id)
+        .annotate(
+            enrollment_id=Subquery(
+                Enrollment.objects.filter(user=user, course=OuterRef("pk")).values(
+                    "id"
+                )[:1]
+            ),
+            is_in_cart=Exists(
+                CartItem.objects.filter(cart__user=user, course=OuterRef("pk"))
+            ),
+        )
+        .values("enrollment_id", "is_in_cart")
+        .first()
+    )
+    if flags is None:
+        return state
+
+    state["enrollment_id"] = flags["enrollment_id"]
+    state["is_enrolled"] = flags["enrollment_id"] is not None
+    state["is_in_cart"] = flags["is_in_cart"]
+
+    if state["is_enrolled"]:
+        state["completed_lectures"] = set(
+            LectureProgress.objects.filter(
+                enrollment_id=flags["enrollment_id"], is_completed=True
+            ).values_list("lecture_id", flat=True)
+        )
 
-class CourseDetailView(DetailView):
+        # 통과한 프로젝트 / 제출했지만 아직 검토 중인 프로젝트
+        submissions = (
+            ProjectSubmission.objects.filter(enrollment_id=flags["enrollment_id"])
+            .order_by()
+            .values_list("subject_id", "is_passed", "reviewed_at")
+        )
+        for subject_id, is_passed, reviewed_at in submissions:
+            if is_passed:
+                state["passed_projects"].add(subject_id)
+            elif reviewed_at is None:
+                state["submitted_projects"].add(subject_id)
+
+    return state
+
+
+class CourseDetailView(AnonymousPageCacheMixin, DetailView):
     """과정 상세 페이지
 
     특정 과정의 정보, 커리큘럼, 리뷰를 표시합니다.
+    비로그인 방문자에게 보여주는 페이지는 모두 동일하므로 렌더링 결과를 캐시합니다.
     """
 
     model = Course
@@ -81,76 +147,64 @@ class CourseDetailView(DetailView):
     context_object_name = "course"
     pk_url_kwarg = "course_id"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        course = self.get_object()
+    def get_object(self, queryset=None):
+        # 캐시 키 생성 시 조회한 과정을 렌더링에서도 재사용
+        if getattr(self, "object", None) is None:
+            self.object = super().get_object(queryset)
+        return self.object
+
+    def get_anonymous_cache_key(self):
+        """비로그인 방문자용 페이지 캐시 키
 
-        # 과목 목록 가져오기
-        subjects = Subject.objects.filter(course=course).order_by("order_index")
+        과정 정보 수정(updated_at)이나 커리큘럼/리뷰 변경(content_updated_at)이
+        있으면 키가 바뀌므로 별도의 무효화가 필요 없습니다.
+        """
+        course = self.get_object()
+        content_stamp = (
+            course.content_updated_at.timestamp() if course.content_updated_at else 0
+        )
+        return (
+            f"courses:detail:anonymous:{course.id}:"
+            f"{course.updated_at.timestamp()}:{content_stamp}"
+        )
 
-        # 각 과목에 대한 강의 목록 가져오기
-        for subject in subjects:
-            subject.lecture_list = Lecture.objects.filter(subject=subject).order_by(
-                "order_index"
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        course = self.object
+
+        # 과목 목록과 과목별 강의 목록을 한 번에 가져오기
+        subjects = (
+            Subject.objects.filter(course=course)
+            .order_by("order_index")
+            .prefetch_related(
+                Prefetch(
+                    "lectures",
+                    queryset=Lecture.objects.order_by("order_index"),
+                    to_attr="lecture_list",
+                )
             )
+        )
 
         # 해당 과정에 대한 리뷰 가져오기
-        reviews = course.reviews.all().order_by("-created_at")
+        reviews = course.reviews.select_related("user").order_by("-created_at")
 
-        # 사용자가 이미 이 과정을 구매했는지 확인
-        is_enrolled = False
-        is_in_cart = False
-        enrollment = None
+        # 사용자가 이미 이 과정을 구매했는지, 학습 진행 상태는 어떤지 확인
+        learner_state = get_learner_state(self.request.user, course)
 
         if self.request.user.is_authenticated:
-            enrollment = Enrollment.objects.filter(
-                user=self.request.user, course=course
-            ).first()
-            is_enrolled = enrollment is not None
-
             logger.info(
-                f"User {self.request.user.username} viewing course detail: {course.title} (enrolled: {is_enrolled})"
+                f"User {self.request.user.username} viewing course detail: {course.title} (enrolled: {learner_state['is_enrolled']})"
             )
 
-            # 장바구니에 담겨있는지 확인
-            cart = Cart.objects.filter(user=self.request.user).first()
-            if cart:
-                is_in_cart = CartItem.objects.filter(cart=cart, course=course).exists()
-
-        # 완료된 강의 ID 목록
-        completed_lectures = []
-        if self.request.user.is_authenticated and is_enrolled:
-            completed_lectures = LectureProgress.objects.filter(
-                enrollment=enrollment,
-                is_completed=True,
-            ).values_list("lecture_id", flat=True)
-
-        # 프로젝트 제출/통과 상태 확인
-        passed_projects = []
-        submitted_projects = []
-
-        if self.request.user.is_authenticated and is_enrolled:
-            # 통과한 프로젝트
-            passed_projects = ProjectSubmission.objects.filter(
-                enrollment=enrollment, is_passed=True
-            ).values_list("subject_id", flat=True)
-
-            # 제출했지만 아직 검토 중인 프로젝트
-            submitted_projects = ProjectSubmission.objects.filter(
-                enrollment=enrollment,
-                is_passed=False,
-                reviewed_at__isnull=True,
-            ).values_list("subject_id", flat=True)
-
         context.update(
             {
                 "subjects": subjects,
                 "reviews": reviews,
-                "is_enrolled": is_enrolled,
-                "is_in_cart": is_in_cart,
-                "completed_lectures": completed_lectures,
-                "passed_projects": passed_projects,
-                "submitted_projects": submitted_projects,
+                "is_enrolled": learner_state["is_enrolled"],
+                "is_in_cart": learner_state["is_in_cart"],
+                "completed_lectures": learner_state["completed_lectures"],
+                "passed_projects": learner_state["passed_projects"],
+                "submitted_projects": learner_state["submitted_projects"],
             }
         )
 
@@ -166,29 +220,36 @@ class AddReviewView(LoginRequiredMixin, View):
     def post(self, request, course_id):
         course = get_object_or_404(Course, id=course_id)
 
-        rating = request.POST.get("rating")
+        rating = parse_rating(request.POST.get("rating"))
         content = request.POST.get("content")
 
-        # 이미 리뷰가 있는지 확인
-        existing_review = course.reviews.filter(user=request.user).first()
+        if rating is None:
+            messages.error(request, "평점을 선택해주세요.")
+            return redirect("courses:detail", course_id=course_id)
 
-        if existing_review:
-            # 기존 리뷰 업데이트
-            existing_review.rating = rating
-            existing_review.content = content
-            existing_review.save()
-            logger.info(
-                f"Review updated: user={request.user.username}, course={course.title}, rating={rating}"
-            )
-        else:
-            # 새 리뷰 생성
-            review = CourseReview.objects.create(
-                user=request.user, course=course, rating=rating, content=content
-            )
-            logger.info(
-                f"New review created: user={request.user.username}, course={course.title}, rating={rating}, id={review.id}"
+        with transaction.atomic():
+            # 이미 리뷰가 있는지 확인 (동시 수정 시 평점 집계가 어긋나지 않도록 잠금)
+            existing_review = (
+                course.reviews.select_for_update().filter(user=request.user).first()
             )
 
+            if existing_review:
+                # 기존 리뷰 업데이트 (평점 집계는 시그널에서 갱신)
+                existing_review.rating = rating
+                existing_review.content = content
+                existing_review.save()
+                logger.info(
+                    f"Review updated: user={request.user.username}, course={course.title}, rating={rating}"
+                )
+            else:
+                # 새 리뷰 생성
+                review = CourseReview.objects.create(
+                    user=request.user, course=course, rating=rating, content=content
+                )
+                logger.info(
+                    f"New review created: user={request.user.username}, course={course.title}, rating={rating}, id={review.id}"
+                )
+
         return redirect("courses:detail", course_id=course_id)
 
 
@@ -213,7 +274,7 @@ class UpdateReviewView(LoginRequiredMixin, View):
 
         try:
             data = json.loads(request.body)
-            rating = data.get("rating")
+            rating = parse_rating(data.get("rating"))
             content = data.get("content")
 
             if not rating or not content:
@@ -222,9 +283,12 @@ class UpdateReviewView(LoginRequiredMixin, View):
                     status=400,
                 )
 
-            review.rating = rating
-            review.content = content
-            review.save()
+            with transaction.atomic():
+                # 잠금 후 다시 읽은 이전 평점을 기준으로 시그널에서 평점 집계 갱신
+                review = CourseReview.objects.select_for_update().get(id=review.id)
+                review.rating = rating
+                review.content = content
+                review.save()
 
             logger.info(
                 f"Review {review_id} updated: user={request.user.username}, course={review.course.title}, rating={review.rating}"
@@ -268,8 +332,17 @@ class DeleteReviewView(LoginRequiredMixin, View):
             )
 
         try:
-            course_id = review.course.id  # 삭제 전에 course_id 저장
-            review.delete()
+            course_id = review.course_id  # 삭제 전에 course_id 저장
+            with transaction.atomic():
+                # 잠금 후 다시 읽은 평점을 시그널에서 평점 집계에서 뺌
+                # (이미 삭제된 리뷰라면 다시 빼지 않음)
+                locked = (
+                    CourseReview.objects.select_for_update()
+                    .filter(id=review.id)
+                    .first()
+                )
+                if locked is not None:
+                    locked.delete()
             return JsonResponse(
                 {
                     "success": True,
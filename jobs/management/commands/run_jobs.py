@@ -0,0 +1,165 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from jobs.models import Job
+from jobs.registry import autodiscover, get_handler, registered_names
+
+logger = logging.getLogger("django")
+
+
+class Command(BaseCommand):
+    help = "DB 작업 큐의 백그라운드 작업을 처리하는 워커를 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 처리한 뒤 종료",
+        )
+        parser.add_argument(
+            "--name",
+            action="append",
+            dest="names",
+            help="처리할 작업 종류 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="처리할 작업이 없을 때 대기할 시간(초) (기본 1초)",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="지정한 개수만큼 처리한 뒤 종료 (기본 0: 제한 없음)",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=int,
+            default=600,
+            help="처리 중 작업의 잠금이 이 시간(초) 이상 갱신되지 않으면 다시 대기 상태로 복구 (기본 600초)",
+        )
+        parser.add_argument(
+            "--heartbeat",
+            type=float,
+            default=60,
+            help="작업 처리 중 잠금을 갱신할 간격(초), --stale-timeout보다 짧아야 함 (기본 60초)",
+        )
+
+    def handle(self, *args, **options):
+        if (
+            options["heartbeat"] <= 0
+            or options["heartbeat"] >= options["stale_timeout"]
+        ):
+            raise CommandError(
+                "--heartbeat는 0보다 크고 --stale-timeout보다 짧아야 합니다."
+            )
+
+        autodiscover()
+        self.heartbeat_interval = options["heartbeat"]
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+
+        self.stdout.write(
+            f"워커 {worker_id} 시작 (등록된 작업: {', '.join(registered_names())})"
+        )
+
+        processed = failed = 0
+        last_stale_check = 0
+        while not self.stopping:
+            close_old_connections()
+
+            if time.monotonic() - last_stale_check > 60:
+                Job.requeue_stale(options["stale_timeout"])
+                last_stale_check = time.monotonic()
+
+            job = Job.claim(worker_id, names=options["names"])
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+                continue
+
+            if self.run_job(job):
+                processed += 1
+            else:
+                failed += 1
+
+            if options["max_jobs"] and processed + failed >= options["max_jobs"]:
+                break
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"워커 {worker_id} 종료: 완료 {processed}건, 실패 {failed}건"
+            )
+        )
+
+    def request_stop(self, signum, frame):
+        # 처리 중인 작업은 마친 뒤 종료
+        self.stopping = True
+
+    def run_job(self, job):
+        handler = get_handler(job.name)
+        if handler is None:
+            job.attempts = job.max_attempts
+            job.mark_failed(f"등록되지 않은 작업입니다: {job.name}")
+            self.stderr.write(f"{job}: 등록되지 않은 작업")
+            return False
+
+        started = time.monotonic()
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self.heartbeat, args=(job, finished), daemon=True
+        )
+        heartbeat.start()
+        try:
+            handler(job.payload)
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.name}) failed")
+            error = e
+        else:
+            error = None
+        finally:
+            finished.set()
+            heartbeat.join()
+
+        if error is not None:
+            if job.mark_failed(error):
+                self.stderr.write(f"{job} 실패: {error}")
+            else:
+                self.stderr.write(
+                    f"{job} 실패: 다른 워커로 넘어간 작업이라 결과를 기록하지 않음"
+                )
+            return False
+
+        if not job.mark_done():
+            self.stderr.write(
+                f"{job}: 다른 워커로 넘어간 작업이라 결과를 기록하지 않음"
+            )
+            return False
+        self.stdout.write(f"{job} 완료 ({time.monotonic() - started:.2f}초)")
+        return True
+
+    def heartbeat(self, job, finished):
+        """작업이 끝날 때까지 주기적으로 잠금 시각 갱신 (별도 스레드, 별도 DB 연결)"""
+        try:
+            while not finished.wait(self.heartbeat_interval):
+                if not job.heartbeat():
+                    logger.warning(
+                        f"Job {job.id} lock was taken over, heartbeat stopped"
+                    )
+                    break
+        except Exception:
+            logger.exception(f"Job {job.id} heartbeat failed")
+        finally:
+            connection.close()
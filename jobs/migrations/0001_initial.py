@@ -0,0 +1,95 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:26
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Job",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        db_index=True, help_text="작업 종류", max_length=100
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(blank=True, default=dict, help_text="작업 인자"),
+                ),
+                (
+                    "dedupe_key",
+                    models.CharField(
+                        blank=True,
+                        help_text="같은 키의 작업은 대기/처리 중에 하나만 등록됨",
+                        max_length=200,
+                        null=True,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "처리 중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, help_text="시도 횟수"),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveIntegerField(default=3, help_text="최대 시도 횟수"),
+                ),
+                (
+                    "run_after",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, help_text="실행 가능 시각"
+                    ),
+                ),
+                ("locked_at", models.DateTimeField(blank=True, null=True)),
+                ("locked_by", models.CharField(blank=True, max_length=100)),
+                ("last_error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "백그라운드 작업",
+                "verbose_name_plural": "백그라운드 작업 목록",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "run_after"], name="job_status_run_after_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status__in", ["pending", "running"])),
+                        fields=("dedupe_key",),
+                        name="job_active_dedupe_key_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,230 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+logger = logging.getLogger("django")
+
+
+class Job(models.Model):
+    """백그라운드 작업 모델
+
+    별도의 메시지 브로커 없이 DB 테이블을 작업 큐로 사용합니다.
+    작업은 enqueue()로 등록하고, run_jobs 명령(워커)이 하나씩 가져가 처리합니다.
+    작업 처리 함수는 각 앱의 tasks.py에서 jobs.registry.register로 등록합니다.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "대기"),
+        ("running", "처리 중"),
+        ("done", "완료"),
+        ("failed", "실패"),
+    ]
+    ACTIVE_STATUSES = ["pending", "running"]
+
+    name = models.CharField(max_length=100, db_index=True, help_text="작업 종류")
+    payload = models.JSONField(default=dict, blank=True, help_text="작업 인자")
+    dedupe_key = models.CharField(
+        max_length=200,
+        null=True,
+        blank=True,
+        help_text="같은 키의 작업은 대기/처리 중에 하나만 등록됨",
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0, help_text="시도 횟수")
+    max_attempts = models.PositiveIntegerField(default=3, help_text="최대 시도 횟수")
+    run_after = models.DateTimeField(default=timezone.now, help_text="실행 가능 시각")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "백그라운드 작업"
+        verbose_name_plural = "백그라운드 작업 목록"
+        indexes = [
+            models.Index(
+                fields=["status", "run_after"], name="job_status_run_after_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=Q(status__in=["pending", "running"]),
+                name="job_active_dedupe_key_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.get_status_display()})"
+
+    @classmethod
+    def enqueue(
+        cls, name, payload=None, dedupe_key=None, run_after=None, max_attempts=3
+    ):
+        """작업 등록
+
+        dedupe_key가 같은 작업이 이미 대기/처리 중이면 새로 등록하지 않고 기존 작업을 반환합니다.
+        """
+        fields = {
+            "name": name,
+            "payload": payload or {},
+            "max_attempts": max_attempts,
+            "run_after": run_after or timezone.now(),
+        }
+        if dedupe_key is None:
+            return cls.objects.create(**fields)
+
+        active = cls.objects.filter(
+            dedupe_key=dedupe_key, status__in=cls.ACTIVE_STATUSES
+        )
+        job = active.first()
+        if job:
+            return job
+        try:
+            with transaction.atomic():
+                return cls.objects.create(dedupe_key=dedupe_key, **fields)
+        except IntegrityError:
+            # 동시에 같은 작업이 등록된 경우
+            return active.first()
+
+    @classmethod
+    def enqueue_bulk(cls, name, payloads, dedupe_keys=None, max_attempts=3):
+        """같은 종류의 작업 여러 개를 한 번에 등록
+
+        dedupe_keys를 주면 이미 대기/처리 중인 같은 키의 작업은 건너뜁니다.
+        """
+        now = timezone.now()
+        dedupe_keys = dedupe_keys or [None] * len(payloads)
+        jobs = [
+            cls(
+                name=name,
+                payload=payload,
+                dedupe_key=dedupe_key,
+                max_attempts=max_attempts,
+                run_after=now,
+            )
+            for payload, dedupe_key in zip(payloads, dedupe_keys)
+        ]
+        return cls.objects.bulk_create(jobs, ignore_conflicts=True)
+
+    @classmethod
+    def enqueue_on_commit(cls, name, payload=None, **kwargs):
+        """현재 트랜잭션이 커밋된 후 작업 등록 (롤백되면 등록하지 않음)"""
+        transaction.on_commit(lambda: cls.enqueue(name, payload, **kwargs))
+
+    @classmethod
+    def claim(cls, worker_id, names=None, batch_size=10):
+        """실행 가능한 작업 하나를 가져와 처리 중 상태로 변경
+
+        대기 작업 후보를 조회한 뒤 "대기 상태일 때만" 조건부 업데이트로 선점하므로,
+        여러 워커가 동시에 실행되어도 같은 작업을 중복 처리하지 않습니다.
+        최대 시도 횟수를 다 쓴 작업은 가져가지 않습니다.
+        가져올 작업이 없으면 None을 반환합니다.
+        """
+        now = timezone.now()
+        candidates = cls.objects.filter(
+            status="pending", run_after__lte=now, attempts__lt=F("max_attempts")
+        )
+        if names:
+            candidates = candidates.filter(name__in=names)
+
+        for job_id in candidates.order_by("run_after", "id").values_list(
+            "id", flat=True
+        )[:batch_size]:
+            claimed = cls.objects.filter(
+                id=job_id, status="pending", attempts__lt=F("max_attempts")
+            ).update(
+                status="running",
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=F("attempts") + 1,
+            )
+            if claimed:
+                return cls.objects.get(id=job_id)
+        return None
+
+    def _locked(self):
+        """이 워커가 아직 처리 중인 작업 (다른 워커로 넘어갔으면 비어 있음)"""
+        return Job.objects.filter(
+            id=self.id, status="running", locked_by=self.locked_by
+        )
+
+    def heartbeat(self):
+        """처리 중인 작업의 잠금 시각 갱신
+
+        워커는 작업을 처리하는 동안 주기적으로 호출해, 오래 걸리는 작업이
+        requeue_stale로 다른 워커에 넘어가지 않도록 합니다.
+        이미 다른 워커로 넘어간 작업이면 False를 반환합니다.
+        """
+        self.locked_at = timezone.now()
+        return bool(self._locked().update(locked_at=self.locked_at))
+
+    def mark_done(self):
+        """작업 완료 처리
+
+        잠금이 다른 워커로 넘어간 작업이면 결과를 기록하지 않고 False를 반환합니다.
+        """
+        self.status = "done"
+        self.finished_at = timezone.now()
+        self.last_error = ""
+        updated = self._locked().update(
+            status=self.status, finished_at=self.finished_at, last_error=""
+        )
+        if not updated:
+            logger.warning(f"Job {self.id} is no longer locked by {self.locked_by}")
+        return bool(updated)
+
+    def mark_failed(self, error, retry_delay=30):
+        """작업 실패 처리
+
+        최대 시도 횟수 전이면 점점 늘어나는 간격(retry_delay × 2^(시도 횟수-1)초) 후 재시도하도록
+        대기 상태로 되돌리고, 아니면 실패 상태로 끝냅니다.
+        잠금이 다른 워커로 넘어간 작업이면 결과를 기록하지 않고 False를 반환합니다.
+        """
+        self.last_error = str(error)
+        if self.attempts < self.max_attempts:
+            self.status = "pending"
+            self.run_after = timezone.now() + timedelta(
+                seconds=retry_delay * 2 ** (self.attempts - 1)
+            )
+        else:
+            self.status = "failed"
+            self.finished_at = timezone.now()
+        updated = self._locked().update(
+            status=self.status,
+            run_after=self.run_after,
+            finished_at=self.finished_at,
+            last_error=self.last_error,
+        )
+        if not updated:
+            logger.warning(f"Job {self.id} is no longer locked by {self.locked_by}")
+        return bool(updated)
+
+    @classmethod
+    def requeue_stale(cls, timeout):
+        """처리 중 상태로 timeout초 이상 잠금이 갱신되지 않은 작업(워커 비정상 종료 등) 정리
+
+        최대 시도 횟수가 남은 작업은 대기 상태로 되돌리고, 다 쓴 작업은 실패 처리합니다.
+        (메모리 부족 등으로 워커를 종료시키는 작업이 무한히 다시 실행되지 않도록)
+        반환: (대기 상태로 되돌린 수, 실패 처리한 수)
+        """
+        now = timezone.now()
+        stale = cls.objects.filter(
+            status="running", locked_at__lt=now - timedelta(seconds=timeout)
+        )
+        failed = stale.filter(attempts__gte=F("max_attempts")).update(
+            status="failed",
+            locked_at=None,
+            locked_by="",
+            finished_at=now,
+            last_error="작업 처리 중 워커가 응답하지 않았습니다.",
+        )
+        requeued = stale.filter(attempts__lt=F("max_attempts")).update(
+            status="pending", locked_at=None, locked_by=""
+        )
+        if requeued or failed:
+            logger.warning(f"Stale jobs: requeued {requeued}, failed {failed}")
+        return requeued, failed
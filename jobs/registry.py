@@ -0,0 +1,32 @@
+from django.utils.module_loading import autodiscover_modules
+
+# 작업 종류별 처리 함수 (작업 이름 -> 함수)
+_handlers = {}
+
+
+def register(name):
+    """작업 처리 함수 등록 데코레이터
+
+    처리 함수는 작업의 payload(dict)를 인자로 받습니다.
+    각 앱의 tasks.py에 정의하면 워커 시작 시 자동으로 불러옵니다.
+    """
+
+    def decorator(func):
+        _handlers[name] = func
+        return func
+
+    return decorator
+
+
+def autodiscover():
+    """설치된 모든 앱의 tasks.py를 불러와 처리 함수 등록"""
+    autodiscover_modules("tasks")
+
+
+def get_handler(name):
+    """등록된 처리 함수 반환 (없으면 None)"""
+    return _handlers.get(name)
+
+
+def registered_names():
+    return sorted(_handlers)
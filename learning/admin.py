@@ -1,3 +1,10 @@
-# from django.contrib import admin
+from django.contrib import admin
+from .models import CertificateTemplate
 
-# Register your models here.
+
+@admin.register(CertificateTemplate)
+class CertificateTemplateAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "course", "is_default", "version", "updated_at")
+    list_filter = ("is_default", "course")
+    search_fields = ("name", "course__title")
+    readonly_fields = ("version", "created_at", "updated_at")
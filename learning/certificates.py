@@ -0,0 +1,443 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import cache
+from io import BytesIO
+import logging
+import threading
+import time
+from xml.sax.saxutils import escape
+
+import django
+from django.contrib.staticfiles.finders import find as find_static_file
+from django.db import connections
+from pypdf import PdfReader, PdfWriter
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    Flowable,
+    SimpleDocTemplate,
+    Paragraph,
+    Spacer,
+    Image,
+    Table,
+    TableStyle,
+)
+
+logger = logging.getLogger("django")
+
+# 수료증 PDF 생성 작업 이름 (learning/tasks.py에서 처리)
+RENDER_CERTIFICATE_JOB = "learning.render_certificate"
+
+# 한글 폰트 파일 후보 (static 폴더 기준)
+REGULAR_FONT_FILES = ["fonts/NanumGothic-Regular.ttf", "fonts/NanumGothic.ttf"]
+BOLD_FONT_FILES = ["fonts/NanumGothicBold.ttf", "fonts/NanumGothic-Bold.ttf"]
+
+# 수료증마다 달라지는 항목의 자리 높이 (배경에서는 비워 두고 겹쳐 그림)
+FIELD_SLOT_HEIGHTS = {"name": 20, "course": 44, "credit": 16, "info": 36}
+
+# 템플릿 버전별 배경 PDF 캐시 ({(템플릿 ID, 버전): (배경 PDF 페이지, 항목 위치)})
+# 캐시된 페이지는 원본 PDF 스트림을 읽으므로 여러 스레드에서 동시에 복사하지 않도록 잠금
+BACKGROUND_CACHE_SIZE = 32
+_background_cache = {}
+_background_lock = threading.Lock()
+
+
+def _find_first(paths):
+    for path in paths:
+        found = find_static_file(path)
+        if found:
+            return found
+    return None
+
+
+@cache
+def get_certificate_fonts():
+    """한글 폰트 등록 후 (기본, 굵은) 폰트 이름 반환 (프로세스당 한 번만 등록)"""
+    font_path = _find_first(REGULAR_FONT_FILES)
+    if not font_path:
+        # 폰트를 찾지 못하면 기본 폰트 사용
+        return "Helvetica", "Helvetica-Bold"
+
+    pdfmetrics.registerFont(TTFont("NanumGothic", font_path))
+    pdfmetrics.registerFont(
+        TTFont("NanumGothicBold", _find_first(BOLD_FONT_FILES) or font_path)
+    )
+    return "NanumGothic", "NanumGothicBold"
+
+
+@cache
+def get_certificate_styles():
+    """수료증 문단 스타일 (프로세스당 한 번만 생성)"""
+    font_name, font_name_bold = get_certificate_fonts()
+    styles = getSampleStyleSheet()
+
+    styles.add(
+        ParagraphStyle(
+            name="TitleKO",
+            fontName=font_name_bold,
+            fontSize=24,
+            alignment=TA_CENTER,
+            spaceAfter=5,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="SubtitleKO",
+            fontName=font_name,
+            fontSize=14,
+            alignment=TA_CENTER,
+            spaceAfter=20,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="BodyKO",
+            fontName=font_name,
+            fontSize=12,
+            alignment=TA_CENTER,
+            leading=18,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="NameKO",
+            fontName=font_name_bold,
+            fontSize=16,
+            alignment=TA_CENTER,
+            spaceBefore=15,
+            spaceAfter=15,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CourseKO",
+            fontName=font_name_bold,
+            fontSize=18,
+            alignment=TA_CENTER,
+            spaceAfter=5,
+            textColor=colors.blue,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CreditKO",
+            fontName=font_name,
+            fontSize=12,
+            alignment=TA_CENTER,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="InfoLeftKO",
+            fontName=font_name,
+            fontSize=10,
+            alignment=TA_LEFT,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="InfoRightKO",
+            fontName=font_name,
+            fontSize=10,
+            alignment=TA_RIGHT,
+        )
+    )
+    return styles
+
+
+@cache
+def get_seal_image_data():
+    """직인 이미지 내용 (프로세스당 한 번만 읽음, 없으면 None)"""
+    seal_path = find_static_file("images/seal.png")
+    if not seal_path:
+        return None
+    with open(seal_path, "rb") as f:
+        return f.read()
+
+
+class _FieldSlot(Flowable):
+    """수료증마다 달라지는 항목의 빈 자리 (배경을 그릴 때 페이지 위치만 기록)"""
+
+    def __init__(self, name, height, positions):
+        super().__init__()
+        self.name = name
+        self.height = height
+        self.positions = positions
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        return availWidth, self.height
+
+    def draw(self):
+        x, y = self.canv.absolutePosition(0, 0)
+        self.positions[self.name] = (x, y, self.width, self.height)
+
+
+def _add_border(canvas, doc):
+    """배경 테두리"""
+    canvas.saveState()
+    canvas.setStrokeColor(colors.black)
+    canvas.setLineWidth(1)
+    canvas.rect(
+        doc.leftMargin - 10,
+        doc.bottomMargin - 10,
+        doc.width + 20,
+        doc.height + 20,
+    )
+    canvas.restoreState()
+
+
+def _get_template_seal_data(template):
+    """템플릿 직인 이미지 내용 (템플릿에 없으면 기본 직인)"""
+    if template.seal_image:
+        with template.seal_image.open("rb") as f:
+            return f.read()
+    return get_seal_image_data()
+
+
+def render_certificate_background(template):
+    """수료증 템플릿의 고정 배경 PDF 생성 - 웹 버전과 동일한 디자인
+
+    로고, 제목, 본문, 직인, 기관명, 테두리를 그리고 수료자 이름, 과정명, 학점,
+    발급 번호/발급일 자리는 비워 둡니다.
+    반환 형식: (배경 PDF 내용, {항목 이름: (x, y, 너비, 높이)})
+    """
+    styles = get_certificate_styles()
+    positions = {}
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=72,
+        rightMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+    )
+
+    # PDF에 들어갈 요소들
+    elements = []
+
+    # 타이틀 로고
+    elements.append(Paragraph(escape(template.brand_text), styles["TitleKO"]))
+    elements.append(Spacer(1, 20))
+
+    # 수료증
+    elements.append(Paragraph(escape(template.title), styles["TitleKO"]))
+    elements.append(Paragraph(escape(template.subtitle), styles["SubtitleKO"]))
+    elements.append(Spacer(1, 30))
+
+    # 본문
+    elements.append(Paragraph(escape(template.body_text), styles["BodyKO"]))
+    elements.append(Spacer(1, 40))
+
+    # 수료자 이름, 과정명, 학점 자리
+    elements.append(Spacer(1, 15))
+    elements.append(_FieldSlot("name", FIELD_SLOT_HEIGHTS["name"], positions))
+    elements.append(Spacer(1, 15))
+    elements.append(_FieldSlot("course", FIELD_SLOT_HEIGHTS["course"], positions))
+    elements.append(_FieldSlot("credit", FIELD_SLOT_HEIGHTS["credit"], positions))
+    elements.append(Spacer(1, 50))
+
+    # 발급번호 및 발급일 자리
+    elements.append(_FieldSlot("info", FIELD_SLOT_HEIGHTS["info"], positions))
+    elements.append(Spacer(1, 50))
+
+    # 직인 이미지
+    seal_data = _get_template_seal_data(template)
+    if seal_data:
+        seal = Image(BytesIO(seal_data), width=100, height=100)
+        seal.hAlign = "CENTER"
+        elements.append(seal)
+    else:
+        # 직인 이미지가 없는 경우, 텍스트로 대체
+        elements.append(Paragraph("(직인)", styles["BodyKO"]))
+
+    elements.append(Spacer(1, 20))
+
+    # 기관명
+    elements.append(Paragraph(escape(template.organization_name), styles["BodyKO"]))
+    elements.append(Paragraph(escape(template.representative), styles["BodyKO"]))
+
+    # PDF 생성 (배경 테두리 추가)
+    doc.build(elements, onFirstPage=_add_border, onLaterPages=_add_border)
+    return buffer.getvalue(), positions
+
+
+def get_certificate_background(template):
+    """템플릿 버전별 배경 PDF 페이지 (프로세스당 버전마다 한 번만 생성)
+
+    템플릿을 수정하면 버전이 올라가므로 캐시를 따로 비울 필요가 없습니다.
+    반환 형식: (배경 PDF 페이지, {항목 이름: (x, y, 너비, 높이)})
+    """
+    key = (template.pk, template.version)
+    background = _background_cache.get(key)
+    if background is None:
+        pdf_content, positions = render_certificate_background(template)
+        background = (PdfReader(BytesIO(pdf_content)).pages[0], positions)
+        if len(_background_cache) >= BACKGROUND_CACHE_SIZE:
+            _background_cache.clear()
+        _background_cache[key] = background
+        logger.info(f"Rendered certificate background for template {key}")
+    return background
+
+
+def _render_fields_overlay(certificate, positions):
+    """수료증마다 달라지는 항목만 그린 PDF (배경 위에 겹침)"""
+    styles = get_certificate_styles()
+
+    user_name = certificate.user.get_full_name() or certificate.user.username
+    course = certificate.enrollment.course
+    issue_date = certificate.issued_at.strftime("%Y년 %m월 %d일")
+    info_width = positions["info"][2]
+    info = Table(
+        [
+            [
+                Paragraph("발급 번호", styles["InfoLeftKO"]),
+                Paragraph("발급일", styles["InfoRightKO"]),
+            ],
+            [
+                Paragraph(escape(certificate.certificate_number), styles["InfoLeftKO"]),
+                Paragraph(issue_date, styles["InfoRightKO"]),
+            ],
+        ],
+        colWidths=[info_width / 2.0, info_width / 2.0],
+    )
+    info.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
+
+    fields = {
+        "name": Paragraph(escape(user_name), styles["NameKO"]),
+        "course": Paragraph(escape(course.title), styles["CourseKO"]),
+        "credit": Paragraph(f"총 학점: {course.credit}학점", styles["CreditKO"]),
+        "info": info,
+    }
+
+    buffer = BytesIO()
+    canvas = Canvas(buffer, pagesize=A4)
+    for name, flowable in fields.items():
+        x, y, width, height = positions[name]
+        _, flowable_height = flowable.wrapOn(canvas, width, height)
+        # 자리 안에서 세로 가운데 정렬
+        flowable.drawOn(canvas, x, y + (height - flowable_height) / 2)
+    canvas.showPage()
+    canvas.save()
+    return buffer.getvalue()
+
+
+def get_certificate_template(certificate):
+    """수료증에 사용할 템플릿
+
+    발급 시 지정된 템플릿, 과정 기본 템플릿, 내장 디자인(저장하지 않은 기본값) 순으로 사용합니다.
+    """
+    from .models import CertificateTemplate
+
+    return (
+        certificate.template
+        or CertificateTemplate.default_for_course(certificate.enrollment.course)
+        or CertificateTemplate()
+    )
+
+
+def render_certificate_pdf(certificate):
+    """수료증 PDF 내용 생성
+
+    템플릿 버전별로 캐시된 배경 PDF 위에 수료자 이름, 과정명, 학점,
+    발급 번호, 발급일만 그린 PDF를 겹쳐 만듭니다.
+    """
+    template = get_certificate_template(certificate)
+    with _background_lock:
+        background_page, positions = get_certificate_background(template)
+    overlay = _render_fields_overlay(certificate, positions)
+
+    # 배경 페이지를 복사한 뒤 가변 항목 페이지를 위에 겹침
+    writer = PdfWriter()
+    with _background_lock:
+        page = writer.add_page(background_page)
+    page.merge_page(PdfReader(BytesIO(overlay)).pages[0])
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def certificate_pdf_filename(certificate):
+    """수료증 PDF 파일명 (타임스탬프 추가로 유니크하게)"""
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    return f"certificate_{certificate.certificate_number}_{timestamp}.pdf"
+
+
+def request_certificate_pdfs(certificates):
+    """여러 수료증의 PDF 생성 작업을 한 번에 등록 (run_jobs 워커가 처리)"""
+    from jobs.models import Job
+
+    Job.enqueue_bulk(
+        RENDER_CERTIFICATE_JOB,
+        [{"certificate_id": certificate.id} for certificate in certificates],
+        dedupe_keys=[
+            f"{RENDER_CERTIFICATE_JOB}:{certificate.id}" for certificate in certificates
+        ],
+    )
+
+
+def _init_render_worker():
+    # spawn 방식에서는 Django를 새로 초기화하고, fork 방식에서는 부모의 DB 연결을 쓰지 않도록 정리
+    django.setup()
+    connections.close_all()
+
+
+def _render_certificate_by_id(certificate_id):
+    """수료증 하나의 PDF 생성 (프로세스 풀 작업, 결과: (id, 오류 메시지 또는 None))"""
+    from .models import Certificate
+
+    try:
+        certificate = Certificate.objects.select_related(
+            "user", "enrollment__course", "template"
+        ).get(id=certificate_id)
+        certificate.generate_pdf()
+    except Exception as e:
+        logger.exception(f"Certificate PDF rendering failed: {certificate_id}")
+        return certificate_id, str(e)
+    return certificate_id, None
+
+
+def render_certificates(certificate_ids, workers=4):
+    """여러 수료증의 PDF를 프로세스 풀에서 동시에 생성
+
+    각 작업 프로세스는 폰트/스타일/직인 이미지를 한 번만 불러와 재사용합니다.
+    반환 형식: {"rendered": 성공 수, "failures": [(id, 오류)...], "elapsed": 소요 시간(초)}
+    """
+    started = time.monotonic()
+    failures = []
+    rendered = 0
+
+    if workers <= 1:
+        results = map(_render_certificate_by_id, certificate_ids)
+        for certificate_id, error in results:
+            if error:
+                failures.append((certificate_id, error))
+            else:
+                rendered += 1
+    else:
+        # 자식 프로세스가 부모의 DB 연결을 물려받지 않도록 미리 닫음
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker
+        ) as executor:
+            for certificate_id, error in executor.map(
+                _render_certificate_by_id, certificate_ids, chunksize=8
+            ):
+                if error:
+                    failures.append((certificate_id, error))
+                else:
+                    rendered += 1
+
+    return {
+        "rendered": rendered,
+        "failures": failures,
+        "elapsed": time.monotonic() - started,
+    }
@@ -298,6 +298,11 @@ class Command(BaseCommand):
                     )
                 )
 
+                # 직접 생성한 진행 기록을 진행 상황 집계에 반영
+                Enrollment.recompute_progress_counters(
+                    Enrollment.objects.filter(user__in=[user1, user2])
+                )
+
         self.stdout.write(self.style.SUCCESS("샘플 수강 데이터 생성 완료!"))
         self.stdout.write("")
 
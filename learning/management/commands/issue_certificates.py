@@ -0,0 +1,132 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+
+from courses.models import Course
+from learning.certificates import render_certificates, request_certificate_pdfs
+from learning.models import Certificate, CertificateTemplate, Enrollment
+
+
+class Command(BaseCommand):
+    help = "수료 조건을 충족한 수강생에게 수료증을 일괄 발급하고 PDF를 생성합니다."
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument(
+            "--course",
+            type=int,
+            action="append",
+            dest="course_ids",
+            help="수료증을 발급할 과정 ID (여러 번 지정 가능)",
+        )
+        target.add_argument(
+            "--all", action="store_true", help="모든 과정의 수료증 발급"
+        )
+        parser.add_argument(
+            "--recompute",
+            action="store_true",
+            help="발급 전에 수강생의 진행 상황 집계를 다시 계산",
+        )
+        parser.add_argument(
+            "--template",
+            type=int,
+            dest="template_id",
+            help="사용할 수료증 템플릿 ID (기본: 과정별 기본 템플릿)",
+        )
+        parser.add_argument(
+            "--render",
+            choices=["pool", "queue", "none"],
+            default="pool",
+            help="PDF 생성 방법: pool(프로세스 풀에서 바로 생성, 기본), queue(run_jobs 워커에 맡김), none(생성 안 함)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="PDF를 동시에 생성할 프로세스 수 (기본 4)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="발급 대상 수만 출력하고 실제로 발급하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            courses = Course.objects.all()
+        else:
+            courses = Course.objects.filter(id__in=options["course_ids"])
+            missing = set(options["course_ids"]) - set(
+                courses.values_list("id", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"존재하지 않는 과정 ID: {', '.join(map(str, sorted(missing)))}"
+                )
+
+        template = None
+        if options["template_id"]:
+            template = CertificateTemplate.objects.filter(
+                id=options["template_id"]
+            ).first()
+            if template is None:
+                raise CommandError(
+                    f"존재하지 않는 수료증 템플릿 ID: {options['template_id']}"
+                )
+
+        if options["recompute"]:
+            count = Enrollment.recompute_progress_counters(
+                Enrollment.objects.filter(course__in=courses, certificate__isnull=True)
+            )
+            self.stdout.write(
+                f"수강 정보 {count}건의 진행 상황 집계를 다시 계산했습니다."
+            )
+
+        candidates = list(Enrollment.certificate_candidates(courses).only("id"))
+        if options["dry_run"]:
+            self.stdout.write(f"수료증 발급 대상: {len(candidates)}명")
+            return
+
+        started = time.monotonic()
+        certificates = Certificate.issue_for_enrollments(candidates, template=template)
+        issue_elapsed = time.monotonic() - started
+        self.stdout.write(
+            f"수료증 {len(certificates)}건을 발급했습니다. ({issue_elapsed:.2f}초)"
+        )
+        if not certificates:
+            return
+
+        if options["render"] == "queue":
+            request_certificate_pdfs(certificates)
+            self.stdout.write("PDF 생성 작업을 등록했습니다. (run_jobs 워커에서 처리)")
+        elif options["render"] == "pool":
+            result = render_certificates(
+                [certificate.id for certificate in certificates],
+                workers=options["workers"],
+            )
+            elapsed = result["elapsed"]
+            throughput = result["rendered"] / elapsed if elapsed else 0
+            self.stdout.write(
+                f"PDF {result['rendered']}건 생성 ({elapsed:.2f}초, 초당 {throughput:.1f}건, 프로세스 {options['workers']}개)"
+            )
+            for certificate_id, error in result["failures"]:
+                self.stderr.write(f"수료증 {certificate_id} PDF 생성 실패: {error}")
+            if result["failures"]:
+                # 실패한 PDF는 워커가 다시 시도하도록 작업 등록
+                failed_ids = {
+                    certificate_id for certificate_id, _ in result["failures"]
+                }
+                request_certificate_pdfs(
+                    [
+                        certificate
+                        for certificate in certificates
+                        if certificate.id in failed_ids
+                    ]
+                )
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"PDF 생성 실패 {len(result['failures'])}건은 run_jobs 워커에서 다시 시도합니다."
+                    )
+                )
+
+        self.stdout.write(self.style.SUCCESS("수료증 일괄 발급을 완료했습니다."))
@@ -0,0 +1,46 @@
+from django.core.management import BaseCommand
+
+from courses.models import Course
+from learning.models import Enrollment
+
+
+class Command(BaseCommand):
+    help = "과정별 강의 수와 수강 정보의 진행 상황 집계를 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            type=int,
+            action="append",
+            dest="course_ids",
+            help="재계산할 과정 ID (여러 번 지정 가능, 생략 시 전체 과정)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 저장할 수강 정보 수",
+        )
+
+    def handle(self, *args, **options):
+        course_ids = options["course_ids"]
+
+        courses = Course.objects.all()
+        if course_ids:
+            courses = courses.filter(id__in=course_ids)
+
+        # 과정별 커리큘럼 집계 먼저 갱신 (진행률 계산의 기준)
+        course_count = 0
+        for course_id in courses.values_list("id", flat=True):
+            Course.refresh_curriculum_counts(course_id)
+            course_count += 1
+        self.stdout.write(f"과정 {course_count}개의 커리큘럼 집계를 갱신했습니다.")
+
+        enrollments = Enrollment.objects.filter(course__in=courses)
+        updated = Enrollment.recompute_progress_counters(
+            enrollments, batch_size=options["batch_size"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"수강 정보 {updated}개의 진행 상황을 재계산했습니다.")
+        )
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_progress_counters(apps, schema_editor):
+    """기존 수강 정보의 진행 상황 집계 채우기"""
+    Enrollment = apps.get_model("learning", "Enrollment")
+    LectureProgress = apps.get_model("learning", "LectureProgress")
+    MissionAttempt = apps.get_model("learning", "MissionAttempt")
+    ProjectSubmission = apps.get_model("learning", "ProjectSubmission")
+
+    completed_lectures = dict(
+        LectureProgress.objects.filter(is_completed=True)
+        .order_by()
+        .values("enrollment")
+        .annotate(count=Count("id"))
+        .values_list("enrollment", "count")
+    )
+    passed_missions = dict(
+        MissionAttempt.objects.filter(is_passed=True, lecture__lecture_type="mission")
+        .order_by()
+        .values("enrollment")
+        .annotate(count=Count("lecture", distinct=True))
+        .values_list("enrollment", "count")
+    )
+    passed_exams = dict(
+        ProjectSubmission.objects.filter(
+            is_passed=True, subject__subject_type__in=["midterm", "final"]
+        )
+        .order_by()
+        .values("enrollment")
+        .annotate(count=Count("subject", distinct=True))
+        .values_list("enrollment", "count")
+    )
+
+    enrollments = list(Enrollment.objects.all())
+    for enrollment in enrollments:
+        enrollment.completed_lecture_count = completed_lectures.get(enrollment.id, 0)
+        enrollment.passed_mission_count = passed_missions.get(enrollment.id, 0)
+        enrollment.passed_exam_count = passed_exams.get(enrollment.id, 0)
+
+    Enrollment.objects.bulk_update(
+        enrollments,
+        ["completed_lecture_count", "passed_mission_count", "passed_exam_count"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learning", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enrollment",
+            name="completed_lecture_count",
+            field=models.PositiveIntegerField(default=0, help_text="완료한 강의 수"),
+        ),
+        migrations.AddField(
+            model_name="enrollment",
+            name="passed_exam_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="통과한 중간/기말고사 과목 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="enrollment",
+            name="passed_mission_count",
+            field=models.PositiveIntegerField(default=0, help_text="통과한 미션 수"),
+        ),
+        migrations.RunPython(backfill_progress_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0007_course_rating_1_count_course_rating_2_count_and_more"),
+        ("learning", "0002_enrollment_completed_lecture_count_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CertificateTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                (
+                    "is_default",
+                    models.BooleanField(
+                        default=False, help_text="발급 시 기본으로 사용할 템플릿 여부"
+                    ),
+                ),
+                ("brand_text", models.CharField(default="스킬브릿지", max_length=50)),
+                ("title", models.CharField(default="수료증", max_length=50)),
+                (
+                    "subtitle",
+                    models.CharField(
+                        default="Certificate of Completion", max_length=100
+                    ),
+                ),
+                (
+                    "body_text",
+                    models.CharField(
+                        default="본 증서는 아래의 교육과정을 성공적으로 이수하였음을 증명합니다.",
+                        max_length=200,
+                    ),
+                ),
+                (
+                    "organization_name",
+                    models.CharField(default="스킬브릿지", max_length=50),
+                ),
+                (
+                    "representative",
+                    models.CharField(default="대표: 홍길동", max_length=50),
+                ),
+                (
+                    "seal_image",
+                    models.ImageField(
+                        blank=True,
+                        help_text="비워 두면 기본 직인 이미지 사용",
+                        null=True,
+                        upload_to="certificates/templates/",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveIntegerField(
+                        default=1,
+                        help_text="내용을 수정할 때마다 증가 (PDF 배경 캐시 키)",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="비워 두면 모든 과정에서 사용",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="certificate_templates",
+                        to="courses.course",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["course_id", "-is_default", "name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="certificate",
+            name="template",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="발급 시 사용한 템플릿 (비어 있으면 내장 디자인)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="certificates",
+                to="learning.certificatetemplate",
+            ),
+        ),
+    ]
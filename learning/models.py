@@ -1,7 +1,15 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from django.utils import timezone
-from courses.models import Course, Subject, Lecture, MissionQuestion
+from courses.curriculum import (
+    get_course_outline,
+    find_next_pending_item,
+    load_learning_item,
+)
+from courses.missions import get_answer_key, grade_answers
+from courses.models import Course, Subject, Lecture
 
 
 class Enrollment(models.Model):
@@ -33,6 +41,22 @@ class Enrollment(models.Model):
     enrolled_at = models.DateTimeField(auto_now_add=True, db_index=True)
     last_activity_at = models.DateTimeField(auto_now=True, db_index=True)
     completed_at = models.DateTimeField(blank=True, null=True)
+    # 진행 상황 집계 (진행 기록이 바뀔 때 F() 표현식으로 증감)
+    completed_lecture_count = models.PositiveIntegerField(
+        default=0, help_text="완료한 강의 수"
+    )
+    passed_mission_count = models.PositiveIntegerField(
+        default=0, help_text="통과한 미션 수"
+    )
+    passed_exam_count = models.PositiveIntegerField(
+        default=0, help_text="통과한 중간/기말고사 과목 수"
+    )
+
+    COUNTER_FIELDS = [
+        "completed_lecture_count",
+        "passed_mission_count",
+        "passed_exam_count",
+    ]
 
     class Meta:
         unique_together = ["user", "course"]
@@ -40,26 +64,171 @@ class Enrollment(models.Model):
     def __str__(self):
         return f"{self.user.username}의 {self.course.title} 수강"
 
+    def increment_progress_counters(self, **deltas):
+        """진행 상황 집계 증감 후 진행률 및 수료 여부 갱신
+
+        deltas: 집계 필드명과 증감 값 (예: completed_lecture_count=1)
+        동시에 여러 요청이 들어와도 누락되지 않도록 DB에서 원자적으로 증감합니다.
+        """
+        Enrollment.objects.filter(id=self.id).update(
+            last_activity_at=timezone.now(),
+            **{field: F(field) + delta for field, delta in deltas.items()},
+        )
+        self.refresh_from_db(
+            fields=[*self.COUNTER_FIELDS, "status", "progress_percentage"]
+        )
+
+        self.update_progress()
+        self.check_completion()
+
+    def refresh_passed_exam_count(self):
+        """통과한 중간/기말고사 과목 수를 다시 집계한 후 수료 여부 갱신
+
+        프로젝트 평가는 통과/불합격이 번복될 수 있으므로 증감 대신
+        하나의 UPDATE 문 안에서 서브쿼리로 재집계합니다.
+        """
+        passed_exams = (
+            ProjectSubmission.objects.filter(
+                enrollment=OuterRef("pk"),
+                is_passed=True,
+                subject__subject_type__in=Subject.EXAM_TYPES,
+            )
+            .order_by()
+            .values("enrollment")
+            .annotate(count=Count("subject", distinct=True))
+            .values("count")
+        )
+        Enrollment.objects.filter(id=self.id).update(
+            passed_exam_count=Coalesce(Subquery(passed_exams), 0)
+        )
+        self.refresh_from_db(fields=["passed_exam_count", "status"])
+
+        self.check_completion()
+
+    @classmethod
+    def recompute_progress_counters(cls, queryset=None, batch_size=500):
+        """진행 상황 집계 일괄 재계산 (복구용)
+
+        강의 완료/미션 통과/시험 통과 수를 수강 정보별로 그룹 집계하여
+        진행률, 수료 상태와 함께 bulk_update로 저장합니다.
+        재계산한 수강 정보 수를 반환합니다.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        completed_lectures = dict(
+            LectureProgress.objects.filter(enrollment__in=queryset, is_completed=True)
+            .order_by()
+            .values("enrollment")
+            .annotate(count=Count("id"))
+            .values_list("enrollment", "count")
+        )
+        passed_missions = dict(
+            MissionAttempt.objects.filter(
+                enrollment__in=queryset,
+                is_passed=True,
+                lecture__lecture_type="mission",
+            )
+            .order_by()
+            .values("enrollment")
+            .annotate(count=Count("lecture", distinct=True))
+            .values_list("enrollment", "count")
+        )
+        passed_exams = dict(
+            ProjectSubmission.objects.filter(
+                enrollment__in=queryset,
+                is_passed=True,
+                subject__subject_type__in=Subject.EXAM_TYPES,
+            )
+            .order_by()
+            .values("enrollment")
+            .annotate(count=Count("subject", distinct=True))
+            .values_list("enrollment", "count")
+        )
+
+        now = timezone.now()
+        updated = []
+        count = 0
+        for enrollment in queryset.select_related("course").iterator(
+            chunk_size=batch_size
+        ):
+            course = enrollment.course
+            enrollment.completed_lecture_count = completed_lectures.get(
+                enrollment.id, 0
+            )
+            enrollment.passed_mission_count = passed_missions.get(enrollment.id, 0)
+            enrollment.passed_exam_count = passed_exams.get(enrollment.id, 0)
+
+            if course.lecture_count:
+                enrollment.progress_percentage = min(
+                    int(
+                        enrollment.completed_lecture_count / course.lecture_count * 100
+                    ),
+                    100,
+                )
+
+            if (
+                enrollment.status == "enrolled"
+                and enrollment.completed_lecture_count >= course.lecture_count
+                and enrollment.passed_mission_count >= course.mission_count
+                and enrollment.passed_exam_count >= course.exam_count
+            ):
+                enrollment.status = "completed"
+                enrollment.completed_at = now
+
+            updated.append(enrollment)
+            if len(updated) >= batch_size:
+                count += cls._bulk_update_progress(updated, batch_size)
+                updated = []
+
+        if updated:
+            count += cls._bulk_update_progress(updated, batch_size)
+        return count
+
+    @classmethod
+    def _bulk_update_progress(cls, enrollments, batch_size):
+        cls.objects.bulk_update(
+            enrollments,
+            [*cls.COUNTER_FIELDS, "progress_percentage", "status", "completed_at"],
+            batch_size=batch_size,
+        )
+        return len(enrollments)
+
+    @classmethod
+    def certificate_candidates(cls, courses=None):
+        """수료증을 발급할 수 있는 수강 정보 (아직 수료증이 없는 수료 완료/수료 조건 충족)
+
+        수강 정보의 진행 상황 집계와 과정의 커리큘럼 집계를 한 번의 쿼리로 비교합니다.
+        """
+        queryset = cls.objects.filter(certificate__isnull=True).filter(
+            Q(status="completed")
+            | Q(
+                status="enrolled",
+                completed_lecture_count__gte=F("course__lecture_count"),
+                passed_mission_count__gte=F("course__mission_count"),
+                passed_exam_count__gte=F("course__exam_count"),
+            )
+        )
+        if courses is not None:
+            queryset = queryset.filter(course__in=courses)
+        return queryset
+
     def update_progress(self):
         """수강 진행률 업데이트
 
-        과정에 포함된 모든 강의 중 완료한 강의의 비율을 계산하여
+        완료한 강의 수 집계와 과정의 전체 강의 수로 진행률을 계산하여
         progress_percentage 필드를 업데이트합니다.
         """
         # 전체 강의 수
-        total_lectures = Lecture.objects.filter(subject__course=self.course).count()
+        total_lectures = self.course.lecture_count
         if total_lectures == 0:
             return 0
 
-        # 완료한 강의 수
-        completed_lectures = LectureProgress.objects.filter(
-            enrollment=self, is_completed=True
-        ).count()
-
-        # 진행률 계산 및 업데이트
-        progress = int((completed_lectures / total_lectures) * 100)
-        self.progress_percentage = progress
-        self.save(update_fields=["progress_percentage"])
+        # 진행률 계산 및 업데이트 (변경된 경우에만 저장)
+        progress = min(int((self.completed_lecture_count / total_lectures) * 100), 100)
+        if progress != self.progress_percentage:
+            self.progress_percentage = progress
+            self.save(update_fields=["progress_percentage"])
 
         return progress
 
@@ -69,30 +238,28 @@ class Enrollment(models.Model):
         사용자가 아직 완료하지 않은 가장 처음 강의를 반환합니다.
         모든 강의를 완료한 경우 첫 번째 강의를 반환합니다(복습용).
         """
-        # 현재 과정의 모든 과목을 순서대로 가져오기
-        subjects = Subject.objects.filter(course=self.course).order_by("order_index")
-
-        for subject in subjects:
-            # 과목 내 모든 강의를 순서대로 가져오기
-            lectures = Lecture.objects.filter(subject=subject).order_by("order_index")
-
-            for lecture in lectures:
-                # 아직 완료하지 않은 강의가 있으면 반환
-                progress = LectureProgress.objects.filter(
-                    enrollment=self, lecture=lecture, is_completed=True
-                ).exists()
-
-                if not progress:
-                    return lecture
-
-        # 모든 강의를 완료했다면 첫 번째 강의 반환 (복습용)
-        first_lecture = (
-            Lecture.objects.filter(subject__course=self.course)
-            .order_by("subject__order_index", "order_index")
-            .first()
+        outline = get_course_outline(self.course_id)
+        lecture_ids = [
+            object_id
+            for item_type, object_id, _subject_id in outline["items"]
+            if item_type != "project"
+        ]
+        if not lecture_ids:
+            return None
+
+        # 완료한 강의 id 집합과 목차를 비교하여 첫 번째 미완료 강의 선택
+        completed_lecture_ids = self.get_completed_lecture_ids()
+        next_lecture_id = next(
+            (
+                lecture_id
+                for lecture_id in lecture_ids
+                if lecture_id not in completed_lecture_ids
+            ),
+            # 모든 강의를 완료했다면 첫 번째 강의 반환 (복습용)
+            lecture_ids[0],
         )
 
-        return first_lecture
+        return Lecture.objects.get(id=next_lecture_id)
 
     def get_next_learning_item(self):
         """
@@ -101,99 +268,51 @@ class Enrollment(models.Model):
         반환 형식: (유형, 객체)
         유형은 'video_lecture', 'mission', 'project', 'completed' 중 하나입니다.
         """
-        # 과정의 모든 과목을 순서대로 확인
-        subjects = Subject.objects.filter(course=self.course).order_by("order_index")
-
-        for subject in subjects:
-            # 중간고사/기말고사 과목인 경우
-            if subject.subject_type in ["midterm", "final"]:
-                # 이미 통과한 프로젝트가 있는지 확인
-                submission = ProjectSubmission.objects.filter(
-                    enrollment=self, subject=subject, is_passed=True
-                ).first()
-
-                # 아직 통과하지 않았다면 프로젝트 제출로 반환
-                if not submission:
-                    return ("project", subject)
-
-            # 일반 과목인 경우 미완료된 강의 찾기
-            lectures = Lecture.objects.filter(subject=subject).order_by("order_index")
-
-            for lecture in lectures:
-                # 강의 진행 상태 확인
-                progress = LectureProgress.objects.filter(
-                    enrollment=self, lecture=lecture, is_completed=True
-                ).exists()
-
-                # 완료하지 않은 강의가 있으면 해당 강의 반환
-                if not progress:
-                    if lecture.lecture_type == "video":
-                        return ("video_lecture", lecture)
-                    elif lecture.lecture_type == "mission":
-                        return ("mission", lecture)
-
-        # 모든 항목을 완료한 경우
-        return ("completed", self.course)
-
-    def check_completion(self):
-        """과정 수료 조건 확인 (최적화 버전)
-
-        모든 강의와 미션, 중간/기말고사를 완료했는지 확인하고,
-        조건 충족 시 상태를 'completed'로 업데이트합니다.
-        """
-        # 이미 완료된 과정이면 즉시 True 반환
-        if self.status == "completed":
-            return True
-
-        # 수강 중인 과정의 모든 과목
-        subjects = Subject.objects.filter(course=self.course)
-
-        # 중간/기말고사 과목 통과 여부 확인
-        exam_subjects = subjects.filter(subject_type__in=["midterm", "final"])
-        for subject in exam_subjects:
-            if not ProjectSubmission.objects.filter(
-                enrollment=self, subject=subject, is_passed=True
-            ).exists():
-                return False
-
-        # (중간고사 또는 기말고사 아닌) 일반 과목의 모든 강의 완료 여부 확인
-        # lecture_ids: 일반 과목의 모든 강의의 강의 id 목록
-        normal_subjects = subjects.filter(subject_type="normal")
-        lecture_ids = Lecture.objects.filter(subject__in=normal_subjects).values_list(
-            "id", flat=True
+        # 캐시된 과정 목차와 완료/통과 항목 집합을 비교하여 다음 항목 결정
+        outline = get_course_outline(self.course_id)
+        next_item = find_next_pending_item(
+            outline,
+            self.get_completed_lecture_ids(),
+            self.get_passed_project_subject_ids(),
         )
 
-        # 사용자의 모든 진행 상황 한 번에 가져오기
-        # completed_lectures: 일반 과목의 모든 강의 중 완료된 것들의 강의 id 목록
-        completed_lectures = set(
+        # 모든 항목을 완료한 경우 ('completed', 과정) 반환
+        return load_learning_item(self.course_id, next_item)
+
+    def get_completed_lecture_ids(self):
+        """완료한 강의 id 집합"""
+        return set(
             LectureProgress.objects.filter(
-                enrollment=self, lecture_id__in=lecture_ids, is_completed=True
+                enrollment=self, is_completed=True
             ).values_list("lecture_id", flat=True)
         )
 
-        # 미션 통과 여부 확인
-        # passed_missions: 일반 과목의 모든 강의 중 'mission' 타입인 것들의 MissionAttempt 중 통과한 것들의 강의 id 목록
-        passed_missions = set(
-            MissionAttempt.objects.filter(
-                enrollment=self,
-                lecture__subject__in=normal_subjects,
-                lecture__lecture_type="mission",
-                is_passed=True,
-            ).values_list("lecture_id", flat=True)
+    def get_passed_project_subject_ids(self):
+        """프로젝트(중간/기말고사)를 통과한 과목 id 집합"""
+        return set(
+            ProjectSubmission.objects.filter(
+                enrollment=self, is_passed=True
+            ).values_list("subject_id", flat=True)
         )
 
-        # 일반 과목의 모든 강의 정보를 한 번에 가져오기
-        lectures = {l.id: l for l in Lecture.objects.filter(id__in=lecture_ids)}
+    def check_completion(self):
+        """과정 수료 조건 확인
 
-        # 일반 과목의 모든 강의에 대해 진행 상황 확인
-        for lecture_id in lecture_ids:
-            lecture = lectures[lecture_id]  # 쿼리 없이 딕셔너리에서 가져옴
-            if lecture.lecture_type == "mission":
-                if lecture_id not in passed_missions:
-                    return False
-            else:
-                if lecture_id not in completed_lectures:
-                    return False
+        모든 강의와 미션, 중간/기말고사를 완료했는지 진행 상황 집계로 확인하고,
+        조건 충족 시 상태를 'completed'로 업데이트합니다.
+        """
+        # 이미 완료된 과정이면 즉시 True 반환
+        if self.status in ["completed", "certified"]:
+            return True
+
+        # 진행 상황 집계와 과정의 커리큘럼 집계 비교
+        course = self.course
+        if (
+            self.completed_lecture_count < course.lecture_count
+            or self.passed_mission_count < course.mission_count
+            or self.passed_exam_count < course.exam_count
+        ):
+            return False
 
         # 모든 조건 충족 시 상태 업데이트
         self.status = "completed"
@@ -232,16 +351,24 @@ class LectureProgress(models.Model):
 
     def mark_as_completed(self):
         """강의를 완료 상태로 표시 (동영상 시청 시작만으로도 완료 처리)"""
-        if not self.is_completed:
-            self.is_completed = True
-            self.completed_at = timezone.now()
-            self.save(update_fields=["is_completed", "completed_at"])
-
-            # 수강 진행률 업데이트
-            enrollment = Enrollment.objects.get(
-                user=self.user, course=self.lecture.subject.course
-            )
-            enrollment.update_progress()
+        if self.is_completed:
+            return
+
+        # 미완료 -> 완료로 바뀐 경우에만 집계 증가 (중복 요청 시 한 번만 반영)
+        completed_at = timezone.now()
+        flipped = LectureProgress.objects.filter(id=self.id, is_completed=False).update(
+            is_completed=True, completed_at=completed_at
+        )
+
+        self.is_completed = True
+        self.completed_at = completed_at
+
+        if flipped:
+            from .signals import lecture_completed
+
+            # 수강 진행률 및 수료 여부 업데이트
+            self.enrollment.increment_progress_counters(completed_lecture_count=1)
+            lecture_completed.send(sender=LectureProgress, instance=self)
 
 
 class MissionAttempt(models.Model):
@@ -280,18 +407,14 @@ class MissionAttempt(models.Model):
         80% 이상 정답인 경우 통과 처리합니다.
         통과한 경우 해당 강의의 진행 상태도 완료로 표시합니다.
         """
-        total_questions = MissionQuestion.objects.filter(lecture=self.lecture).count()
+        # 캐시된 정답 키와 한 번에 비교 (다른 강의의 문제 id는 채점하지 않음)
+        answer_key = get_answer_key(self.lecture_id)
+        total_questions = len(answer_key)
         if total_questions == 0:
             return 0
 
-        correct_count = 0
-        for question_id, answer in self.user_answers.items():
-            try:
-                question = MissionQuestion.objects.get(id=int(question_id))
-                if int(answer) == question.correct_answer:
-                    correct_count += 1
-            except (MissionQuestion.DoesNotExist, ValueError):
-                pass
+        grading = grade_answers(answer_key, self.user_answers)
+        correct_count = sum(grading.values())
 
         # 점수 계산 (백분율)
         score = int((correct_count / total_questions) * 100)
@@ -304,6 +427,8 @@ class MissionAttempt(models.Model):
 
         # 미션 강의 진행 상태 업데이트
         if self.is_passed:
+            self.record_first_pass()
+
             lecture_progress, _ = LectureProgress.objects.get_or_create(
                 user=self.user, lecture=self.lecture, enrollment=self.enrollment
             )
@@ -311,6 +436,25 @@ class MissionAttempt(models.Model):
 
         return score
 
+    def record_first_pass(self):
+        """해당 미션을 처음 통과한 경우 수강 정보의 통과 미션 수 증가"""
+        with transaction.atomic():
+            # 같은 수강 정보에 대한 동시 통과 처리를 직렬화
+            enrollment = Enrollment.objects.select_for_update().get(
+                id=self.enrollment_id
+            )
+            already_passed = (
+                MissionAttempt.objects.filter(
+                    enrollment_id=self.enrollment_id,
+                    lecture_id=self.lecture_id,
+                    is_passed=True,
+                )
+                .exclude(id=self.id)
+                .exists()
+            )
+            if not already_passed:
+                enrollment.increment_progress_counters(passed_mission_count=1)
+
 
 class ProjectSubmission(models.Model):
     """중간/기말고사 프로젝트 제출 모델
@@ -358,6 +502,98 @@ class ProjectSubmission(models.Model):
         return f"{self.user.username}의 {self.subject.title} 프로젝트"
 
 
+class CertificateTemplate(models.Model):
+    """수료증 템플릿 모델
+
+    수료증 PDF의 고정 문구(로고, 제목, 본문, 기관명)와 직인 이미지를 저장합니다.
+    과정마다 여러 템플릿을 둘 수 있고, 과정을 지정하지 않은 템플릿은 모든 과정에서 사용할 수 있습니다.
+    내용을 수정할 때마다 버전이 올라가며, PDF 배경은 템플릿 버전마다 한 번만 생성합니다.
+    """
+
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="certificate_templates",
+        help_text="비워 두면 모든 과정에서 사용",
+    )
+    name = models.CharField(max_length=100)
+    is_default = models.BooleanField(
+        default=False, help_text="발급 시 기본으로 사용할 템플릿 여부"
+    )
+    brand_text = models.CharField(max_length=50, default="스킬브릿지")
+    title = models.CharField(max_length=50, default="수료증")
+    subtitle = models.CharField(max_length=100, default="Certificate of Completion")
+    body_text = models.CharField(
+        max_length=200,
+        default="본 증서는 아래의 교육과정을 성공적으로 이수하였음을 증명합니다.",
+    )
+    organization_name = models.CharField(max_length=50, default="스킬브릿지")
+    representative = models.CharField(max_length=50, default="대표: 홍길동")
+    seal_image = models.ImageField(
+        upload_to="certificates/templates/",
+        null=True,
+        blank=True,
+        help_text="비워 두면 기본 직인 이미지 사용",
+    )
+    version = models.PositiveIntegerField(
+        default=1, help_text="내용을 수정할 때마다 증가 (PDF 배경 캐시 키)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["course_id", "-is_default", "name"]
+
+    def __str__(self):
+        target = self.course.title if self.course_id else "공통"
+        return f"{self.name} ({target}, v{self.version})"
+
+    def save(self, *args, **kwargs):
+        # 수정 시 버전을 올려 캐시된 PDF 배경을 다시 만들도록 함
+        if self.pk is not None:
+            self.version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "version"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def available_for_course(cls, course):
+        """과정에서 사용할 수 있는 템플릿 (과정 전용 + 공통)"""
+        return cls.objects.filter(Q(course=course) | Q(course__isnull=True))
+
+    @classmethod
+    def defaults_for_courses(cls, course_ids):
+        """과정별 기본 템플릿 ({과정 ID: 템플릿})
+
+        과정 전용 기본 템플릿이 없으면 공통 기본 템플릿을 사용하고,
+        둘 다 없는 과정은 결과에 포함하지 않습니다. (내장 디자인 사용)
+        """
+        course_ids = set(course_ids)
+        templates = cls.objects.filter(
+            Q(course_id__in=course_ids) | Q(course__isnull=True), is_default=True
+        ).order_by("-updated_at")
+
+        defaults = {}
+        common = None
+        for template in templates:
+            if template.course_id is None:
+                common = common or template
+            else:
+                defaults.setdefault(template.course_id, template)
+        if common:
+            for course_id in course_ids:
+                defaults.setdefault(course_id, common)
+        return defaults
+
+    @classmethod
+    def default_for_course(cls, course):
+        """과정의 기본 템플릿 (없으면 None)"""
+        return cls.defaults_for_courses([course.id]).get(course.id)
+
+
 class Certificate(models.Model):
     """수료증 모델
 
@@ -380,6 +616,14 @@ class Certificate(models.Model):
     pdf_file = models.FileField(
         upload_to=certificate_upload_path, blank=True, null=True
     )
+    template = models.ForeignKey(
+        CertificateTemplate,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="certificates",
+        help_text="발급 시 사용한 템플릿 (비어 있으면 내장 디자인)",
+    )
 
     def __str__(self):
         return f"{self.user.username}의 {self.enrollment.course.title} 수료증"
@@ -404,239 +648,93 @@ class Certificate(models.Model):
 
         ReportLab을 사용하여 수료증 PDF 파일을 생성하고,
         파일 객체를 pdf_file 필드에 저장합니다.
+        요청 처리 중에는 직접 호출하지 말고 request_pdf()로 워커에 맡깁니다.
         """
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib import colors
-        from reportlab.platypus import (
-            SimpleDocTemplate,
-            Paragraph,
-            Spacer,
-            Image,
-            Table,
-            TableStyle,
-        )
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-        from io import BytesIO
-        from django.contrib.staticfiles.finders import find as find_static_file
         from django.core.files.base import ContentFile
+        from .certificates import certificate_pdf_filename, render_certificate_pdf
 
-        # 폰트 등록 (한글 지원을 위해)
-        font_path = find_static_file("fonts/NanumGothic.ttf")
-        if font_path:
-            pdfmetrics.registerFont(TTFont("NanumGothic", font_path))
-            pdfmetrics.registerFont(
-                TTFont(
-                    "NanumGothicBold",
-                    find_static_file("fonts/NanumGothicBold.ttf") or font_path,
-                )
-            )
-            font_name = "NanumGothic"
-            font_name_bold = "NanumGothicBold"
-        else:
-            # 폰트를 찾지 못하면 기본 폰트 사용
-            font_name = "Helvetica"
-            font_name_bold = "Helvetica-Bold"
-
-        # 스타일 정의
-        styles = getSampleStyleSheet()
-
-        # 스타일 추가
-        styles.add(
-            ParagraphStyle(
-                name="TitleKO",
-                fontName=font_name_bold,
-                fontSize=24,
-                alignment=TA_CENTER,
-                spaceAfter=5,
-            )
-        )
+        pdf_content = render_certificate_pdf(self)
 
-        styles.add(
-            ParagraphStyle(
-                name="SubtitleKO",
-                fontName=font_name,
-                fontSize=14,
-                alignment=TA_CENTER,
-                spaceAfter=20,
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                name="BodyKO",
-                fontName=font_name,
-                fontSize=12,
-                alignment=TA_CENTER,
-                leading=18,
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                name="NameKO",
-                fontName=font_name_bold,
-                fontSize=16,
-                alignment=TA_CENTER,
-                spaceBefore=15,
-                spaceAfter=15,
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                name="CourseKO",
-                fontName=font_name_bold,
-                fontSize=18,
-                alignment=TA_CENTER,
-                spaceAfter=5,
-                textColor=colors.blue,
-            )
+        # 모델의 pdf_file 필드에 저장
+        self.pdf_file.save(
+            certificate_pdf_filename(self), ContentFile(pdf_content), save=False
         )
+        self.save(update_fields=["pdf_file"])
 
-        styles.add(
-            ParagraphStyle(
-                name="CreditKO",
-                fontName=font_name,
-                fontSize=12,
-                alignment=TA_CENTER,
-            )
-        )
+        return self.pdf_file
 
-        styles.add(
-            ParagraphStyle(
-                name="InfoLeftKO",
-                fontName=font_name,
-                fontSize=10,
-                alignment=TA_LEFT,
-            )
-        )
+    @classmethod
+    def issue_for_enrollments(cls, enrollments, batch_size=500, template=None):
+        """여러 수강 정보에 수료증을 한 번에 발급
 
-        styles.add(
-            ParagraphStyle(
-                name="InfoRightKO",
-                fontName=font_name,
-                fontSize=10,
-                alignment=TA_RIGHT,
+        수료증은 bulk_create로 생성하고, 수강 정보의 수료증 발급 상태는 bulk_update로 갱신합니다.
+        같은 수강 정보에 동시에 발급되지 않도록 대상 수강 정보를 잠근 뒤 다시 확인합니다.
+        template을 지정하지 않으면 과정별 기본 템플릿을 사용합니다.
+        발급한 수료증 목록을 반환합니다. (PDF는 생성하지 않음)
+        """
+        from .signals import certificates_issued
+
+        with transaction.atomic():
+            # certificate__isnull은 LEFT OUTER JOIN이 되어 PostgreSQL에서 FOR UPDATE를 쓸 수 없으므로
+            # 수료증 존재 여부는 NOT EXISTS 서브쿼리로 확인
+            locked = list(
+                Enrollment.objects.select_for_update()
+                .filter(id__in=[enrollment.id for enrollment in enrollments])
+                .filter(~Exists(cls.objects.filter(enrollment=OuterRef("pk"))))
+                .order_by("id")
             )
-        )
-
-        # PDF 생성
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            leftMargin=72,
-            rightMargin=72,
-            topMargin=72,
-            bottomMargin=72,
-        )
 
-        # PDF에 들어갈 요소들
-        elements = []
-
-        # 타이틀 로고
-        elements.append(Paragraph("스킬브릿지", styles["TitleKO"]))
-        elements.append(Spacer(1, 20))
-
-        # 수료증
-        elements.append(Paragraph("수료증", styles["TitleKO"]))
-        elements.append(Paragraph("Certificate of Completion", styles["SubtitleKO"]))
-        elements.append(Spacer(1, 30))
-
-        # 본문
-        elements.append(
-            Paragraph(
-                "본 증서는 아래의 교육과정을 성공적으로 이수하였음을 증명합니다.",
-                styles["BodyKO"],
-            )
-        )
-        elements.append(Spacer(1, 40))
-
-        # 수료자 이름
-        user_name = self.user.get_full_name() or self.user.username
-        elements.append(Paragraph(f"{user_name}", styles["NameKO"]))
-
-        # 과정명
-        course_title = self.enrollment.course.title
-        elements.append(Paragraph(f"{course_title}", styles["CourseKO"]))
-
-        # 학점
-        course_credit = self.enrollment.course.credit
-        elements.append(Paragraph(f"총 학점: {course_credit}학점", styles["CreditKO"]))
-        elements.append(Spacer(1, 50))
-
-        # 발급번호 및 발급일 (테이블로 배치)
-        issue_date = self.issued_at.strftime("%Y년 %m월 %d일")
-
-        data = [
-            [
-                Paragraph("발급 번호", styles["InfoLeftKO"]),
-                Paragraph("발급일", styles["InfoRightKO"]),
-            ],
-            [
-                Paragraph(f"{self.certificate_number}", styles["InfoLeftKO"]),
-                Paragraph(f"{issue_date}", styles["InfoRightKO"]),
-            ],
-        ]
+            if template is None:
+                templates = CertificateTemplate.defaults_for_courses(
+                    {enrollment.course_id for enrollment in locked}
+                )
 
-        t = Table(data, colWidths=[doc.width / 2.0, doc.width / 2.0])
-        t.setStyle(
-            TableStyle(
+            now = timezone.now()
+            certificates = []
+            for enrollment in locked:
+                certificate = cls(
+                    user_id=enrollment.user_id,
+                    enrollment=enrollment,
+                    template=template or templates.get(enrollment.course_id),
+                )
+                certificate.generate_certificate_number()
+                certificates.append(certificate)
+            cls.objects.bulk_create(certificates, batch_size=batch_size)
+
+            for enrollment, certificate in zip(locked, certificates):
+                if enrollment.completed_at is None:
+                    enrollment.completed_at = now
+                enrollment.status = "certified"
+                enrollment.certificate_number = certificate.certificate_number
+                enrollment.certificate_issued_at = certificate.issued_at
+            Enrollment.objects.bulk_update(
+                locked,
                 [
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
-
-        elements.append(t)
-        elements.append(Spacer(1, 50))
-
-        # 직인 이미지
-        seal_path = find_static_file("images/seal.png")
-        if seal_path:
-            seal = Image(seal_path, width=100, height=100)
-            seal.hAlign = "CENTER"
-            elements.append(seal)
-        else:
-            # 직인 이미지가 없는 경우, 텍스트로 대체
-            elements.append(Paragraph("(직인)", styles["BodyKO"]))
-
-        elements.append(Spacer(1, 20))
-
-        # 기관명
-        elements.append(Paragraph("스킬브릿지", styles["BodyKO"]))
-        elements.append(Paragraph("대표: 홍길동", styles["BodyKO"]))
-
-        # 배경에 테두리 추가를 위한 후처리 함수
-        def add_border(canvas, doc):
-            canvas.saveState()
-            canvas.setStrokeColor(colors.black)
-            canvas.setLineWidth(1)
-            canvas.rect(
-                doc.leftMargin - 10,
-                doc.bottomMargin - 10,
-                doc.width + 20,
-                doc.height + 20,
+                    "status",
+                    "completed_at",
+                    "certificate_number",
+                    "certificate_issued_at",
+                ],
+                batch_size=batch_size,
             )
-            canvas.restoreState()
-
-        # PDF 생성 (배경 테두리 추가)
-        doc.build(elements, onFirstPage=add_border, onLaterPages=add_border)
 
-        # PDF 파일 저장
-        pdf_content = buffer.getvalue()
-        buffer.close()
-
-        # 파일명 생성 (타임스탬프 추가로 유니크하게)
-        from datetime import datetime
+            # bulk_create는 post_save를 보내지 않으므로 발급 시그널을 따로 보냄
+            if certificates:
+                transaction.on_commit(
+                    lambda: certificates_issued.send(
+                        sender=cls, certificates=certificates
+                    )
+                )
 
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        pdf_filename = f"certificate_{self.certificate_number}_{timestamp}.pdf"
+        return certificates
 
-        # 모델의 pdf_file 필드에 저장
-        self.pdf_file.save(pdf_filename, ContentFile(pdf_content), save=True)
+    def request_pdf(self):
+        """수료증 PDF 생성 작업 등록 (커밋 후 등록, 이미 대기 중이면 중복 등록하지 않음)"""
+        from jobs.models import Job
+        from .certificates import RENDER_CERTIFICATE_JOB
 
-        return self.pdf_file
+        Job.enqueue_on_commit(
+            RENDER_CERTIFICATE_JOB,
+            {"certificate_id": self.id},
+            dedupe_key=f"{RENDER_CERTIFICATE_JOB}:{self.id}",
+        )
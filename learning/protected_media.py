@@ -0,0 +1,151 @@
+from urllib.parse import quote
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date
+
+# Range 헤더 형식 (단일 구간만 지원: bytes=시작-끝, bytes=시작-, bytes=-마지막N바이트)
+RANGE_RE = re.compile(r"^\s*bytes=(\d*)-(\d*)\s*$")
+
+# 구간 응답을 읽을 때의 한 번에 읽는 크기
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+def protected_media_pattern():
+    """보호된 미디어 경로를 제외한 미디어 경로 정규식 (개발 서버의 미디어 제공용)"""
+    prefixes = "|".join(
+        re.escape(prefix) for prefix in settings.PROTECTED_MEDIA_PREFIXES
+    )
+    media_url = re.escape(settings.MEDIA_URL.lstrip("/"))
+    return rf"^{media_url}(?P<path>(?!{prefixes}).*)$"
+
+
+def protected_file_response(
+    request, file, filename=None, as_attachment=False, content_type=None
+):
+    """권한 확인을 마친 미디어 파일 응답
+
+    PROTECTED_MEDIA_USE_X_ACCEL이 켜져 있으면 X-Accel-Redirect 헤더만 보내고
+    파일 전송(Range, ETag, Last-Modified 처리 포함)은 nginx 내부 경로에 맡깁니다.
+    꺼져 있으면(개발 환경) Django가 같은 방식으로 직접 응답합니다.
+    file은 FileField 값 또는 미디어 폴더 기준 파일 이름이며,
+    권한 확인은 호출하는 뷰에서 먼저 해야 합니다.
+    """
+    name = getattr(file, "name", file)
+    if not name:
+        raise Http404("파일이 없습니다.")
+
+    content_type = (
+        content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+    )
+
+    if settings.PROTECTED_MEDIA_USE_X_ACCEL:
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.PROTECTED_MEDIA_INTERNAL_URL + quote(
+            name
+        )
+    else:
+        response = _file_response(request, default_storage.path(name), content_type)
+
+    if response.status_code in (200, 206):
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment, filename or os.path.basename(name)
+        )
+    # 권한이 필요한 파일이므로 공유 캐시(프록시)에 저장하지 않음
+    patch_cache_control(response, private=True)
+    return response
+
+
+def _parse_range(header, size):
+    """Range 헤더를 (시작, 끝) 바이트 위치로 변환
+
+    해석할 수 없는 형식이면 None(전체 파일 응답), 파일 범위를 벗어나면 ValueError를 냅니다.
+    """
+    match = RANGE_RE.match(header)
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # 마지막 N바이트
+        length = int(end)
+        if length == 0:
+            raise ValueError("빈 구간")
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("파일 범위를 벗어난 구간")
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _file_response(request, path, content_type):
+    """파일을 직접 전송하는 응답 (nginx를 쓰지 않는 개발 환경용)
+
+    nginx와 같은 형식의 ETag, Last-Modified를 보내고 조건부 요청(304)과
+    단일 구간 Range 요청(206/416)을 처리합니다.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404("파일을 찾을 수 없습니다.")
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    etag = f'"{last_modified:x}-{size:x}"'
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        byte_range = None
+        range_header = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        # If-Range가 현재 파일과 다르면 전체 파일 응답
+        if range_header and (
+            not if_range or if_range in (etag, http_date(last_modified))
+        ):
+            try:
+                byte_range = _parse_range(range_header, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{size}"
+
+        if response is None and byte_range is not None:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _read_range(path, start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(end - start + 1)
+        elif response is None:
+            response = FileResponse(open(path, "rb"), content_type=content_type)
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
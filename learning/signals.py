@@ -1,59 +1,70 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver, Signal
 import logging
 
-from .models import LectureProgress, MissionAttempt, ProjectSubmission, Enrollment
+from courses.signals import is_deleted_directly
+from .models import ProjectSubmission, Enrollment, LectureProgress, MissionAttempt
 
 logger = logging.getLogger("django")
 
+# 강의가 미완료 -> 완료로 바뀌었을 때 발생 (완료 처리는 update()로 하므로 post_save가 발생하지 않음)
+lecture_completed = Signal()
+
+# 수료증을 bulk_create로 한꺼번에 발급했을 때 발생 (post_save가 발생하지 않음)
+certificates_issued = Signal()
+
 
-@receiver(post_save, sender=LectureProgress)
-@receiver(post_save, sender=MissionAttempt)
 @receiver(post_save, sender=ProjectSubmission)
-def update_enrollment_status(sender, instance, created=False, **kwargs):
-    """수강 진행 상태 변경 시 Enrollment 상태를 자동으로 업데이트하는 시그널 핸들러"""
-    try:
-        # 모델 유형에 따라 사용자와 과정 정보 가져오기
-        if sender == LectureProgress:
-            user = instance.user
-            course = instance.lecture.subject.course
-            item_type = "lecture"
-        elif sender == MissionAttempt:
-            # 미션이 통과된 경우에만 상태 체크
-            if not instance.is_passed:
-                return
-            user = instance.user
-            course = instance.lecture.subject.course
-            item_type = "mission"
-        elif sender == ProjectSubmission:
-            # 프로젝트가 통과된 경우에만 상태 체크
-            if not instance.is_passed:
-                return
-            user = instance.user
-            course = instance.subject.course
-            item_type = "project"
-
-        # 수강 정보 가져오기
-        enrollment = Enrollment.objects.get(user=user, course=course)
-
-        # 이전 상태 기록
-        previous_status = enrollment.status
-
-        # 완료 여부 체크 및 상태 업데이트
-        enrollment.check_completion()
-
-        # 상태 변경 로깅
-        if previous_status != enrollment.status:
-            logger.info(
-                f"Enrollment status updated: user={user.username}, course={course.title}, "
-                f"from={previous_status}, to={enrollment.status}, triggered_by={item_type}"
-            )
+@receiver(post_delete, sender=ProjectSubmission)
+def update_passed_exam_count(sender, instance, created=False, **kwargs):
+    """프로젝트 평가 결과 변경 시 통과한 시험 과목 수를 재집계하는 시그널 핸들러
+
+    강의 완료와 미션 통과는 해당 모델에서 집계를 직접 증가시키므로,
+    통과/불합격이 번복될 수 있는 프로젝트 평가만 시그널로 처리합니다.
+    """
+    # 새로 제출된 (아직 평가 전인) 프로젝트는 집계에 영향 없음
+    if created and not instance.is_passed:
+        return
 
+    try:
+        enrollment = Enrollment.objects.get(id=instance.enrollment_id)
     except Enrollment.DoesNotExist:
-        logger.warning(
-            f"Enrollment not found for user_id={instance.user.id}, triggered_by={sender.__name__}"
-        )
-    except Exception as e:
-        logger.error(
-            f"Error updating enrollment status: {str(e)}, triggered_by={sender.__name__}"
+        # 수강 정보 삭제로 인해 함께 삭제되는 경우
+        return
+
+    # 이전 상태 기록
+    previous_status = enrollment.status
+
+    # 통과한 시험 과목 수 재집계 및 수료 여부 체크
+    enrollment.refresh_passed_exam_count()
+
+    # 상태 변경 로깅
+    if previous_status != enrollment.status:
+        logger.info(
+            f"Enrollment status updated: enrollment={enrollment.id}, "
+            f"from={previous_status}, to={enrollment.status}, triggered_by=project"
         )
+
+
+@receiver(post_delete, sender=LectureProgress)
+@receiver(post_delete, sender=MissionAttempt)
+def recompute_counters_on_progress_delete(sender, instance, origin=None, **kwargs):
+    """완료한 강의 기록/통과한 미션 응시 기록 삭제 시 진행 상황 집계 재계산
+
+    강의 완료와 미션 통과 집계는 증가만 하므로, 기록이 삭제되면 수강 정보 단위로 다시 계산합니다.
+    강의/과목 삭제로 함께 삭제되는 경우는 강의/과목 시그널에서 과정 단위로 재계산하고,
+    수강 정보/사용자 삭제로 함께 삭제되는 경우는 집계할 수강 정보가 없으므로 건너뜁니다.
+    """
+    if origin is None or not is_deleted_directly(origin, sender):
+        return
+    counted = (
+        instance.is_completed
+        if sender is LectureProgress
+        else instance.is_passed and instance.lecture.lecture_type == "mission"
+    )
+    if not counted:
+        return
+
+    Enrollment.recompute_progress_counters(
+        Enrollment.objects.filter(id=instance.enrollment_id)
+    )
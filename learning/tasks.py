@@ -0,0 +1,25 @@
+import logging
+
+from jobs.registry import register
+from .certificates import RENDER_CERTIFICATE_JOB
+from .models import Certificate
+
+logger = logging.getLogger("django")
+
+
+@register(RENDER_CERTIFICATE_JOB)
+def render_certificate(payload):
+    """수료증 PDF 생성 작업"""
+    certificate = (
+        Certificate.objects.select_related("user", "enrollment__course", "template")
+        .filter(id=payload["certificate_id"])
+        .first()
+    )
+    if certificate is None:
+        # 작업 등록 후 수료증이 삭제된 경우
+        return
+    if certificate.pdf_file:
+        return
+
+    certificate.generate_pdf()
+    logger.info(f"Generated PDF for certificate {certificate.id}")
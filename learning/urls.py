@@ -22,6 +22,18 @@ urlpatterns = [
         views.VideoLectureView.as_view(),
         name="video_lecture",
     ),
+    # 동영상 강의 파일 - 권한 확인 후 동영상 전송 (탐색 지원)
+    path(
+        "lecture/video/<int:lecture_id>/file/",
+        views.LectureVideoFileView.as_view(),
+        name="lecture_video_file",
+    ),
+    # 동영상 강의 HLS 파일 - 권한 확인 후 재생목록/세그먼트 전송 (화질 자동 전환)
+    path(
+        "lecture/video/<int:lecture_id>/hls/<path:path>",
+        views.LectureHLSFileView.as_view(),
+        name="lecture_hls_file",
+    ),
     # 미션(퀴즈) 페이지 - 강의 관련 퀴즈 문제 풀기
     path(
         "lecture/mission/<int:lecture_id>/", views.MissionView.as_view(), name="mission"
@@ -44,6 +56,12 @@ urlpatterns = [
         views.ProjectDetailView.as_view(),
         name="project_detail",
     ),
+    # 프로젝트 제출 파일 다운로드 - 제출자 본인 또는 관리자만 가능
+    path(
+        "project/<int:submission_id>/file/",
+        views.DownloadProjectFileView.as_view(),
+        name="download_project_file",
+    ),
     # 수료증 발급 - 과정 완료 후 수료증 발급 요청
     path(
         "enrollment/<int:enrollment_id>/certificate/issue/",
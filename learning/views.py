@@ -1,13 +1,19 @@
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
-from django.http import FileResponse
+from django.http import Http404
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views import View
 from django.views.generic import TemplateView, FormView, DetailView
 import logging
+import posixpath
+import time
 
+from courses.missions import get_answer_key, grade_answers
 from courses.models import Course, Subject, Lecture, MissionQuestion, QnAQuestion
+from courses.video import HLS_CONTENT_TYPES, hls_file_name
+from uploads.mixins import ResumableUploadMixin
 from .forms import ProjectSubmissionForm
 from .models import (
     Enrollment,
@@ -15,7 +21,9 @@ from .models import (
     MissionAttempt,
     ProjectSubmission,
     Certificate,
+    CertificateTemplate,
 )
+from .protected_media import protected_file_response
 
 logger = logging.getLogger("django")
 
@@ -91,9 +99,11 @@ class NextItemView(LoginRequiredMixin, View):
     """현재 강의 다음의 학습 항목으로 이동"""
 
     def get(self, request, lecture_id):
-        lecture = get_object_or_404(Lecture, id=lecture_id)
+        lecture = get_object_or_404(
+            Lecture.objects.select_related("subject"), id=lecture_id
+        )
 
-        # 다음 학습 항목 가져오기
+        # 다음 학습 항목 가져오기 (캐시된 과정 목차 사용)
         item_type, item = lecture.get_next_learning_item()
 
         # 항목 유형에 따라 적절한 URL로 리다이렉트
@@ -195,6 +205,53 @@ class VideoLectureView(LoginRequiredMixin, DetailView):
         return context
 
 
+class LectureVideoFileView(LoginRequiredMixin, View):
+    """강의 동영상 파일 전송
+
+    관리자와 해당 과정 수강생만 볼 수 있습니다.
+    동영상 탐색(Range 요청)을 지원합니다.
+    """
+
+    def get_lecture(self, request, lecture_id):
+        lecture = get_object_or_404(
+            Lecture.objects.select_related("subject"), id=lecture_id
+        )
+
+        # 권한 확인 (관리자 또는 수강생)
+        if (
+            not request.user.is_admin
+            and not Enrollment.objects.filter(
+                user=request.user, course_id=lecture.subject.course_id
+            ).exists()
+        ):
+            raise PermissionDenied
+
+        return lecture
+
+    def get(self, request, lecture_id):
+        lecture = self.get_lecture(request, lecture_id)
+        return protected_file_response(request, lecture.video_file)
+
+
+class LectureHLSFileView(LectureVideoFileView):
+    """강의 동영상 HLS 재생목록/세그먼트 전송
+
+    마스터 재생목록의 상대 경로(화질별 재생목록, 세그먼트)도 이 뷰로 요청됩니다.
+    """
+
+    def get(self, request, lecture_id, path):
+        lecture = self.get_lecture(request, lecture_id)
+        name = hls_file_name(lecture, path)
+        if name is None:
+            raise Http404("HLS 파일을 찾을 수 없습니다.")
+
+        return protected_file_response(
+            request,
+            name,
+            content_type=HLS_CONTENT_TYPES.get(posixpath.splitext(name)[1]),
+        )
+
+
 class MissionView(LoginRequiredMixin, View):
     """미션(쪽지시험) 수행
 
@@ -205,7 +262,11 @@ class MissionView(LoginRequiredMixin, View):
     template_name = "learning/mission.html"
 
     def get(self, request, lecture_id):
-        lecture = get_object_or_404(Lecture, id=lecture_id, lecture_type="mission")
+        lecture = get_object_or_404(
+            Lecture.objects.select_related("subject__course"),
+            id=lecture_id,
+            lecture_type="mission",
+        )
 
         # 수강 신청 여부 확인
         enrollment = get_object_or_404(
@@ -238,7 +299,11 @@ class MissionView(LoginRequiredMixin, View):
         return render(request, self.template_name, context)
 
     def post(self, request, lecture_id):
-        lecture = get_object_or_404(Lecture, id=lecture_id, lecture_type="mission")
+        lecture = get_object_or_404(
+            Lecture.objects.select_related("subject__course"),
+            id=lecture_id,
+            lecture_type="mission",
+        )
 
         logger.info(
             f"User {request.user.username} submitted answers for mission: {lecture.title}"
@@ -294,31 +359,34 @@ class MissionResultView(LoginRequiredMixin, DetailView):
 
     def get_object(self, queryset=None):
         attempt_id = self.kwargs.get(self.pk_url_kwarg)
-        return get_object_or_404(MissionAttempt, id=attempt_id, user=self.request.user)
+        return get_object_or_404(
+            MissionAttempt.objects.select_related("lecture__subject__course"),
+            id=attempt_id,
+            user=self.request.user,
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        attempt = self.get_object()
+        attempt = self.object
         lecture = attempt.lecture
 
+        # 채점과 같은 정답 키로 문제별 정답 여부 판단
+        grading = grade_answers(get_answer_key(lecture.id), attempt.user_answers)
+
         # 문제 정보 가져오기
         questions = MissionQuestion.objects.filter(lecture=lecture).order_by(
             "order_index"
         )
 
         # 문제별 사용자 답안 및 정답 매칭
-        results = []
-        for question in questions:
-            user_answer = attempt.user_answers.get(str(question.id), None)
-            is_correct = user_answer and int(user_answer) == question.correct_answer
-
-            results.append(
-                {
-                    "question": question,
-                    "user_answer": user_answer,
-                    "is_correct": is_correct,
-                }
-            )
+        results = [
+            {
+                "question": question,
+                "user_answer": attempt.user_answers.get(str(question.id), None),
+                "is_correct": grading.get(question.id, False),
+            }
+            for question in questions
+        ]
 
         context.update(
             {
@@ -333,7 +401,7 @@ class MissionResultView(LoginRequiredMixin, DetailView):
         return context
 
 
-class SubmitProjectView(LoginRequiredMixin, FormView):
+class SubmitProjectView(LoginRequiredMixin, ResumableUploadMixin, FormView):
     """프로젝트 제출 (중간/기말고사)
 
     중간/기말고사 프로젝트를 제출합니다.
@@ -341,6 +409,7 @@ class SubmitProjectView(LoginRequiredMixin, FormView):
 
     template_name = "learning/submit_project.html"
     form_class = ProjectSubmissionForm
+    resumable_upload_fields = {"project_file": "project_file"}
 
     def dispatch(self, request, *args, **kwargs):
         self.subject = get_object_or_404(Subject, id=self.kwargs.get("subject_id"))
@@ -383,6 +452,7 @@ class SubmitProjectView(LoginRequiredMixin, FormView):
         submission.subject = self.subject
         submission.enrollment = self.enrollment
         submission.save()
+        self.discard_resumable_uploads()
 
         messages.success(self.request, "프로젝트가 성공적으로 제출되었습니다.")
         return redirect("learning:project_detail", submission_id=submission.id)
@@ -422,6 +492,27 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
         return context
 
 
+class DownloadProjectFileView(LoginRequiredMixin, View):
+    """프로젝트 제출 파일 다운로드
+
+    제출자 본인과 관리자만 받을 수 있습니다.
+    """
+
+    def get(self, request, submission_id):
+        submission = get_object_or_404(ProjectSubmission, id=submission_id)
+
+        # 권한 확인 (제출자 본인 또는 관리자)
+        if submission.user != request.user and not request.user.is_admin:
+            logger.warning(
+                f"Unauthorized project file download attempt: user={request.user.username}, submission={submission_id}"
+            )
+            raise PermissionDenied
+
+        return protected_file_response(
+            request, submission.project_file, as_attachment=True
+        )
+
+
 class IssueCertificateView(LoginRequiredMixin, View):
     """수료증 발급
 
@@ -453,7 +544,11 @@ class IssueCertificateView(LoginRequiredMixin, View):
                 return redirect("learning:dashboard")
 
         # 수료증 발급
-        certificate = Certificate(user=request.user, enrollment=enrollment)
+        certificate = Certificate(
+            user=request.user,
+            enrollment=enrollment,
+            template=CertificateTemplate.default_for_course(enrollment.course),
+        )
 
         # 고유 번호 생성
         certificate.generate_certificate_number()
@@ -461,11 +556,11 @@ class IssueCertificateView(LoginRequiredMixin, View):
             f"Certificate created with number {certificate.certificate_number} for user {request.user.username}"
         )
 
-        # PDF 생성 (실제 구현 필요)
-        # certificate.generate_pdf()
-
         certificate.save()
 
+        # PDF는 백그라운드 워커에서 생성 (run_jobs 명령)
+        certificate.request_pdf()
+
         # 수강 상태 업데이트
         enrollment.status = "certified"
         enrollment.certificate_number = certificate.certificate_number
@@ -512,7 +607,28 @@ class ViewCertificateView(LoginRequiredMixin, DetailView):
 
 
 class DownloadCertificateView(LoginRequiredMixin, View):
-    """수료증 PDF 다운로드"""
+    """수료증 PDF 다운로드
+
+    PDF가 아직 없으면 요청 처리 중에 직접 생성하지 않고 워커에 생성 작업을 맡긴 뒤,
+    CERTIFICATE_PDF_WAIT_SECONDS초 동안만 기다렸다가 준비 중 안내를 보여줍니다.
+    """
+
+    poll_interval = 0.2
+
+    def wait_for_pdf(self, certificate):
+        """PDF 생성 작업 등록 후 잠시 대기 (생성되면 True)"""
+        logger.info(f"Requesting PDF for certificate {certificate.id}")
+        certificate.request_pdf()
+
+        deadline = time.monotonic() + getattr(
+            settings, "CERTIFICATE_PDF_WAIT_SECONDS", 1
+        )
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            certificate.refresh_from_db(fields=["pdf_file"])
+            if certificate.pdf_file:
+                return True
+        return False
 
     def get(self, request, certificate_id):
         certificate = get_object_or_404(Certificate, id=certificate_id)
@@ -524,22 +640,25 @@ class DownloadCertificateView(LoginRequiredMixin, View):
             )
             raise PermissionDenied
 
-        # 수료증 PDF 파일이 없으면 생성
-        if not certificate.pdf_file:
-            logger.info(f"Generating PDF for certificate {certificate_id}")
-            certificate.generate_pdf()
-            certificate.save()
+        # 수료증 PDF 파일이 없으면 생성 작업을 등록하고 잠시만 기다림
+        if not certificate.pdf_file and not self.wait_for_pdf(certificate):
+            messages.info(
+                request,
+                "수료증 PDF를 준비하고 있습니다. 잠시 후 다시 다운로드해주세요.",
+            )
+            return redirect("learning:view_certificate", certificate_id=certificate.id)
 
         # PDF 파일 제공
         try:
             logger.info(
                 f"User {request.user.username} downloading certificate {certificate_id}"
             )
-            return FileResponse(
-                open(certificate.pdf_file.path, "rb"),
-                content_type="application/pdf",
-                as_attachment=True,
+            return protected_file_response(
+                request,
+                certificate.pdf_file,
                 filename=f"수료증_{certificate.certificate_number}.pdf",
+                as_attachment=True,
+                content_type="application/pdf",
             )
         except Exception as e:
             logger.error(f"Certificate download failed: {str(e)}")
@@ -1,28 +1,37 @@
 from django.contrib import admin
-from .models import Cart, CartItem, Payment
+from .models import Cart, CartItem, Order, OrderItem
 
 
-@admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+    raw_id_fields = ("course",)
+    readonly_fields = ("refunded_at",)
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
     list_display = (
         "id",
+        "merchant_uid",
         "user",
-        "course",
-        "amount",
-        "payment_status",
+        "total_amount",
+        "refunded_amount",
+        "status",
         "payment_method",
         "created_at",
     )
-    list_filter = ("payment_status", "payment_method", "created_at")
+    list_filter = ("status", "payment_method", "created_at")
     search_fields = (
         "user__username",
         "user__email",
-        "course__title",
         "merchant_uid",
         "imp_uid",
     )
     date_hierarchy = "created_at"
     readonly_fields = ("merchant_uid", "imp_uid", "created_at", "updated_at")
+    list_select_related = ("user",)
+    inlines = [OrderItemInline]
 
 
 class CartItemInline(admin.TabularInline):
@@ -0,0 +1,223 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+import logging
+
+from learning.models import Enrollment
+from .models import Cart, CartItem, Order, OrderItem
+from .payment_client import PortOneError, payment_client
+from .signals import checkout_completed
+
+logger = logging.getLogger("django")
+
+# 포트원 결제 확인 작업 이름 (웹훅 수신 시 등록)
+CONFIRM_ORDER_JOB = "payments.confirm_order"
+
+
+class CheckoutError(Exception):
+    """결제 완료 처리를 할 수 없는 경우 (예: 빈 장바구니)"""
+
+
+def get_or_create_pending_order(user, merchant_uid=None):
+    """장바구니로 결제 대기 주문 생성 (결제 버튼을 눌러 결제를 시작할 때 호출)
+
+    결제 전에 주문번호와 결제할 과정/금액을 저장해 두므로,
+    결제 후 브라우저가 결제 검증을 요청하지 못해도 웹훅이나 reconcile_payments 명령으로 완료 처리할 수 있습니다.
+    결제창을 닫고 다시 결제하는 경우처럼, 아직 결제를 시도하지 않은(결제 검증/웹훅이 없는) 대기 주문의
+    과정과 금액이 장바구니와 같으면 새로 만들지 않고 그 주문을 반환합니다.
+    """
+    with transaction.atomic():
+        # 같은 사용자의 동시 요청으로 주문이 두 개 생기지 않도록 장바구니 행을 잠금
+        Cart.objects.select_for_update().filter(user=user).first()
+        items = sorted(
+            CartItem.objects.filter(cart__user=user).values_list(
+                "course_id", "course__price"
+            )
+        )
+        if not items:
+            raise CheckoutError("장바구니가 비어 있습니다.")
+        total_amount = int(sum(price for _, price in items))
+
+        order = (
+            Order.objects.filter(
+                user=user,
+                status="pending",
+                payment_attempted_at__isnull=True,
+                total_amount=total_amount,
+            )
+            .order_by("-created_at")
+            .first()
+        )
+        if order is not None and items == sorted(
+            order.items.values_list("course_id", "amount")
+        ):
+            return order
+
+        order = Order.objects.create(
+            user=user,
+            merchant_uid=merchant_uid or payment_client.generate_merchant_uid(),
+            total_amount=total_amount,
+            status="pending",
+        )
+        OrderItem.objects.bulk_create(
+            [
+                OrderItem(order=order, course_id=course_id, amount=price)
+                for course_id, price in items
+            ]
+        )
+    return order
+
+
+def finalize_checkout(order, imp_uid, payment_method=""):
+    """검증된 결제로 주문을 완료 처리
+
+    주문 크기와 관계없이 일정한 수의 쿼리로 처리합니다.
+    (주문 잠금, 주문 항목 조회, 기존 수강 조회, 주문 갱신, 수강 bulk_create, 장바구니 삭제 각 1회)
+    bulk_create는 post_save를 보내지 않으므로 커밋 후 checkout_completed 시그널을 보냅니다.
+
+    결제 검증, 웹훅, reconcile_payments 명령에서 같은 주문을 동시에 또는 여러 번 처리해도
+    주문 행을 잠그고 결제 전(대기/실패) 상태일 때만 처리하므로 한 번만 완료 처리됩니다.
+
+    반환 형식: {"order_id": ..., "order_item_ids": [...], "enrollment_ids": [...], "created": bool}
+    (created는 이번 호출에서 완료 처리했는지 여부, enrollment_ids에는 새로 생성한 수강 정보만 포함)
+    """
+    try:
+        with transaction.atomic():
+            order = Order.objects.select_for_update().get(id=order.id)
+            item_ids, course_ids = [], []
+            for item_id, course_id in order.items.values_list("id", "course_id"):
+                item_ids.append(item_id)
+                course_ids.append(course_id)
+
+            if order.status not in Order.UNPAID_STATUSES:
+                logger.info(f"Checkout already finalized: {order.merchant_uid}")
+                return {
+                    "order_id": order.id,
+                    "order_item_ids": item_ids,
+                    "enrollment_ids": [],
+                    "created": False,
+                }
+
+            enrolled_course_ids = set(
+                Enrollment.objects.filter(
+                    user_id=order.user_id, course_id__in=course_ids
+                ).values_list("course_id", flat=True)
+            )
+
+            order.imp_uid = imp_uid
+            order.status = "completed"
+            order.payment_method = payment_method
+            order.save(
+                update_fields=["imp_uid", "status", "payment_method", "updated_at"]
+            )
+
+            # 결제 후 탈퇴한 사용자는 수강 등록 없이 결제만 완료 처리
+            enrollments = []
+            if order.user_id:
+                enrollments = Enrollment.objects.bulk_create(
+                    [
+                        Enrollment(
+                            user_id=order.user_id,
+                            course_id=course_id,
+                            status="enrolled",
+                            progress_percentage=0,
+                        )
+                        for course_id in course_ids
+                        if course_id not in enrolled_course_ids
+                    ]
+                )
+
+                # 하위 객체가 없는 모델이므로 DELETE 한 번으로 삭제됨
+                CartItem.objects.filter(
+                    cart__user_id=order.user_id, course_id__in=course_ids
+                ).delete()
+
+            transaction.on_commit(
+                lambda: checkout_completed.send(
+                    sender=Order, order=order, enrollments=enrollments
+                )
+            )
+    except IntegrityError:
+        # 같은 포트원 거래번호로 이미 다른 주문이 완료된 경우
+        raise CheckoutError("이미 다른 주문에 사용된 결제입니다.")
+
+    logger.info(
+        f"Checkout finalized: user_id={order.user_id}, merchant_uid={order.merchant_uid}, "
+        f"items={len(item_ids)}, new_enrollments={len(enrollments)}, "
+        f"existing_enrollments={len(enrolled_course_ids)}"
+    )
+    return {
+        "order_id": order.id,
+        "order_item_ids": item_ids,
+        "enrollment_ids": [enrollment.id for enrollment in enrollments],
+        "created": True,
+    }
+
+
+def request_order_confirmation(merchant_uid):
+    """포트원 결제 확인 작업 등록 (같은 주문은 하나만 대기)"""
+    from jobs.models import Job
+
+    return Job.enqueue(
+        CONFIRM_ORDER_JOB,
+        {"merchant_uid": merchant_uid},
+        dedupe_key=f"{CONFIRM_ORDER_JOB}:{merchant_uid}",
+        max_attempts=5,
+    )
+
+
+def mark_payment_attempted(orders):
+    """결제 검증 요청이나 웹훅을 받은 주문으로 표시
+
+    표시된 주문은 이미 결제가 진행되었을 수 있으므로 결제 시작 시 다시 사용하지 않습니다.
+    """
+    return orders.filter(payment_attempted_at__isnull=True).update(
+        payment_attempted_at=timezone.now()
+    )
+
+
+def mark_order_failed(order, reason):
+    """결제 대기 주문을 결제 실패로 변경 (이미 처리된 주문이면 False)"""
+    updated = Order.objects.filter(id=order.id, status="pending").update(
+        status="failed"
+    )
+    if updated:
+        order.status = "failed"
+        logger.warning(f"Order {order.merchant_uid} marked failed: {reason}")
+    return bool(updated)
+
+
+def confirm_order(order):
+    """포트원 결제 내역으로 결제 전(대기/실패) 주문 확정
+
+    결제 완료이고 금액이 주문 금액과 같으면 완료 처리, 결제 실패/취소 또는 금액이 다르면 실패 처리합니다.
+    아직 결제 내역이 없거나 입금 대기(가상계좌)인 경우 상태를 바꾸지 않습니다.
+    실패한 주문도 같은 주문번호로 다시 결제했을 수 있으므로 확인합니다.
+    포트원 통신 오류는 PortOneError로 전달합니다.
+
+    반환: 처리 후 주문 상태 ("pending", "completed", "failed" 등)
+    """
+    if order.status not in Order.UNPAID_STATUSES:
+        return order.status
+
+    try:
+        payment = payment_client.find_payment(merchant_uid=order.merchant_uid)
+    except PortOneError as e:
+        if e.status == 404:
+            return order.status
+        raise
+
+    if payment["status"] == "paid":
+        if payment["amount"] != order.total_amount:
+            logger.error(
+                f"Payment amount mismatch: merchant_uid={order.merchant_uid}, "
+                f"order={order.total_amount}, paid={payment['amount']}"
+            )
+            mark_order_failed(order, "결제 금액이 주문 금액과 다릅니다.")
+            return order.status
+        finalize_checkout(order, payment["imp_uid"], payment.get("pay_method", ""))
+        order.refresh_from_db(fields=["status"])
+        return order.status
+
+    if payment["status"] in ("failed", "cancelled"):
+        mark_order_failed(order, f"포트원 결제 상태: {payment['status']}")
+    return order.status
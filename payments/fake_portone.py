@@ -0,0 +1,273 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import urlsplit
+import json
+import threading
+import time
+import uuid
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class FakePortOne:
+    """로컬에서 포트원 REST API를 흉내 내는 가짜 포트원
+
+    실제 결제 없이 결제 검증/환불 흐름을 확인할 때 사용하며, 토큰 발급, 결제 조회, 결제 취소만 지원합니다.
+    네트워크 없이 쓰려면 FakePortOneTransport로, 다른 프로세스에서 쓰려면 FakePortOneServer로 실행합니다.
+
+        portone = FakePortOne()
+        portone.add_payment("imp_123", "ORD-20260101-ABC", 10000)
+        client = PortOneClient(transport=FakePortOneTransport(portone))
+        ...
+        portone.request_count("/payments/find/")  # 포트원 결제 조회 횟수
+
+    결제 등록은 POST /fake/payments (JSON: imp_uid, merchant_uid, amount, ...)로도 할 수 있습니다.
+    """
+
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.payments = {}
+        self.requests = []
+        self.tokens = set()
+        # 다음 요청들에 돌려줄 오류 응답 상태 코드 (재시도 확인용)
+        self.failures = []
+        self.lock = threading.Lock()
+
+    def add_payment(
+        self, imp_uid, merchant_uid, amount, status="paid", pay_method="card"
+    ):
+        """조회할 수 있는 결제 등록"""
+        payment = {
+            "imp_uid": imp_uid,
+            "merchant_uid": merchant_uid,
+            "amount": amount,
+            "cancel_amount": 0,
+            "status": status,
+            "pay_method": pay_method,
+            "paid_at": int(time.time()) if status == "paid" else 0,
+            "cancel_history": [],
+        }
+        with self.lock:
+            self.payments[imp_uid] = payment
+        return payment
+
+    def fail_next(self, count=1, status=503):
+        """다음 count개의 요청에 status 오류 응답"""
+        with self.lock:
+            self.failures.extend([status] * count)
+
+    def request_count(self, path_prefix=""):
+        """경로가 path_prefix로 시작하는 요청 수 (토큰 발급 포함 전체는 빈 문자열)"""
+        with self.lock:
+            return sum(1 for _, path in self.requests if path.startswith(path_prefix))
+
+    def find_payment(self, imp_uid=None, merchant_uid=None):
+        with self.lock:
+            if imp_uid:
+                return self.payments.get(imp_uid)
+            return next(
+                (
+                    p
+                    for p in self.payments.values()
+                    if p["merchant_uid"] == merchant_uid
+                ),
+                None,
+            )
+
+    def cancel_payment(self, payment, amount, reason):
+        with self.lock:
+            remaining = payment["amount"] - payment["cancel_amount"]
+            amount = amount or remaining
+            if (
+                payment["status"] not in ("paid", "cancelled")
+                or not 0 < amount <= remaining
+            ):
+                return None
+            payment["cancel_amount"] += amount
+            payment["cancel_history"].append(
+                {"amount": amount, "reason": reason, "cancelled_at": int(time.time())}
+            )
+            if payment["cancel_amount"] == payment["amount"]:
+                payment["status"] = "cancelled"
+            return dict(payment)
+
+    def handle(self, method, path, headers, content):
+        """요청 하나를 처리해 (HTTP 상태 코드, 응답 JSON) 반환"""
+        path = urlsplit(path).path
+        with self.lock:
+            self.requests.append((method, path))
+            failure = self.failures.pop(0) if self.failures else None
+        if self.latency:
+            time.sleep(self.latency)
+        if failure:
+            return self._response(failure, -1, "일시적인 오류입니다.")
+
+        try:
+            body = json.loads(content or b"{}")
+        except ValueError:
+            return self._response(400, -1, "잘못된 요청입니다.")
+
+        if method == "POST" and path == "/fake/payments":
+            try:
+                payment = self.add_payment(**body)
+            except TypeError:
+                return self._response(
+                    400, -1, "imp_uid, merchant_uid, amount가 필요합니다."
+                )
+            return self._response(200, 0, None, payment)
+        if method == "POST" and path == "/users/getToken":
+            return self._get_token(body)
+
+        token = headers.get("Authorization") or headers.get("X-ImpTokenHeader")
+        if token not in self.tokens:
+            return self._response(401, -1, "Unauthorized")
+        if method == "GET" and path.startswith("/payments/find/"):
+            payment = self.find_payment(merchant_uid=path[len("/payments/find/") :])
+            return self._payment_response(payment)
+        if method == "POST" and path == "/payments/cancel":
+            return self._cancel(body)
+        if method == "GET" and path.startswith("/payments/"):
+            payment = self.find_payment(imp_uid=path[len("/payments/") :])
+            return self._payment_response(payment)
+        return self._response(404, -1, "지원하지 않는 API입니다.")
+
+    def _get_token(self, body):
+        if not body.get("imp_key") or not body.get("imp_secret"):
+            return self._response(
+                401, -1, "imp_key, imp_secret 파라미터가 누락되었습니다."
+            )
+        token = uuid.uuid4().hex
+        with self.lock:
+            self.tokens.add(token)
+        now = int(time.time())
+        return self._response(
+            200, 0, None, {"access_token": token, "now": now, "expired_at": now + 1800}
+        )
+
+    def _payment_response(self, payment):
+        if payment is None:
+            return self._response(404, -1, "존재하지 않는 결제정보입니다.")
+        return self._response(200, 0, None, dict(payment))
+
+    def _cancel(self, body):
+        payment = self.find_payment(
+            imp_uid=body.get("imp_uid"), merchant_uid=body.get("merchant_uid")
+        )
+        if payment is None:
+            return self._response(200, -1, "취소할 결제건이 존재하지 않습니다.")
+        cancelled = self.cancel_payment(
+            payment, body.get("amount"), body.get("reason", "")
+        )
+        if cancelled is None:
+            return self._response(200, 1, "이미 전액취소된 주문입니다.")
+        return self._response(200, 0, None, cancelled)
+
+    def _response(self, status, code, message, response=None):
+        return status, {"code": code, "message": message, "response": response}
+
+
+class FakePortOneTransport(BaseAdapter):
+    """네트워크 없이 FakePortOne으로 요청을 보내는 requests 전송 어댑터"""
+
+    def __init__(self, portone=None):
+        super().__init__()
+        self.portone = portone or FakePortOne()
+
+    def send(self, request, **kwargs):
+        status, payload = self.portone.handle(
+            request.method, request.path_url, request.headers, request.body
+        )
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.raw = BytesIO(json.dumps(payload).encode())
+        response.url = request.url
+        response.request = request
+        response.reason = "OK" if status == 200 else "Error"
+        return response
+
+    def close(self):
+        pass
+
+
+class FakePortOneServer(FakePortOne):
+    """FakePortOne을 로컬 HTTP 서버로 실행
+
+    settings.PORTONE_API_URL을 이 서버 주소로 지정하면 payment_client가 이 서버를 호출합니다.
+
+        with FakePortOneServer() as server:
+            server.add_payment("imp_123", "ORD-20260101-ABC", 10000)
+            ...
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0):
+        super().__init__(latency=latency)
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+        # 서버가 받은 TCP 연결 수 (keep-alive 재사용 확인용)
+        self.connections = 0
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler_class(self):
+        portone = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive 연결 재사용을 지원
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with portone.lock:
+                    portone.connections += 1
+
+            def log_message(self, format, *args):
+                # 요청 로그는 request_count로 확인
+                pass
+
+            def do_GET(self):
+                self.dispatch("GET")
+
+            def do_POST(self):
+                self.dispatch("POST")
+
+            def dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                status, payload = portone.handle(
+                    method, self.path, self.headers, self.rfile.read(length)
+                )
+                content = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                try:
+                    self.end_headers()
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 제한 시간 초과로 먼저 연결을 끊은 경우
+                    self.close_connection = True
+
+        return Handler
@@ -0,0 +1,82 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import InstructorProfile, User
+from courses.models import Course
+from payments.checkout import finalize_checkout, get_or_create_pending_order
+from payments.models import Cart, CartItem
+
+
+class Command(BaseCommand):
+    help = "장바구니 크기별 결제 완료 처리 쿼리 수를 측정합니다. (장바구니 크기와 관계없이 같아야 함)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1, 5, 10, 50],
+            help="측정할 장바구니 크기 목록 (기본: 1 5 10 50, SQLite는 약 90개부터 INSERT가 나뉨)",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(set(options["sizes"]))
+        if sizes[0] < 1:
+            raise CommandError("장바구니 크기는 1 이상이어야 합니다.")
+
+        # 측정용 데이터는 모두 롤백하므로 실제 데이터와 통계에 영향 없음
+        with transaction.atomic():
+            results = self.measure(sizes)
+            transaction.set_rollback(True)
+
+        for size, query_count, elapsed in results:
+            self.stdout.write(
+                f"장바구니 {size}개: 쿼리 {query_count}회, {elapsed * 1000:.1f}ms"
+            )
+
+        query_counts = {query_count for _, query_count, _ in results}
+        if len(query_counts) > 1:
+            raise CommandError("장바구니 크기에 따라 쿼리 수가 달라집니다.")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"장바구니 크기와 관계없이 쿼리 {query_counts.pop()}회로 처리됩니다."
+            )
+        )
+
+    def measure(self, sizes):
+        instructor = User.objects.create(username="checkout_benchmark_instructor")
+        profile = InstructorProfile.objects.create(user=instructor)
+        courses = Course.objects.bulk_create(
+            [
+                Course(
+                    title=f"결제 측정 과정 {i}",
+                    description="결제 완료 처리 쿼리 수 측정용 과정",
+                    difficulty_level="beginner",
+                    estimated_time=1,
+                    credit=1,
+                    price=10000,
+                    instructor=profile,
+                )
+                for i in range(sizes[-1])
+            ]
+        )
+
+        results = []
+        for size in sizes:
+            user = User.objects.create(username=f"checkout_benchmark_{size}")
+            cart = Cart.objects.create(user=user)
+            CartItem.objects.bulk_create(
+                [CartItem(cart=cart, course=course) for course in courses[:size]]
+            )
+
+            order = get_or_create_pending_order(user, f"benchmark_{size}")
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                finalize_checkout(order, f"imp_benchmark_{size}", "card")
+                elapsed = time.perf_counter() - started
+            results.append((size, len(queries), elapsed))
+        return results
@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.utils import timezone
+
+from payments.checkout import CheckoutError, confirm_order, mark_order_failed
+from payments.models import Order
+from payments.payment_client import PortOneError, payment_client
+
+
+class Command(BaseCommand):
+    help = (
+        "결제 대기 주문을 포트원 결제 내역과 대조해 완료/실패 처리합니다. "
+        "(결제 후 결제 검증 요청과 웹훅이 모두 누락된 주문 복구용, 주기적으로 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="한 번에 조회할 주문 수 (기본 100)",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=10,
+            help="생성된 지 이 시간(분)이 지난 주문만 확인, 결제 진행 중인 주문 제외용 (기본 10분)",
+        )
+        parser.add_argument(
+            "--expire-after",
+            type=int,
+            default=24,
+            help="이 시간(시간)이 지나도 결제되지 않은 주문은 실패 처리 (기본 24시간, 0: 실패 처리 안 함)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="확인할 최대 주문 수 (기본 0: 제한 없음)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        now = timezone.now()
+        created_before = now - timedelta(minutes=options["older_than"])
+        expire_before = (
+            now - timedelta(hours=options["expire_after"])
+            if options["expire_after"]
+            else None
+        )
+        limit = options["limit"]
+
+        counts = {"completed": 0, "failed": 0, "expired": 0, "pending": 0, "errors": 0}
+        checked = 0
+        last_id = 0
+        while not limit or checked < limit:
+            # 처리하면서 상태가 바뀌므로 offset 대신 마지막 id 이후로 조회
+            batch_size = options["batch_size"]
+            if limit:
+                batch_size = min(batch_size, limit - checked)
+            orders = list(
+                # 주문은 결제 버튼을 눌렀을 때만 생성되므로 모든 대기 주문이 결제를 시작한 주문
+                # (결제 후 브라우저를 닫고 웹훅까지 누락되면 결제 검증 요청/웹훅 기록이 없으므로 모두 조회)
+                Order.objects.filter(
+                    status="pending", created_at__lt=created_before, id__gt=last_id
+                ).order_by("id")[:batch_size]
+            )
+            if not orders:
+                break
+
+            for order in orders:
+                checked += 1
+                last_id = order.id
+                try:
+                    status = confirm_order(order)
+                except PortOneError as e:
+                    counts["errors"] += 1
+                    self.stderr.write(f"{order.merchant_uid}: 포트원 조회 실패 ({e})")
+                    continue
+                except CheckoutError as e:
+                    # 같은 포트원 거래번호로 다른 주문이 이미 완료된 경우 등, 나머지 주문은 계속 확인
+                    counts["errors"] += 1
+                    self.stderr.write(f"{order.merchant_uid}: 완료 처리 실패 ({e})")
+                    continue
+
+                if (
+                    status == "pending"
+                    and expire_before
+                    and order.created_at < expire_before
+                ):
+                    if mark_order_failed(order, "결제 기한 만료"):
+                        counts["expired"] += 1
+                        continue
+                counts[status] += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"결제 대기 주문 {checked}건 확인: 완료 {counts['completed']}건, "
+                f"실패 {counts['failed']}건, 기한 만료 {counts['expired']}건, "
+                f"대기 유지 {counts['pending']}건, 오류 {counts['errors']}건"
+            )
+        )
+        metrics = payment_client.metrics().get("find_payment")
+        if metrics:
+            self.stdout.write(
+                f"포트원 결제 조회 {metrics['calls']}회 "
+                f"(평균 {metrics['avg_ms']}ms, 최대 {metrics['max_ms']}ms, 재시도 {metrics['retries']}회)"
+            )
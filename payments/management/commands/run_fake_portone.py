@@ -0,0 +1,57 @@
+import signal
+import threading
+
+from django.core.management import BaseCommand, CommandError
+
+from payments.fake_portone import FakePortOneServer
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 개발용 가짜 포트원 API 서버를 실행합니다. "
+        "PORTONE_API_URL을 이 서버 주소로 지정하면 실제 포트원 대신 이 서버로 결제를 검증/환불합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--port", type=int, default=8089, help="사용할 포트 (기본 8089)"
+        )
+        parser.add_argument(
+            "--payment",
+            action="append",
+            default=[],
+            metavar="IMP_UID:MERCHANT_UID:AMOUNT",
+            help="미리 등록할 결제 완료 건 (여러 번 지정 가능)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0,
+            help="모든 응답을 지연할 시간(초), 포트원 응답 지연 재현용 (기본 0)",
+        )
+
+    def handle(self, *args, **options):
+        server = FakePortOneServer(port=options["port"], latency=options["latency"])
+        for value in options["payment"]:
+            try:
+                imp_uid, merchant_uid, amount = value.split(":")
+                server.add_payment(imp_uid, merchant_uid, int(amount))
+            except ValueError:
+                server.httpd.server_close()
+                raise CommandError(f"결제 형식이 올바르지 않습니다: {value}")
+
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+        signal.signal(signal.SIGINT, lambda signum, frame: stopped.set())
+
+        server.start()
+        self.stdout.write(
+            f"가짜 포트원 서버 시작: {server.url} (등록된 결제 {len(server.payments)}건)"
+        )
+        stopped.wait()
+        server.stop()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"가짜 포트원 서버 종료: 요청 {server.request_count()}건"
+            )
+        )
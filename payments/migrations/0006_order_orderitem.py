@@ -0,0 +1,141 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0009_lecture_media_info"),
+        ("payments", "0005_payment_anonymized_user_id_payment_is_anonymized_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Order",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "merchant_uid",
+                    models.CharField(help_text="주문번호", max_length=100, unique=True),
+                ),
+                (
+                    "imp_uid",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="포트원 거래 고유번호",
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                ("total_amount", models.PositiveIntegerField(help_text="결제 금액")),
+                (
+                    "refunded_amount",
+                    models.PositiveIntegerField(default=0, help_text="환불 금액"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "결제 대기"),
+                            ("completed", "결제 완료"),
+                            ("failed", "결제 실패"),
+                            ("partially_refunded", "부분 환불"),
+                            ("refunded", "환불 완료"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "payment_method",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("card", "신용카드"),
+                            ("trans", "계좌이체"),
+                            ("vbank", "가상계좌"),
+                            ("phone", "휴대폰"),
+                            ("kakaopay", "카카오페이"),
+                            ("naverpay", "네이버페이"),
+                        ],
+                        db_index=True,
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "is_anonymized",
+                    models.BooleanField(
+                        default=False, help_text="사용자 탈퇴로 인한 익명화 여부"
+                    ),
+                ),
+                (
+                    "anonymized_user_id",
+                    models.IntegerField(
+                        blank=True, help_text="익명화된 원본 사용자 ID", null=True
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="orders",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="OrderItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("amount", models.PositiveIntegerField(help_text="결제 금액")),
+                ("refund_reason", models.TextField(blank=True, null=True)),
+                ("refunded_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_items",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="payments.order",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("order", "course")},
+            },
+        ),
+    ]
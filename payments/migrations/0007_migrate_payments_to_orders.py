@@ -0,0 +1,139 @@
+import itertools
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def disable_auto_now(model):
+    """기존 생성/수정 시각을 그대로 옮기도록 auto_now(_add) 해제 (이 마이그레이션의 모델에만 적용)"""
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            field.auto_now = field.auto_now_add = False
+
+
+def order_status(statuses):
+    """주문에 속한 결제들의 상태로 주문 상태 결정"""
+    if "completed" in statuses:
+        return "partially_refunded" if "refunded" in statuses else "completed"
+    if statuses == {"refunded"}:
+        return "refunded"
+    return "failed" if "failed" in statuses else "pending"
+
+
+def build_order(Order, OrderItem, payments):
+    """같은 주문번호의 결제들로 주문과 주문 항목 생성
+
+    같은 과정의 결제가 중복 저장된 경우(결제 검증 중복 호출) 첫 결제만 옮깁니다.
+    """
+    lines = {}
+    for payment in payments:
+        lines.setdefault(payment.course_id, payment)
+    lines = list(lines.values())
+
+    first = payments[0]
+    order = Order(
+        user_id=next((p.user_id for p in payments if p.user_id), None),
+        merchant_uid=first.merchant_uid,
+        imp_uid=next((p.imp_uid for p in payments if p.imp_uid), None),
+        total_amount=sum(p.amount for p in lines),
+        refunded_amount=sum(p.amount for p in lines if p.payment_status == "refunded"),
+        status=order_status({p.payment_status for p in lines}),
+        payment_method=next(
+            (p.payment_method for p in payments if p.payment_method), None
+        ),
+        created_at=min(p.created_at for p in payments),
+        updated_at=max(p.updated_at for p in payments),
+        is_anonymized=any(p.is_anonymized for p in payments),
+        anonymized_user_id=next(
+            (p.anonymized_user_id for p in payments if p.anonymized_user_id), None
+        ),
+    )
+    items = [
+        OrderItem(
+            course_id=p.course_id,
+            amount=p.amount,
+            refund_reason=p.refund_reason if p.payment_status == "refunded" else None,
+            refunded_at=p.updated_at if p.payment_status == "refunded" else None,
+        )
+        for p in lines
+    ]
+    return order, items
+
+
+def save_orders(Order, OrderItem, batch):
+    orders = Order.objects.bulk_create([order for order, _ in batch])
+    items = []
+    for order, (_, order_items) in zip(orders, batch):
+        for item in order_items:
+            item.order_id = order.id
+            items.append(item)
+    OrderItem.objects.bulk_create(items, batch_size=BATCH_SIZE)
+
+
+def payments_to_orders(apps, schema_editor):
+    """주문번호별로 묶어 기존 결제 내역을 주문/주문 항목으로 옮기기"""
+    Payment = apps.get_model("payments", "Payment")
+    Order = apps.get_model("payments", "Order")
+    OrderItem = apps.get_model("payments", "OrderItem")
+    disable_auto_now(Order)
+
+    payments = Payment.objects.order_by("merchant_uid", "id").iterator(chunk_size=2000)
+    batch = []
+    for _, group in itertools.groupby(payments, key=lambda p: p.merchant_uid):
+        batch.append(build_order(Order, OrderItem, list(group)))
+        if len(batch) >= BATCH_SIZE:
+            save_orders(Order, OrderItem, batch)
+            batch = []
+    if batch:
+        save_orders(Order, OrderItem, batch)
+
+
+def orders_to_payments(apps, schema_editor):
+    """주문 항목마다 결제 내역 하나로 되돌리기 (옮긴 주문은 삭제)"""
+    Payment = apps.get_model("payments", "Payment")
+    Order = apps.get_model("payments", "Order")
+    OrderItem = apps.get_model("payments", "OrderItem")
+    disable_auto_now(Payment)
+
+    payments = []
+    for item in OrderItem.objects.select_related("order").iterator(chunk_size=2000):
+        order = item.order
+        if item.refunded_at:
+            status = "refunded"
+        elif order.status == "partially_refunded":
+            status = "completed"
+        else:
+            status = order.status
+        payments.append(
+            Payment(
+                user_id=order.user_id,
+                course_id=item.course_id,
+                amount=item.amount,
+                payment_method=order.payment_method,
+                payment_status=status,
+                merchant_uid=order.merchant_uid,
+                imp_uid=order.imp_uid,
+                refund_reason=item.refund_reason,
+                created_at=order.created_at,
+                updated_at=item.refunded_at or order.updated_at,
+                is_anonymized=order.is_anonymized,
+                anonymized_user_id=order.anonymized_user_id,
+            )
+        )
+        if len(payments) >= BATCH_SIZE:
+            Payment.objects.bulk_create(payments)
+            payments = []
+    Payment.objects.bulk_create(payments)
+    Order.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0006_order_orderitem"),
+    ]
+
+    operations = [
+        migrations.RunPython(payments_to_orders, orders_to_payments),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # 결제 테이블의 trigram 인덱스 마이그레이션이 먼저 적용되어야 함
+        ("admin_portal", "0003_search_trigram_indexes"),
+        ("payments", "0007_migrate_payments_to_orders"),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name="Payment",
+        ),
+    ]
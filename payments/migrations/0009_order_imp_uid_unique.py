@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0008_delete_payment"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="imp_uid",
+            field=models.CharField(
+                blank=True,
+                help_text="포트원 거래 고유번호 (같은 결제로 주문이 두 번 생성되지 않도록 고유)",
+                max_length=100,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0009_order_imp_uid_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="payment_attempted_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="결제 검증 요청 또는 웹훅을 처음 받은 시각 (없으면 결제창만 열고 결제하지 않은 주문)",
+                null=True,
+            ),
+        ),
+    ]
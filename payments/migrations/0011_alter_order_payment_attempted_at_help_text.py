@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0010_order_payment_attempted_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="payment_attempted_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="결제 검증 요청 또는 웹훅을 처음 받은 시각 (없으면 결제 시작 시 같은 장바구니로 다시 사용)",
+                null=True,
+            ),
+        ),
+    ]
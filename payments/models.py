@@ -1,5 +1,7 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Sum
 from django.conf import settings
+from django.utils import timezone
 from courses.models import Course
 
 
@@ -46,19 +48,24 @@ class CartItem(models.Model):
         return f"{self.cart.user.username}의 장바구니 - {self.course.title}"
 
 
-class Payment(models.Model):
-    """결제 모델
+class Order(models.Model):
+    """주문 모델
 
-    과정 구매에 대한 결제 정보를 저장합니다.
-    사용자 탈퇴 후에도 매출 통계를 위해 결제 정보는 보존됩니다.
+    한 번의 결제(주문번호)에 대한 결제 정보를 저장하며, 구매한 과정은 OrderItem에 저장합니다.
+    사용자 탈퇴 후에도 매출 통계를 위해 주문 정보는 보존됩니다.
     """
 
-    PAYMENT_STATUS_CHOICES = [
+    STATUS_CHOICES = [
         ("pending", "결제 대기"),
         ("completed", "결제 완료"),
         ("failed", "결제 실패"),
+        ("partially_refunded", "부분 환불"),
         ("refunded", "환불 완료"),
     ]
+    # 매출에 포함되는 주문 상태 (부분 환불은 환불 금액을 뺀 나머지만 매출)
+    PAID_STATUSES = ["completed", "partially_refunded"]
+    # 아직 결제되지 않은 주문 상태 (실패한 주문도 같은 주문번호로 다시 결제할 수 있으므로 확정 대상)
+    UNPAID_STATUSES = ["pending", "failed"]
 
     PAYMENT_METHOD_CHOICES = [
         ("card", "신용카드"),
@@ -72,13 +79,22 @@ class Payment(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
-        related_name="payments",
+        related_name="orders",
         null=True,
     )
-    course = models.ForeignKey(
-        Course, on_delete=models.CASCADE, related_name="payments"
+    merchant_uid = models.CharField(max_length=100, unique=True, help_text="주문번호")
+    imp_uid = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text="포트원 거래 고유번호 (같은 결제로 주문이 두 번 생성되지 않도록 고유)",
+    )
+    total_amount = models.PositiveIntegerField(help_text="결제 금액")
+    refunded_amount = models.PositiveIntegerField(default=0, help_text="환불 금액")
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="pending", db_index=True
     )
-    amount = models.PositiveIntegerField(help_text="결제 금액")
     payment_method = models.CharField(
         max_length=20,
         choices=PAYMENT_METHOD_CHOICES,
@@ -86,18 +102,11 @@ class Payment(models.Model):
         blank=True,
         db_index=True,
     )
-    payment_status = models.CharField(
-        max_length=20, choices=PAYMENT_STATUS_CHOICES, default="pending", db_index=True
-    )
-    merchant_uid = models.CharField(max_length=100, help_text="주문번호", db_index=True)
-    imp_uid = models.CharField(
-        max_length=100,
+    payment_attempted_at = models.DateTimeField(
         null=True,
         blank=True,
-        help_text="포트원 거래 고유번호",
-        db_index=True,
+        help_text="결제 검증 요청 또는 웹훅을 처음 받은 시각 (없으면 결제 시작 시 같은 장바구니로 다시 사용)",
     )
-    refund_reason = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_anonymized = models.BooleanField(
@@ -108,13 +117,92 @@ class Payment(models.Model):
     )
 
     def __str__(self):
-        username = (
-            self.user.username if self.user else f"탈퇴회원({self.anonymized_user_id})"
-        )
-        return f"{username}의 {self.course.title} 결제 ({self.get_payment_status_display()})"
+        return f"{self.get_username()}의 주문 {self.merchant_uid} ({self.get_status_display()})"
 
     def get_username(self):
         """사용자 이름 반환 (탈퇴한 경우 익명화된 표시)"""
         if self.is_anonymized:
             return f"탈퇴회원({self.anonymized_user_id})"
         return self.user.username if self.user else "알 수 없음"
+
+    @property
+    def paid_amount(self):
+        """환불 금액을 뺀 실제 결제 금액"""
+        return self.total_amount - self.refunded_amount
+
+    @property
+    def is_refundable(self):
+        return self.status in self.PAID_STATUSES
+
+    @classmethod
+    def revenue(cls, **kwargs):
+        """매출액 집계식 (환불 금액 제외, Sum의 filter 등 인자 전달 가능)"""
+        return Sum(F("total_amount") - F("refunded_amount"), **kwargs)
+
+
+class OrderItem(models.Model):
+    """주문 항목 모델
+
+    주문에서 구매한 과정별 금액과 환불 정보를 저장합니다.
+    """
+
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="order_items"
+    )
+    amount = models.PositiveIntegerField(help_text="결제 금액")
+    refund_reason = models.TextField(null=True, blank=True)
+    refunded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("order", "course")
+
+    def __str__(self):
+        return f"{self.order.merchant_uid} - {self.course.title}"
+
+    @property
+    def status_display(self):
+        """과정별 결제 상태 (부분 환불된 주문의 나머지 과정은 결제 완료)"""
+        if self.refunded_at:
+            return "환불 완료"
+        if self.order.status == "partially_refunded":
+            return "결제 완료"
+        return self.order.get_status_display()
+
+    @property
+    def is_refundable(self):
+        return self.refunded_at is None and self.order.is_refundable
+
+    def mark_refunded(self, reason):
+        """환불 완료 처리
+
+        주문의 환불 금액과 상태를 갱신하고 해당 과정의 수강 정보를 삭제합니다.
+        이미 환불된 항목이면 아무것도 하지 않고 False를 반환합니다.
+        """
+        from learning.models import Enrollment
+
+        now = timezone.now()
+        with transaction.atomic():
+            refunded = OrderItem.objects.filter(
+                id=self.id, refunded_at__isnull=True
+            ).update(refund_reason=reason, refunded_at=now)
+            if not refunded:
+                return False
+            self.refund_reason = reason
+            self.refunded_at = now
+
+            order = Order.objects.select_for_update().get(id=self.order_id)
+            order.refunded_amount += self.amount
+            order.status = (
+                "refunded"
+                if order.refunded_amount >= order.total_amount
+                else "partially_refunded"
+            )
+            order.save(update_fields=["refunded_amount", "status", "updated_at"])
+            self.order = order
+
+            if order.user_id:
+                Enrollment.objects.filter(
+                    user_id=order.user_id, course_id=self.course_id
+                ).delete()
+        return True
@@ -1,27 +1,78 @@
 from django.conf import settings
-from iamport import Iamport
+from requests.adapters import HTTPAdapter
+import requests
 
 from datetime import datetime
+import threading
+import time
 import uuid
 import logging
 
 logger = logging.getLogger("django")
 
+# 포트원 API 호출 제한 시간(초): (연결, 읽기)
+REQUEST_TIMEOUT = (3, 10)
+# 일시적인 오류 시 다시 시도할 최대 횟수와 첫 대기 시간(초, 시도마다 2배)
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+# 다시 시도할 응답 상태 코드 (429는 요청이 처리되지 않았으므로 취소 요청도 다시 시도)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 연결 풀 크기 (한 프로세스에서 동시에 보내는 요청 수만큼 연결을 유지)
+POOL_SIZE = 10
+# 액세스 토큰 만료 전 미리 새로 발급받을 여유 시간(초)
+TOKEN_EXPIRY_MARGIN = 60
+
+
+class PortOneError(Exception):
+    """포트원 API 호출 실패 (통신 오류 또는 오류 응답)"""
+
+    def __init__(self, message, code=None, status=None):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
 
 class PortOneClient:
     """
     포트원(구 아임포트) 결제 서비스 연동 클라이언트
 
     결제 관련 API 호출을 담당하는 클래스입니다.
+    keep-alive 연결 풀을 재사용하고, 액세스 토큰은 만료 전까지 캐시합니다.
+    모든 호출에 제한 시간을 두고, 일시적인 오류는 대기 시간을 늘려 가며 몇 번 다시 시도합니다.
+    API별 호출 시간은 metrics()로 확인할 수 있습니다.
+
+    transport에 requests 전송 어댑터(예: fake_portone.FakePortOneTransport)를 넘기면
+    네트워크 대신 해당 어댑터로 요청을 보냅니다.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        api_url=None,
+        timeout=REQUEST_TIMEOUT,
+        max_retries=MAX_RETRIES,
+        backoff=RETRY_BACKOFF,
+        transport=None,
+    ):
         # 환경 변수에서 API 키와 시크릿 가져오기
         self.api_key = settings.PORTONE_API_KEY
         self.api_secret = settings.PORTONE_API_SECRET
+        self.api_url = (api_url or settings.PORTONE_API_URL).rstrip("/") + "/"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
 
-        # Iamport 객체 초기화
-        self.iamport = Iamport(imp_key=self.api_key, imp_secret=self.api_secret)
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
+        self.session.mount(
+            self.api_url,
+            transport or HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE),
+        )
+
+        self._token = None
+        self._token_expires_at = 0
+        self._token_lock = threading.Lock()
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
 
     def generate_merchant_uid(self):
         """고유한 주문번호 생성
@@ -32,6 +83,136 @@ class PortOneClient:
             f"ORD-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:12].upper()}"
         )
 
+    def metrics(self):
+        """API별 호출 통계
+
+        반환 형식: {이름: {"calls", "errors", "retries", "avg_ms", "max_ms"}}
+        """
+        with self._metrics_lock:
+            return {
+                name: {
+                    "calls": m["calls"],
+                    "errors": m["errors"],
+                    "retries": m["retries"],
+                    "avg_ms": round(m["total"] * 1000 / m["calls"], 1),
+                    "max_ms": round(m["max"] * 1000, 1),
+                }
+                for name, m in self._metrics.items()
+            }
+
+    def _record(self, name, elapsed, attempts, failed):
+        with self._metrics_lock:
+            m = self._metrics.setdefault(
+                name, {"calls": 0, "errors": 0, "retries": 0, "total": 0, "max": 0}
+            )
+            m["calls"] += 1
+            m["errors"] += failed
+            m["retries"] += attempts - 1
+            m["total"] += elapsed
+            m["max"] = max(m["max"], elapsed)
+        logger.info(
+            f"PortOne {name}: {elapsed * 1000:.0f}ms, attempts={attempts}"
+            + (", failed" if failed else "")
+        )
+
+    def _send(self, method, path, idempotent, **kwargs):
+        """요청을 보내고 일시적인 오류는 다시 시도 (requests.Response 반환)
+
+        멱등이 아닌 요청(결제 취소)은 서버에 도달하지 않은 경우(연결 제한 시간 초과, 429)만 다시 시도합니다.
+        """
+        url = f"{self.api_url}{path}"
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except requests.ConnectTimeout as e:
+                error = e
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not idempotent:
+                    raise PortOneError(f"포트원 API 통신 오류: {e}") from e
+                error = e
+            else:
+                retryable = response.status_code in RETRY_STATUSES and (
+                    idempotent or response.status_code == 429
+                )
+                if not retryable or last:
+                    return response, attempt + 1
+                error = f"HTTP {response.status_code}"
+
+            if last:
+                raise PortOneError(f"포트원 API 통신 오류: {error}")
+            logger.warning(f"PortOne {method} {path} retry {attempt + 1}: {error}")
+            time.sleep(self.backoff * 2**attempt)
+
+    def _call(self, name, method, path, idempotent=True, authenticate=True, **kwargs):
+        """포트원 API 호출 후 응답의 response 값 반환 (실패 시 PortOneError)"""
+        started = time.monotonic()
+        attempts = 0
+        try:
+            headers = {}
+            if authenticate:
+                headers["Authorization"] = self._get_token()
+            response, attempts = self._send(
+                method, path, idempotent, headers=headers, **kwargs
+            )
+            if response.status_code == 401 and authenticate:
+                # 토큰이 서버에서 먼저 만료된 경우 새로 발급받아 한 번 더 호출
+                headers["Authorization"] = self._get_token(refresh=True)
+                response, retried = self._send(
+                    method, path, idempotent, headers=headers, **kwargs
+                )
+                attempts += retried
+            result = self._parse(response)
+        except PortOneError:
+            self._record(name, time.monotonic() - started, max(attempts, 1), True)
+            raise
+        self._record(name, time.monotonic() - started, attempts, False)
+        return result
+
+    def _parse(self, response):
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if response.status_code != 200:
+            raise PortOneError(
+                body.get("message") or f"HTTP {response.status_code}",
+                code=body.get("code"),
+                status=response.status_code,
+            )
+        if body.get("code") != 0:
+            raise PortOneError(
+                body.get("message") or "포트원 API 오류",
+                code=body.get("code"),
+                status=response.status_code,
+            )
+        return body.get("response")
+
+    def _get_token(self, refresh=False):
+        """캐시된 액세스 토큰 반환 (없거나 만료가 가까우면 새로 발급)"""
+        with self._token_lock:
+            if refresh or not self._token or time.time() >= self._token_expires_at:
+                result = self._call(
+                    "token",
+                    "POST",
+                    "users/getToken",
+                    authenticate=False,
+                    json={"imp_key": self.api_key, "imp_secret": self.api_secret},
+                )
+                # 서버와 시계가 다를 수 있으므로 남은 유효 시간으로 만료 시각 계산
+                ttl = result["expired_at"] - result["now"]
+                self._token = result["access_token"]
+                self._token_expires_at = time.time() + ttl - TOKEN_EXPIRY_MARGIN
+            return self._token
+
+    def find_payment(self, imp_uid=None, merchant_uid=None):
+        """결제 정보 조회 (merchant_uid가 있으면 주문번호로 조회)"""
+        if merchant_uid:
+            return self._call("find_payment", "GET", f"payments/find/{merchant_uid}")
+        return self._call("find_payment", "GET", f"payments/{imp_uid}")
+
     def verify_payment(self, imp_uid, merchant_uid, amount):
         """
         포트원 결제 검증 메서드
@@ -50,18 +231,24 @@ class PortOneClient:
             )
 
             # 결제 정보 조회
-            payment = self.iamport.find(imp_uid=imp_uid, merchant_uid=merchant_uid)
+            payment = self.find_payment(imp_uid=imp_uid, merchant_uid=merchant_uid)
 
-            # 결제 상태 및 금액 검증
-            if payment["status"] == "paid" and payment["amount"] == amount:
+            # 결제 상태, 금액 및 거래번호 검증
+            # (주문번호로 조회하므로, 클라이언트가 보낸 거래번호가 이 주문의 결제인지 확인)
+            if (
+                payment["status"] == "paid"
+                and payment["amount"] == amount
+                and payment["imp_uid"] == imp_uid
+                and payment["merchant_uid"] == merchant_uid
+            ):
                 logger.info(f"Payment verification successful: {merchant_uid}")
                 return True, payment
             else:
                 logger.warning(
-                    f"Payment verification failed - status or amount mismatch: {payment}"
+                    f"Payment verification failed - status, amount or imp_uid mismatch: {payment}"
                 )
                 return False, "포트원을 통해 검증한 결과, 결제한 내역이 맞지 않습니다."
-        except (Iamport.ResponseError, Iamport.HttpError) as e:
+        except PortOneError as e:
             logger.error(f"Payment verification error: {str(e)}")
             return False, str(e)
 
@@ -77,18 +264,7 @@ class PortOneClient:
         Returns:
         - (bool, dict/str): 성공 여부와 취소 정보 또는 오류 메시지
         """
-        try:
-            if imp_uid:
-                response = self.iamport.cancel(reason, imp_uid=imp_uid)
-            elif merchant_uid:
-                response = self.iamport.cancel(reason, merchant_uid=merchant_uid)
-            else:
-                return False, "imp_uid 또는 merchant_uid가 필요합니다."
-
-            return True, response
-        except (Iamport.ResponseError, Iamport.HttpError) as e:
-            logger.error(str(e), exc_info=e)
-            return False, str(e)
+        return self.refund_payment(reason, imp_uid=imp_uid, merchant_uid=merchant_uid)
 
     def refund_payment(self, reason, imp_uid=None, merchant_uid=None, amount=None):
         """
@@ -118,12 +294,15 @@ class PortOneClient:
             if amount:
                 params["amount"] = amount
 
-            response = self.iamport.cancel(**params)
+            # 같은 취소가 두 번 처리되지 않도록 서버에 도달하지 않은 경우만 다시 시도
+            response = self._call(
+                "cancel", "POST", "payments/cancel", idempotent=False, json=params
+            )
             return True, response
-        except (Iamport.ResponseError, Iamport.HttpError) as e:
+        except PortOneError as e:
             logger.error(str(e), exc_info=e)
             return False, str(e)
 
 
-# 클라이언트 인스턴스 생성
+# 클라이언트 인스턴스 생성 (연결 풀과 토큰을 프로세스 안에서 공유)
 payment_client = PortOneClient()
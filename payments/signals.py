@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# 장바구니 결제를 완료 처리했을 때 발생 (주문 항목/수강 정보를 bulk_create로 만들므로 post_save가 발생하지 않음)
+checkout_completed = Signal()
@@ -0,0 +1,20 @@
+import logging
+
+from jobs.registry import register
+from .checkout import CONFIRM_ORDER_JOB, confirm_order
+from .models import Order
+
+logger = logging.getLogger("django")
+
+
+@register(CONFIRM_ORDER_JOB)
+def confirm_order_job(payload):
+    """포트원 결제 확인 작업 (웹훅 수신 후 주문 확정)"""
+    order = Order.objects.filter(merchant_uid=payload["merchant_uid"]).first()
+    if order is None:
+        # 이 서비스에서 생성하지 않은 주문번호
+        logger.warning(f"Webhook for unknown order: {payload['merchant_uid']}")
+        return
+
+    status = confirm_order(order)
+    logger.info(f"Order {order.merchant_uid} confirmed: {status}")
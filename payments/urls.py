@@ -22,19 +22,21 @@ urlpatterns = [
     path("checkout/", views.CheckoutView.as_view(), name="checkout"),
     # 결제 검증 API - 포트원 결제 검증 및 처리
     path("validate/", views.ValidatePaymentView.as_view(), name="validate_payment"),
+    # 포트원 웹훅 - 결제 상태 변경 알림을 받아 백그라운드 작업으로 주문 확정
+    path("webhook/", views.PortOneWebhookView.as_view(), name="portone_webhook"),
     # 결제 완료 페이지 - 결제 후 성공 화면 표시
     path("complete/", views.PaymentCompleteView.as_view(), name="payment_complete"),
     # 결제 내역 페이지 - 사용자의 모든 결제 기록 조회
     path("history/", views.PaymentHistoryView.as_view(), name="payment_history"),
-    # 결제 상세 페이지 - 개별 결제 건에 대한 상세 정보
+    # 결제 상세 페이지 - 주문별 결제 정보와 구매 과정
     path(
-        "detail/<int:payment_id>/",
+        "detail/<int:order_id>/",
         views.PaymentDetailView.as_view(),
         name="payment_detail",
     ),
-    # 환불 요청 처리 - 결제 취소 및 환불 처리
+    # 환불 요청 처리 - 주문의 과정별 결제 취소 및 환불 처리
     path(
-        "refund/<int:payment_id>/",
+        "refund/<int:order_id>/",
         views.RefundRequestView.as_view(),
         name="refund_request",
     ),
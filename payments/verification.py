@@ -0,0 +1,47 @@
+from django.core.cache import cache
+import logging
+
+from .payment_client import payment_client
+
+logger = logging.getLogger("django")
+
+# 검증에 성공한 결제 정보는 짧게 캐시해, 재시도 요청이 포트원을 다시 호출하지 않도록 함
+# (주문이 생성된 뒤에는 DB의 주문으로 판단하므로 결제 완료 처리 중의 재시도만 다루면 됨)
+VERIFICATION_CACHE_TIMEOUT = 60 * 10
+
+
+def verification_cache_key(imp_uid):
+    return f"payments:verification:{imp_uid}"
+
+
+def _matches(payment, imp_uid, merchant_uid, amount):
+    # 다른 사람의 거래번호를 자기 주문에 연결하지 못하도록 거래번호도 확인
+    return (
+        payment.get("status") == "paid"
+        and payment.get("imp_uid") == imp_uid
+        and payment.get("merchant_uid") == merchant_uid
+        and payment.get("amount") == amount
+    )
+
+
+def verify_payment(imp_uid, merchant_uid, amount):
+    """포트원 결제 검증 (같은 거래번호는 캐시된 검증 결과 사용)
+
+    실패 결과는 일시적인 통신 오류일 수 있으므로 캐시하지 않습니다.
+    반환 형식은 payment_client.verify_payment와 같습니다. ((bool, dict/str))
+    """
+    key = verification_cache_key(imp_uid)
+    payment = cache.get(key)
+    if payment is not None:
+        if _matches(payment, imp_uid, merchant_uid, amount):
+            logger.info(f"Payment verification served from cache: {merchant_uid}")
+            return True, payment
+        logger.warning(
+            f"Payment verification mismatch with cached result: imp_uid={imp_uid}, merchant_uid={merchant_uid}, amount={amount}"
+        )
+        return False, "포트원을 통해 검증한 결과, 결제한 내역이 맞지 않습니다."
+
+    is_valid, result = payment_client.verify_payment(imp_uid, merchant_uid, amount)
+    if is_valid:
+        cache.set(key, result, VERIFICATION_CACHE_TIMEOUT)
+    return is_valid, result
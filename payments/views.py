@@ -3,18 +3,26 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse
 from django.conf import settings
-from django.db import transaction
+from django.db.models import Prefetch
 from django.urls import reverse
-from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import ListView, DetailView, TemplateView
 import json
 import logging
 
 from courses.models import Course
-from learning.models import Enrollment
-from .models import Cart, CartItem, Payment
+from .checkout import (
+    CheckoutError,
+    finalize_checkout,
+    get_or_create_pending_order,
+    mark_payment_attempted,
+    request_order_confirmation,
+)
+from .models import Cart, CartItem, Order, OrderItem
 from .payment_client import payment_client
+from .verification import verify_payment
 
 logger = logging.getLogger("django")
 
@@ -163,7 +171,10 @@ class ClearCartView(LoginRequiredMixin, View):
 
 
 class CheckoutView(LoginRequiredMixin, View):
-    """결제 페이지"""
+    """결제 페이지
+
+    페이지를 열 때는 주문을 만들지 않고, 결제 버튼을 누르면(POST) 결제 대기 주문을 만든 뒤 결제창을 엽니다.
+    """
 
     template_name = "payments/checkout.html"
 
@@ -185,32 +196,61 @@ class CheckoutView(LoginRequiredMixin, View):
         # 장바구니 합계 계산
         total_price = cart.get_total_price()
 
-        # 결제 정보 생성 (포트원 API 호출)
         course_titles = ", ".join([item.course.title for item in cart_items[:3]])
         if len(cart_items) > 3:
             course_titles += f" 외 {len(cart_items) - 3}개"
 
         payment_name = f"{course_titles} - 스킬브릿지"
-        merchant_uid = payment_client.generate_merchant_uid()
-
-        logger.info(
-            f"Checkout initiated: user={request.user.username}, items={cart_items.count()}, total={total_price}, merchant_uid={merchant_uid}"
-        )
 
         context = {
             "cart_items": cart_items,
             "total_price": total_price,
             "payment_name": payment_name,
-            "merchant_uid": merchant_uid,
             "portone_shop_id": settings.PORTONE_SHOP_ID,
             "portone_pg": settings.PORTONE_PG,
         }
 
         return render(request, self.template_name, context)
 
+    def post(self, request):
+        """결제 시작 API (결제 버튼 클릭 시 호출)
+
+        결제할 과정과 금액을 결제 대기 주문으로 저장하고, 결제창에 넘길 주문번호와 금액을 반환합니다.
+        결제창을 닫고 다시 누른 경우 장바구니가 같으면 기존 대기 주문을 그대로 사용합니다.
+        """
+        try:
+            order = get_or_create_pending_order(request.user)
+        except CheckoutError as e:
+            # 결제 페이지를 연 뒤 다른 요청에서 장바구니를 비운 경우
+            return JsonResponse({"success": False, "message": str(e)})
+
+        logger.info(
+            f"Checkout initiated: user={request.user.username}, total={order.total_amount}, merchant_uid={order.merchant_uid}"
+        )
+        return JsonResponse(
+            {
+                "success": True,
+                "merchant_uid": order.merchant_uid,
+                "amount": order.total_amount,
+            }
+        )
+
 
 class ValidatePaymentView(LoginRequiredMixin, View):
-    """결제 검증 API"""
+    """결제 검증 API
+
+    같은 결제로 여러 번 호출되어도(중복 클릭, 재시도) 주문은 한 번만 생성하고 같은 결과를 반환합니다.
+    """
+
+    def success_response(self):
+        return JsonResponse(
+            {
+                "success": True,
+                "message": "결제가 성공적으로 처리되었습니다.",
+                # 결제 완료 페이지 URL
+                "redirect_url": reverse("payments:payment_complete"),
+            }
+        )
 
     def post(self, request):
         try:
@@ -232,74 +272,45 @@ class ValidatePaymentView(LoginRequiredMixin, View):
                 f"Validating payment: imp_uid={imp_uid}, merchant_uid={merchant_uid}, amount={amount}"
             )
 
-            # 결제 검증 (포트원 API 호출)
-            is_valid, result = payment_client.verify_payment(
-                imp_uid, merchant_uid, amount
-            )
-
-            if is_valid:
-                logger.info(f"Payment validation successful: {merchant_uid}")
-                # 결제 성공 처리 로직
-                with transaction.atomic():
-                    # 사용자의 장바구니 가져오기
-                    cart = Cart.objects.get(user=request.user)
-                    cart_items = CartItem.objects.filter(cart=cart).select_related(
-                        "course"
-                    )
-
-                    # 결제 정보 저장
-                    payment_method = result.get("pay_method", "")
-
-                    # 과정별로 결제 내역 생성 및 수강 등록
-                    for cart_item in cart_items:
-                        course = cart_item.course
-
-                        # 결제 내역 생성
-                        payment = Payment.objects.create(
-                            user=request.user,
-                            course=course,
-                            amount=course.price,
-                            payment_method=payment_method,
-                            payment_status="completed",
-                            merchant_uid=merchant_uid,
-                            imp_uid=imp_uid,
-                        )
-                        logger.info(
-                            f"Payment record created: id={payment.id}, user={request.user.username}, course={course.title}"
-                        )
-
-                        # 수강 등록
-                        enrollment, created = Enrollment.objects.get_or_create(
-                            user=request.user,
-                            course=course,
-                            defaults={"status": "enrolled", "progress_percentage": 0},
-                        )
-                        if created:
-                            logger.info(
-                                f"New enrollment created: user={request.user.username}, course={course.title}"
-                            )
-                        else:
-                            logger.info(
-                                f"Existing enrollment found: user={request.user.username}, course={course.title}"
-                            )
-
-                    # 장바구니 비우기
-                    items_count = cart_items.count()
-                    cart_items.delete()
-                    logger.info(
-                        f"Cart cleared for user {request.user.username}: {items_count} items removed"
-                    )
+            order = Order.objects.filter(
+                merchant_uid=merchant_uid, user=request.user
+            ).first()
+            if order is None:
+                logger.warning(
+                    f"Payment validation for unknown order: user={request.user.username}, merchant_uid={merchant_uid}"
+                )
+                return JsonResponse(
+                    {"success": False, "message": "주문 정보를 찾을 수 없습니다."}
+                )
 
-                # 결제 완료 페이지 URL
-                redirect_url = reverse("payments:payment_complete")
+            mark_payment_attempted(Order.objects.filter(id=order.id))
 
+            # 이미 완료 처리된 주문이면(웹훅 처리, 재시도) 포트원을 다시 호출하지 않음
+            if order.status not in Order.UNPAID_STATUSES:
+                if order.status in Order.PAID_STATUSES and order.imp_uid == imp_uid:
+                    logger.info(f"Payment already finalized: {merchant_uid}")
+                    return self.success_response()
+                logger.warning(
+                    f"Payment validation for processed order: user={request.user.username}, imp_uid={imp_uid}, merchant_uid={merchant_uid}, status={order.status}"
+                )
                 return JsonResponse(
-                    {
-                        "success": True,
-                        "message": "결제가 성공적으로 처리되었습니다.",
-                        "redirect_url": redirect_url,
-                    }
+                    {"success": False, "message": "이미 처리된 주문입니다."}
+                )
+
+            # 결제 검증 (포트원 API 호출, 같은 거래번호는 캐시된 결과 사용)
+            # 금액은 브라우저가 보낸 값이 아닌 주문 생성 시 저장한 금액으로 확인
+            is_valid, result = verify_payment(imp_uid, merchant_uid, order.total_amount)
+
+            if is_valid:
+                logger.info(f"Payment validation successful: {merchant_uid}")
+                # 결제 성공 처리 (주문 완료, 수강 등록, 장바구니 비우기)
+                # 요청 값이 아닌 포트원에서 조회한 거래번호를 저장
+                finalize_checkout(
+                    order,
+                    result["imp_uid"],
+                    payment_method=result.get("pay_method", ""),
                 )
+                return self.success_response()
             else:
                 # 결제 검증 실패
                 logger.error(f"Payment validation failed: {result}")
@@ -315,6 +326,44 @@ class ValidatePaymentView(LoginRequiredMixin, View):
             )
 
 
+@method_decorator(csrf_exempt, name="dispatch")
+class PortOneWebhookView(View):
+    """포트원 웹훅 수신 API
+
+    결제 상태가 바뀌면 포트원이 호출합니다. (결제 후 브라우저를 닫아 결제 검증 요청이 오지 않은 경우 등)
+    웹훅 내용은 신뢰하지 않고 주문번호만 사용해, 백그라운드 작업에서 포트원 API로 결제 내역을 다시 조회한 뒤 주문을 확정합니다.
+    """
+
+    def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            data = request.POST
+        if not isinstance(data, dict):
+            data = {}
+        merchant_uid = data.get("merchant_uid")
+        if not merchant_uid:
+            return JsonResponse(
+                {"success": False, "message": "merchant_uid가 필요합니다."}, status=400
+            )
+
+        logger.info(
+            f"PortOne webhook received: imp_uid={data.get('imp_uid')}, merchant_uid={merchant_uid}, status={data.get('status')}"
+        )
+        # 인증 없는 API이므로 확정할 주문이 없는 주문번호는 작업을 등록하지 않음 (작업 테이블이 임의로 쌓이지 않도록)
+        # 포트원이 같은 웹훅을 다시 보내지 않도록 200으로 응답
+        unpaid = Order.objects.filter(
+            merchant_uid=merchant_uid, status__in=Order.UNPAID_STATUSES
+        )
+        if not unpaid.exists():
+            logger.info(f"Webhook ignored, no unpaid order: {merchant_uid}")
+            return JsonResponse({"success": True})
+
+        mark_payment_attempted(unpaid)
+        request_order_confirmation(merchant_uid)
+        return JsonResponse({"success": True})
+
+
 class PaymentCompleteView(LoginRequiredMixin, TemplateView):
     """결제 완료 페이지"""
 
@@ -323,104 +372,109 @@ class PaymentCompleteView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # 최근 결제 내역
-        recent_payments = Payment.objects.filter(
-            user=self.request.user, payment_status="completed"
-        ).order_by("-created_at")[:5]
+        # 최근 주문 내역 (구매 과정은 한 번에 조회)
+        recent_orders = (
+            Order.objects.filter(user=self.request.user, status__in=Order.PAID_STATUSES)
+            .prefetch_related(
+                Prefetch("items", queryset=OrderItem.objects.select_related("course"))
+            )
+            .order_by("-created_at")[:5]
+        )
 
-        context["recent_payments"] = recent_payments
+        context["recent_orders"] = recent_orders
         return context
 
 
 class PaymentHistoryView(LoginRequiredMixin, ListView):
     """결제 내역 페이지
 
-    사용자의 모든 결제 기록을 최신순으로 조회합니다.
+    사용자가 결제한 주문을 최신순으로 조회합니다.
     """
 
-    model = Payment
+    model = Order
     template_name = "payments/payment_history.html"
-    context_object_name = "payments"
+    context_object_name = "orders"
 
     def get_queryset(self):
-        # 사용자의 모든 결제 내역
-        return Payment.objects.filter(user=self.request.user).order_by("-created_at")
+        # 사용자의 주문 (결제하지 않은 결제 대기/실패 주문 제외, 구매 과정은 한 번에 조회)
+        return (
+            Order.objects.filter(user=self.request.user)
+            .exclude(status__in=Order.UNPAID_STATUSES)
+            .prefetch_related(
+                Prefetch("items", queryset=OrderItem.objects.select_related("course"))
+            )
+            .order_by("-created_at")
+        )
 
 
 class PaymentDetailView(LoginRequiredMixin, DetailView):
     """결제 상세 페이지"""
 
-    model = Payment
+    model = Order
     template_name = "payments/payment_detail.html"
-    context_object_name = "payment"
-    pk_url_kwarg = "payment_id"
+    context_object_name = "order"
+    pk_url_kwarg = "order_id"
 
-    def get_object(self, queryset=None):
-        payment_id = self.kwargs.get(self.pk_url_kwarg)
-        return get_object_or_404(Payment, id=payment_id, user=self.request.user)
+    def get_queryset(self):
+        return Order.objects.filter(user=self.request.user)
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["items"] = self.object.items.select_related("course")
+        return context
 
-class RefundRequestView(LoginRequiredMixin, View):
-    """환불 요청 처리"""
 
-    def post(self, request, payment_id):
-        payment = get_object_or_404(Payment, id=payment_id, user=request.user)
+class RefundRequestView(LoginRequiredMixin, View):
+    """환불 요청 처리 (주문의 과정별 환불)"""
+
+    def post(self, request, order_id):
+        order = get_object_or_404(Order, id=order_id, user=request.user)
+        item_id = request.POST.get("item_id", "")
+        item = get_object_or_404(
+            OrderItem.objects.select_related("order"),
+            id=int(item_id) if item_id.isdigit() else None,
+            order=order,
+        )
 
-        # 이미 환불된 경우
-        if payment.payment_status == "refunded":
+        # 이미 환불되었거나 결제 완료 상태가 아닌 경우
+        if not item.is_refundable:
             logger.warning(
-                f"User {request.user.username} attempted to refund already refunded payment: {payment_id}"
+                f"User {request.user.username} attempted to refund non-refundable order item: {item.id}"
             )
-            messages.error(request, "이미 환불된 결제입니다.")
-            return redirect("payments:payment_detail", payment_id=payment.id)
+            messages.error(request, "이미 환불되었거나 환불할 수 없는 결제입니다.")
+            return redirect("payments:payment_detail", order_id=order.id)
 
         refund_reason = request.POST.get("refund_reason", "").strip()
 
         if not refund_reason:
             logger.warning(
-                f"Refund request missing reason: user={request.user.username}, payment={payment_id}"
+                f"Refund request missing reason: user={request.user.username}, order={order_id}"
             )
             messages.error(request, "환불 사유를 입력해주세요.")
-            return redirect("payments:payment_detail", payment_id=payment.id)
+            return redirect("payments:payment_detail", order_id=order.id)
 
         try:
             logger.info(
-                f"Processing refund: payment={payment_id}, user={request.user.username}, amount={payment.amount}, reason={refund_reason}"
+                f"Processing refund: order={order_id}, item={item.id}, user={request.user.username}, amount={item.amount}, reason={refund_reason}"
+            )
+            # 포트원 API 호출하여 해당 과정 금액만 부분 환불
+            is_successful, result = payment_client.refund_payment(
+                reason=refund_reason,
+                imp_uid=order.imp_uid,
+                merchant_uid=order.merchant_uid,
+                amount=item.amount,
             )
-            with transaction.atomic():
-                # 부분 환불 금액 계산
-                refund_amount = payment.amount
-
-                # 포트원 API 호출하여 환불 처리
-                is_successful, result = payment_client.refund_payment(
-                    reason=refund_reason,
-                    imp_uid=payment.imp_uid,
-                    merchant_uid=payment.merchant_uid,
-                    amount=refund_amount,
-                )
-
-                if is_successful:
-                    # 환불 성공 시 결제 정보 업데이트
-                    payment.refund_reason = refund_reason
-                    payment.payment_status = "refunded"
-                    payment.updated_at = timezone.now()
-                    payment.save()
-
-                    # 수강 등록 정보도 삭제
-                    Enrollment.objects.filter(
-                        user=request.user, course=payment.course
-                    ).delete()
 
-                    messages.success(request, "환불이 성공적으로 처리되었습니다.")
-                else:
-                    messages.error(
-                        request, f"환불 처리 중 오류가 발생했습니다: {result}"
-                    )
-                    return redirect("payments:payment_detail", payment_id=payment.id)
+            if not is_successful:
+                messages.error(request, f"환불 처리 중 오류가 발생했습니다: {result}")
+                return redirect("payments:payment_detail", order_id=order.id)
 
-                return redirect("payments:payment_history")
+            # 환불 성공 시 주문 정보 갱신 및 수강 정보 삭제
+            item.mark_refunded(refund_reason)
+            messages.success(request, "환불이 성공적으로 처리되었습니다.")
+            return redirect("payments:payment_history")
 
         except Exception as e:
             logger.exception("환불 처리 중 오류 발생")
             messages.error(request, f"환불 처리 중 오류가 발생했습니다: {str(e)}")
-            return redirect("payments:payment_detail", payment_id=payment.id)
+            return redirect("payments:payment_detail", order_id=order.id)
@@ -0,0 +1,216 @@
+/*
+ * 분할 업로드 클라이언트 (uploads 앱의 tus 방식 엔드포인트 사용)
+ *
+ * 파일을 조각으로 나눠 보내고, 연결이 끊기면 서버에 저장된 위치부터 다시 보냅니다.
+ * 업로드 주소는 localStorage에 저장하므로 페이지를 새로 열어도 같은 파일은 이어서 올립니다.
+ * 마지막 조각을 보낸 뒤에는 서버가 파일 전체를 검증할 때까지(Upload-Status: complete) 기다립니다.
+ * 업로드가 끝나면 "<파일 필드 이름>_upload" hidden 값으로 업로드 ID를 넣고 폼을 제출합니다.
+ *
+ * 사용법: ResumableUpload.attach(fileInput, { purpose: 'project_file', endpoint: '/uploads/' });
+ */
+(function () {
+    const CHUNK_SIZE = 5 * 1024 * 1024;  // 서버의 RESUMABLE_UPLOAD_CHUNK_SIZE보다 작게
+    const MAX_RETRIES = 5;
+    const VERIFY_POLL_INTERVAL = 1000;
+
+    function encodeMetadata(metadata) {
+        return Object.entries(metadata).map(([key, value]) => {
+            const bytes = new TextEncoder().encode(value);
+            return `${key} ${btoa(String.fromCharCode(...bytes))}`;
+        }).join(',');
+    }
+
+    async function chunkChecksum(blob) {
+        // crypto.subtle은 HTTPS(또는 localhost)에서만 사용 가능
+        if (!window.crypto || !window.crypto.subtle) {
+            return null;
+        }
+        const digest = await crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+        return `sha256 ${btoa(String.fromCharCode(...new Uint8Array(digest)))}`;
+    }
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    class Uploader {
+        constructor(file, options) {
+            this.file = file;
+            this.purpose = options.purpose;
+            this.endpoint = options.endpoint;
+            this.csrfToken = options.csrfToken;
+            this.onProgress = options.onProgress || function () {};
+            this.onVerify = options.onVerify || function () {};
+            this.storageKey = `resumable-upload:${this.purpose}:${file.name}:${file.size}:${file.lastModified}`;
+        }
+
+        headers(extra) {
+            return Object.assign({ 'Tus-Resumable': '1.0.0', 'X-CSRFToken': this.csrfToken }, extra);
+        }
+
+        async fetchOffset(url) {
+            const response = await fetch(url, { method: 'HEAD', headers: this.headers() });
+            if (!response.ok) {
+                return null;
+            }
+            return parseInt(response.headers.get('Upload-Offset'), 10);
+        }
+
+        async waitForVerification(url) {
+            // 파일 전체 검증은 서버의 백그라운드 작업에서 처리
+            for (;;) {
+                const response = await fetch(url, { method: 'HEAD', headers: this.headers() });
+                if (!response.ok) {
+                    throw new Error('업로드 정보를 찾을 수 없습니다.');
+                }
+                const status = response.headers.get('Upload-Status');
+                if (status === 'complete') {
+                    return;
+                }
+                if (status !== 'verifying') {
+                    // 체크섬이 맞지 않아 서버가 받은 내용을 버린 경우
+                    localStorage.removeItem(this.storageKey);
+                    throw new Error('업로드한 파일 검증에 실패했습니다.');
+                }
+                await sleep(VERIFY_POLL_INTERVAL);
+            }
+        }
+
+        async createOrResume() {
+            const savedUrl = localStorage.getItem(this.storageKey);
+            if (savedUrl) {
+                const offset = await this.fetchOffset(savedUrl);
+                if (offset !== null) {
+                    return { url: savedUrl, offset: offset };
+                }
+                localStorage.removeItem(this.storageKey);
+            }
+
+            const response = await fetch(this.endpoint, {
+                method: 'POST',
+                headers: this.headers({
+                    'Upload-Length': String(this.file.size),
+                    'Upload-Metadata': encodeMetadata({ filename: this.file.name, purpose: this.purpose }),
+                }),
+            });
+            if (!response.ok) {
+                throw new Error(await response.text() || '업로드를 시작하지 못했습니다.');
+            }
+            const url = response.headers.get('Location');
+            localStorage.setItem(this.storageKey, url);
+            return { url: url, offset: 0 };
+        }
+
+        async sendChunk(url, offset) {
+            const chunk = this.file.slice(offset, offset + CHUNK_SIZE);
+            const headers = this.headers({
+                'Content-Type': 'application/offset+octet-stream',
+                'Upload-Offset': String(offset),
+            });
+            const checksum = await chunkChecksum(chunk);
+            if (checksum) {
+                headers['Upload-Checksum'] = checksum;
+            }
+
+            const response = await fetch(url, { method: 'PATCH', headers: headers, body: chunk });
+            if (response.status === 204) {
+                return parseInt(response.headers.get('Upload-Offset'), 10);
+            }
+            if (response.status === 409 || response.status === 460) {
+                // 위치가 어긋났거나 조각이 손상된 경우 서버 위치부터 다시 보냄
+                return this.fetchOffset(url);
+            }
+            if (response.status >= 500) {
+                throw new TypeError(`서버 오류 (${response.status})`);
+            }
+            throw new Error(await response.text() || '업로드에 실패했습니다.');
+        }
+
+        async start() {
+            let { url, offset } = await this.createOrResume();
+            let retries = 0;
+            this.onProgress(offset, this.file.size);
+
+            while (offset < this.file.size) {
+                try {
+                    const next = await this.sendChunk(url, offset);
+                    if (next === null) {
+                        throw new Error('업로드 정보를 찾을 수 없습니다.');
+                    }
+                    offset = next;
+                    retries = 0;
+                    this.onProgress(offset, this.file.size);
+                } catch (error) {
+                    // 네트워크 오류(TypeError)만 간격을 늘려가며 재시도
+                    if (!(error instanceof TypeError) || retries >= MAX_RETRIES) {
+                        throw error;
+                    }
+                    retries += 1;
+                    await sleep(1000 * 2 ** (retries - 1));
+                    const serverOffset = await this.fetchOffset(url).catch(() => null);
+                    if (serverOffset !== null) {
+                        offset = serverOffset;
+                    }
+                }
+            }
+
+            this.onVerify();
+            await this.waitForVerification(url);
+            localStorage.removeItem(this.storageKey);
+            return url.split('/').filter(Boolean).pop();
+        }
+    }
+
+    function attach(input, options) {
+        const form = input.form;
+        const progress = document.createElement('p');
+        progress.className = 'mt-1 text-sm text-gray-600 hidden';
+        input.insertAdjacentElement('afterend', progress);
+
+        let uploading = false;
+        form.addEventListener('submit', async function (e) {
+            // 다른 검증에서 제출을 막았거나, 선택한 파일이 없거나, 숨겨진 입력이면 그대로 진행
+            if (e.defaultPrevented || uploading || !input.files.length || input.offsetParent === null) {
+                return;
+            }
+            e.preventDefault();
+            uploading = true;
+
+            const buttons = form.querySelectorAll('button[type="submit"]');
+            buttons.forEach(button => { button.disabled = true; });
+            progress.classList.remove('hidden', 'text-red-600');
+
+            try {
+                const uploader = new Uploader(input.files[0], {
+                    purpose: options.purpose,
+                    endpoint: options.endpoint,
+                    csrfToken: form.querySelector('[name="csrfmiddlewaretoken"]').value,
+                    onProgress: function (offset, size) {
+                        progress.textContent = `업로드 중... ${Math.floor(offset / size * 100)}%`;
+                    },
+                    onVerify: function () {
+                        progress.textContent = '업로드한 파일을 확인하는 중...';
+                    },
+                });
+                const uploadId = await uploader.start();
+
+                const hidden = document.createElement('input');
+                hidden.type = 'hidden';
+                hidden.name = `${input.name}_upload`;
+                hidden.value = uploadId;
+                form.appendChild(hidden);
+                // 파일은 이미 올렸으므로 폼에는 업로드 ID만 보냄
+                input.value = '';
+                progress.textContent = '업로드 완료. 저장하는 중...';
+                form.submit();
+            } catch (error) {
+                progress.classList.add('text-red-600');
+                progress.textContent = `${error.message} 다시 제출하면 이어서 업로드합니다.`;
+                buttons.forEach(button => { button.disabled = false; });
+                uploading = false;
+            }
+        });
+    }
+
+    window.ResumableUpload = { attach: attach, Uploader: Uploader };
+})();
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from .models import Upload
+
+
+@admin.register(Upload)
+class UploadAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "user",
+        "purpose",
+        "filename",
+        "offset",
+        "size",
+        "status",
+        "updated_at",
+    )
+    list_filter = ("purpose", "status")
+    search_fields = ("filename", "user__username")
+    readonly_fields = ("created_at", "updated_at")
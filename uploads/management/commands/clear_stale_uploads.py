@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from uploads.models import Upload
+
+
+class Command(BaseCommand):
+    help = "오래 갱신되지 않은 분할 업로드(중단되었거나 폼 제출이 안 된 업로드)와 파일을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=settings.RESUMABLE_UPLOAD_EXPIRE_HOURS,
+            help=f"이 시간 이상 갱신되지 않은 업로드 삭제 (기본 {settings.RESUMABLE_UPLOAD_EXPIRE_HOURS}시간)",
+        )
+
+    def handle(self, *args, **options):
+        count = Upload.clear_stale(options["hours"])
+        self.stdout.write(self.style.SUCCESS(f"분할 업로드 {count}건을 삭제했습니다."))
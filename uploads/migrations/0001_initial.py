@@ -0,0 +1,81 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:01
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Upload",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "purpose",
+                    models.CharField(
+                        choices=[
+                            ("lecture_video", "강의 동영상"),
+                            ("project_file", "프로젝트 파일"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("filename", models.CharField(max_length=255)),
+                ("size", models.BigIntegerField(help_text="전체 파일 크기(바이트)")),
+                (
+                    "offset",
+                    models.BigIntegerField(
+                        default=0, help_text="지금까지 받은 크기(바이트)"
+                    ),
+                ),
+                (
+                    "checksum",
+                    models.CharField(
+                        blank=True,
+                        help_text="파일 전체의 SHA-256 (업로드 생성 시 클라이언트가 보낸 값, 완료 후 서버에서 계산한 값)",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("uploading", "업로드 중"), ("complete", "완료")],
+                        db_index=True,
+                        default="uploading",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="uploads",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "분할 업로드",
+                "verbose_name_plural": "분할 업로드 목록",
+            },
+        ),
+    ]
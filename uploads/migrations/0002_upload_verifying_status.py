@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="upload",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("uploading", "업로드 중"),
+                    ("verifying", "검증 중"),
+                    ("complete", "완료"),
+                ],
+                db_index=True,
+                default="uploading",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+import uuid
+
+from .models import Upload
+
+
+class ResumableUploadMixin:
+    """분할 업로드한 파일을 폼의 파일 필드 값으로 사용하는 폼 뷰 Mixin
+
+    resumable_upload_fields에 {"파일 필드 이름": "업로드 용도"}를 지정하면,
+    파일 대신 "<파일 필드 이름>_upload"로 완료된 업로드 ID를 받아 폼에 파일로 넘깁니다.
+    파일 크기/형식 등은 일반 업로드와 같이 폼에서 검증하며,
+    저장이 끝난 업로드 기록은 discard_resumable_uploads()로 정리합니다.
+    """
+
+    resumable_upload_fields = {}
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        self.resumable_uploads = []
+        self.resumable_upload_errors = {}
+        if self.request.method != "POST":
+            return kwargs
+
+        files = None
+        for field, purpose in self.resumable_upload_fields.items():
+            upload_id = self.request.POST.get(f"{field}_upload")
+            if not upload_id:
+                continue
+            upload = self._get_completed_upload(upload_id, purpose)
+            if upload is None:
+                self.resumable_upload_errors[field] = (
+                    "업로드한 파일을 찾을 수 없습니다. 다시 업로드해주세요."
+                )
+                continue
+
+            if files is None:
+                files = kwargs["files"].copy()
+            file = upload.as_uploaded_file()
+            files[field] = file
+            self.resumable_uploads.append((upload, file))
+
+        if files is not None:
+            kwargs["files"] = files
+        return kwargs
+
+    def _get_completed_upload(self, upload_id, purpose):
+        try:
+            uuid.UUID(upload_id)
+        except ValueError:
+            return None
+        return Upload.objects.filter(
+            id=upload_id,
+            user=self.request.user,
+            purpose=purpose,
+            status="complete",
+        ).first()
+
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        if form.is_bound and self.resumable_upload_errors:
+            # 폼 검증을 먼저 수행한 뒤 업로드 오류를 추가 (이후 is_valid()는 결과를 재사용)
+            form.full_clean()
+            for field, error in self.resumable_upload_errors.items():
+                form.add_error(field, error)
+        return form
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        self.discard_resumable_uploads()
+        return response
+
+    def form_invalid(self, form):
+        self.discard_resumable_uploads(delete=False)
+        return super().form_invalid(form)
+
+    def discard_resumable_uploads(self, delete=True):
+        """폼에 넘긴 업로드 파일을 닫고, delete이면 업로드 기록도 삭제
+
+        파일이 저장 위치로 옮겨진 뒤 호출해야 합니다.
+        """
+        for upload, file in self.resumable_uploads:
+            file.close()
+            if delete:
+                upload.delete()
+        self.resumable_uploads = []
@@ -0,0 +1,210 @@
+from datetime import timedelta
+import hashlib
+import logging
+import os
+import uuid
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models, transaction
+from django.http import UnreadablePostError
+from django.utils import timezone
+
+from jobs.models import Job
+
+logger = logging.getLogger("django")
+
+# 업로드 완료 후 파일 전체 체크섬 검증 작업 이름
+VERIFY_UPLOAD_JOB = "uploads.verify_upload"
+
+
+class AssembledUploadedFile(UploadedFile):
+    """업로드가 끝난 파일을 폼/FileField에 넘기기 위한 파일 객체
+
+    TemporaryUploadedFile처럼 temporary_file_path()를 제공하므로,
+    FileSystemStorage는 파일을 복사하지 않고 저장 위치로 옮깁니다.
+    """
+
+    def __init__(self, path, name, size):
+        super().__init__(open(path, "rb"), name, None, size, None, None)
+        self._path = path
+
+    def temporary_file_path(self):
+        return self._path
+
+
+class Upload(models.Model):
+    """이어 올리기가 가능한 분할 업로드 모델
+
+    tus 프로토콜과 같은 방식으로, 클라이언트는 전체 크기를 알려 업로드를 만든 뒤
+    현재 위치(offset)부터 조각을 순서대로 보냅니다.
+    조각은 RESUMABLE_UPLOAD_DIR의 파일에 바로 이어 쓰므로 요청마다 작업자가 오래 묶이지 않고,
+    연결이 끊겨도 서버에 저장된 위치부터 다시 보낼 수 있습니다.
+    마지막 조각을 받으면 검증 중 상태가 되고, 파일 전체의 체크섬은 백그라운드 작업에서 계산합니다.
+    """
+
+    PURPOSE_CHOICES = [
+        ("lecture_video", "강의 동영상"),
+        ("project_file", "프로젝트 파일"),
+    ]
+    # 용도별 최대 파일 크기 (세부 검증은 파일을 붙이는 폼에서 다시 수행)
+    MAX_SIZES = {
+        "lecture_video": 2 * 1024 * 1024 * 1024,
+        "project_file": 10 * 1024 * 1024,
+    }
+    # 관리자만 업로드할 수 있는 용도
+    ADMIN_PURPOSES = ["lecture_video"]
+
+    STATUS_CHOICES = [
+        ("uploading", "업로드 중"),
+        ("verifying", "검증 중"),
+        ("complete", "완료"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="uploads"
+    )
+    purpose = models.CharField(max_length=30, choices=PURPOSE_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField(help_text="전체 파일 크기(바이트)")
+    offset = models.BigIntegerField(default=0, help_text="지금까지 받은 크기(바이트)")
+    checksum = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="파일 전체의 SHA-256 (업로드 생성 시 클라이언트가 보낸 값, 완료 후 서버에서 계산한 값)",
+    )
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="uploading", db_index=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name = "분할 업로드"
+        verbose_name_plural = "분할 업로드 목록"
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+    @property
+    def path(self):
+        """조각을 이어 쓰는 파일 경로"""
+        return os.path.join(settings.RESUMABLE_UPLOAD_DIR, f"{self.id}.part")
+
+    @property
+    def is_complete(self):
+        return self.status == "complete"
+
+    def append_chunk(self, chunks, expected_digest=None):
+        """현재 위치에 조각을 이어 쓰고 받은 크기를 반환
+
+        expected_digest(SHA-256 bytes)를 주면 조각 전체를 받은 뒤 검증하고,
+        다르거나 전체 크기를 넘으면 쓴 내용을 되돌린 뒤 ValueError를 냅니다.
+        검증값이 없으면 연결이 끊겨 일부만 받은 조각도 저장합니다.
+        """
+        os.makedirs(settings.RESUMABLE_UPLOAD_DIR, exist_ok=True)
+        digest = hashlib.sha256()
+        written = 0
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as f:
+            # 이전 요청이 검증 실패 등으로 끝난 경우를 대비해 저장된 위치부터 씀
+            f.truncate(self.offset)
+            f.seek(self.offset)
+            try:
+                for chunk in chunks:
+                    if self.offset + written + len(chunk) > self.size:
+                        raise ValueError("전체 파일 크기를 넘는 조각입니다.")
+                    f.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+                if expected_digest is not None and digest.digest() != expected_digest:
+                    raise ValueError("조각의 체크섬이 일치하지 않습니다.")
+            except UnreadablePostError:
+                # 연결이 끊겨 일부만 받은 경우, 검증할 체크섬이 없으면 받은 만큼 저장 (이어 올리기)
+                if expected_digest is not None:
+                    f.truncate(self.offset)
+                    raise ValueError("조각을 끝까지 받지 못했습니다.")
+                logger.warning(f"Upload {self.id} interrupted after {written} bytes")
+            except ValueError:
+                f.truncate(self.offset)
+                raise
+
+        self.offset += written
+        update_fields = ["offset", "updated_at"]
+        if self.offset == self.size:
+            # 파일 전체(최대 2GB)를 다시 읽는 검증은 요청 밖에서 처리
+            self.status = "verifying"
+            update_fields.append("status")
+            Job.enqueue_on_commit(
+                VERIFY_UPLOAD_JOB,
+                {"upload_id": str(self.id)},
+                dedupe_key=f"{VERIFY_UPLOAD_JOB}:{self.id}",
+            )
+        self.save(update_fields=update_fields)
+        return written
+
+    def verify(self):
+        """모든 조각을 받은 업로드의 파일 전체 체크섬을 검증하고 완료 상태로 변경
+
+        백그라운드 작업에서 호출하며, 파일을 읽는 동안에는 행을 잠그지 않습니다.
+        클라이언트가 보낸 체크섬과 다르면 받은 내용을 버리고 처음부터 다시 받도록
+        위치를 되돌립니다. 완료 처리했으면 True를 반환합니다.
+        """
+        digest = hashlib.sha256()
+        try:
+            with open(self.path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            # 검증 전에 업로드가 취소되어 파일이 삭제된 경우
+            return False
+        checksum = digest.hexdigest()
+
+        with transaction.atomic():
+            upload = (
+                Upload.objects.select_for_update()
+                .filter(id=self.id, status="verifying")
+                .first()
+            )
+            if upload is None:
+                # 검증 중에 업로드가 취소된 경우
+                return False
+
+            if upload.checksum and upload.checksum.lower() != checksum:
+                os.remove(upload.path)
+                upload.offset = 0
+                upload.status = "uploading"
+                upload.save(update_fields=["offset", "status", "updated_at"])
+                logger.warning(f"Upload {upload.id} checksum mismatch, reset")
+                return False
+
+            upload.checksum = checksum
+            upload.status = "complete"
+            upload.save(update_fields=["checksum", "status", "updated_at"])
+        return True
+
+    def as_uploaded_file(self):
+        """완료된 업로드를 폼에 넘길 수 있는 파일 객체로 변환"""
+        return AssembledUploadedFile(self.path, self.filename, self.size)
+
+    def delete(self, *args, **kwargs):
+        # 파일이 저장 위치로 옮겨졌으면 남은 파일이 없음
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        return super().delete(*args, **kwargs)
+
+    @classmethod
+    def clear_stale(cls, hours=None):
+        """오래 갱신되지 않은 업로드(중단 또는 폼 제출 안 함)와 파일 삭제"""
+        hours = hours or settings.RESUMABLE_UPLOAD_EXPIRE_HOURS
+        stale = cls.objects.filter(
+            updated_at__lt=timezone.now() - timedelta(hours=hours)
+        )
+        count = 0
+        for upload in stale.iterator():
+            upload.delete()
+            count += 1
+        return count
@@ -0,0 +1,18 @@
+import logging
+
+from jobs.registry import register
+from .models import VERIFY_UPLOAD_JOB, Upload
+
+logger = logging.getLogger("django")
+
+
+@register(VERIFY_UPLOAD_JOB)
+def verify_upload_job(payload):
+    """분할 업로드 완료 후 파일 전체 체크섬 검증 작업"""
+    upload = Upload.objects.filter(id=payload["upload_id"], status="verifying").first()
+    if upload is None:
+        # 작업 등록 후 업로드가 취소되었거나 이미 검증된 경우
+        return
+
+    if upload.verify():
+        logger.info(f"Verified upload {upload.id} ({upload.size} bytes)")
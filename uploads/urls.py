@@ -0,0 +1,11 @@
+from django.urls import path
+from . import views
+
+app_name = "uploads"
+
+urlpatterns = [
+    # 분할 업로드 생성
+    path("", views.UploadCreateView.as_view(), name="create"),
+    # 분할 업로드 조회/조각 전송/취소
+    path("<uuid:upload_id>/", views.UploadDetailView.as_view(), name="detail"),
+]
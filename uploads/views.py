@@ -0,0 +1,177 @@
+import base64
+import binascii
+import os
+import re
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views import View
+
+from .models import Upload
+
+# 지원하는 tus 프로토콜 버전 (핵심 기능 + creation, checksum(sha256), termination)
+TUS_VERSION = "1.0.0"
+# 조각 요청 본문을 읽는 단위
+READ_SIZE = 64 * 1024
+SHA256_HEX_RE = re.compile(r"^[0-9a-fA-F]{64}$")
+
+
+def tus_response(status=204, upload=None, message=""):
+    """tus 공통 헤더를 붙인 응답"""
+    response = HttpResponse(
+        message, status=status, content_type="text/plain; charset=utf-8"
+    )
+    if status == 460:
+        response.reason_phrase = "Checksum Mismatch"
+    response["Tus-Resumable"] = TUS_VERSION
+    response["Cache-Control"] = "no-store"
+    if upload is not None:
+        response["Upload-Offset"] = str(upload.offset)
+        response["Upload-Length"] = str(upload.size)
+        # tus 확장 헤더: 마지막 조각 이후 검증 중(verifying)이면 완료(complete)될 때까지 HEAD로 확인
+        response["Upload-Status"] = upload.status
+    return response
+
+
+def parse_metadata(header):
+    """Upload-Metadata 헤더("키 base64값,키 base64값")를 dict로 변환"""
+    metadata = {}
+    for pair in filter(None, (item.strip() for item in header.split(","))):
+        key, _, value = pair.partition(" ")
+        try:
+            metadata[key] = base64.b64decode(value, validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            raise ValueError(f"잘못된 메타데이터 값: {key}")
+    return metadata
+
+
+def parse_checksum(header):
+    """Upload-Checksum 헤더("sha256 base64값")를 digest bytes로 변환 (없으면 None)"""
+    if not header:
+        return None
+    algorithm, _, value = header.partition(" ")
+    if algorithm.lower() != "sha256":
+        raise ValueError("지원하지 않는 체크섬 알고리즘입니다. (sha256만 지원)")
+    try:
+        return base64.b64decode(value, validate=True)
+    except binascii.Error:
+        raise ValueError("잘못된 체크섬 값입니다.")
+
+
+def read_body(request, length):
+    """요청 본문을 메모리에 모두 올리지 않고 조금씩 읽음"""
+    while length > 0:
+        chunk = request.read(min(READ_SIZE, length))
+        if not chunk:
+            break
+        length -= len(chunk)
+        yield chunk
+
+
+class UploadCreateView(LoginRequiredMixin, View):
+    """분할 업로드 생성
+
+    Upload-Length(전체 크기)와 Upload-Metadata(filename, purpose, 선택: checksum)를 받아
+    업로드를 만들고 Location 헤더로 조각을 보낼 주소를 알려줍니다.
+    """
+
+    def post(self, request):
+        try:
+            size = int(request.headers["Upload-Length"])
+            metadata = parse_metadata(request.headers.get("Upload-Metadata", ""))
+        except (KeyError, ValueError):
+            return tus_response(
+                400, message="Upload-Length 또는 Upload-Metadata가 올바르지 않습니다."
+            )
+
+        purpose = metadata.get("purpose")
+        if purpose not in dict(Upload.PURPOSE_CHOICES):
+            return tus_response(400, message="알 수 없는 업로드 용도입니다.")
+        if purpose in Upload.ADMIN_PURPOSES and not request.user.is_admin:
+            return tus_response(403, message="권한이 없습니다.")
+
+        filename = os.path.basename(metadata.get("filename", "").replace("\\", "/"))
+        if not filename.strip():
+            return tus_response(400, message="파일 이름이 없습니다.")
+        if size <= 0:
+            return tus_response(400, message="빈 파일은 업로드할 수 없습니다.")
+        if size > Upload.MAX_SIZES[purpose]:
+            return tus_response(
+                413,
+                message=f"파일 크기는 {Upload.MAX_SIZES[purpose] // (1024 * 1024)}MB를 초과할 수 없습니다.",
+            )
+
+        checksum = metadata.get("checksum", "")
+        if checksum and not SHA256_HEX_RE.match(checksum):
+            return tus_response(
+                400, message="checksum은 SHA-256 16진수 값이어야 합니다."
+            )
+
+        upload = Upload.objects.create(
+            user=request.user,
+            purpose=purpose,
+            filename=filename[-255:],
+            size=size,
+            checksum=checksum.lower(),
+        )
+        response = tus_response(201, upload)
+        response["Location"] = reverse("uploads:detail", args=[upload.id])
+        return response
+
+
+class UploadDetailView(LoginRequiredMixin, View):
+    """분할 업로드 조회(HEAD)/조각 전송(PATCH)/취소(DELETE)"""
+
+    def get_queryset(self):
+        return Upload.objects.filter(user=self.request.user)
+
+    def head(self, request, upload_id):
+        """현재까지 받은 위치와 상태 조회 (이어 올리기 전, 검증 완료 확인 시 호출)"""
+        upload = get_object_or_404(self.get_queryset(), id=upload_id)
+        return tus_response(200, upload)
+
+    def patch(self, request, upload_id):
+        """Upload-Offset 위치부터 조각 이어 쓰기"""
+        if request.content_type != "application/offset+octet-stream":
+            return tus_response(
+                415,
+                message="Content-Type은 application/offset+octet-stream이어야 합니다.",
+            )
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.headers["Content-Length"])
+            expected_digest = parse_checksum(request.headers.get("Upload-Checksum"))
+        except (KeyError, ValueError) as e:
+            return tus_response(400, message=str(e))
+        if length > settings.RESUMABLE_UPLOAD_CHUNK_SIZE:
+            return tus_response(
+                413,
+                message=f"조각 크기는 {settings.RESUMABLE_UPLOAD_CHUNK_SIZE}바이트를 초과할 수 없습니다.",
+            )
+
+        # 같은 업로드에 조각이 동시에 들어와도 순서대로 처리
+        with transaction.atomic():
+            upload = get_object_or_404(
+                self.get_queryset().select_for_update(), id=upload_id
+            )
+            if upload.status != "uploading" or offset != upload.offset:
+                return tus_response(409, upload, "업로드 위치가 일치하지 않습니다.")
+            if offset + length > upload.size:
+                return tus_response(400, upload, "전체 파일 크기를 넘는 조각입니다.")
+            try:
+                upload.append_chunk(read_body(request, length), expected_digest)
+            except ValueError as e:
+                # tus checksum 확장의 체크섬 불일치 상태 코드
+                return tus_response(460, upload, str(e))
+
+        return tus_response(204, upload)
+
+    def delete(self, request, upload_id):
+        """업로드 취소 (받은 파일 삭제)"""
+        upload = get_object_or_404(self.get_queryset(), id=upload_id)
+        upload.delete()
+        return tus_response(204)